@@ -1,6 +1,10 @@
 import argparse
+import contextlib
+import csv
+import json
 import sys
 from football_client.api_client import World
+from football_client.paginator import Paginator
 
 
 def extract_id(value):
@@ -24,7 +28,7 @@ def sanity_check(args):
     """
     if args.entity in ['league', 'country'] and (args.season or args.league_id):
         print("Warning: --season argument and --league-id is not required for getting global details. Ignoring")
-    elif args.entity in ['team', 'player'] and (not args.league_id or not args.season):
+    elif args.entity in ['team', 'player', 'teams', 'players'] and (not args.league_id or not args.season):
         print("Error: --league-id and --season are required for getting team or player details")
         sys.exit(1)
 
@@ -34,18 +38,30 @@ class FootballClientApp:
     CLI for Football API
     """
 
-    def __init__(self, action, entity, serializer):
+    def __init__(self, action, entity, serializer, daemon=None):
         self.get_dispatch = {
             'countries': self.all_countries,
             'league': self.get_league,
             'leagues': self.all_leagues,
             'team': self.get_team,
+            'teams': self.all_teams,
             'player': self.get_player,
-
+            'players': self.all_players,
         }
         self.action = action
         self.entity = entity
         self.serializer = serializer
+        self.daemon = daemon
+
+    def league_resolver(self):
+        """
+        Resolve leagues through a running daemon if given, in-process otherwise
+        :return: World or DaemonClient, both offer find_league()
+        """
+        if self.daemon:
+            from football_client.daemon import DaemonClient
+            return DaemonClient(self.daemon)
+        return World.shared(serializer=self.serializer)
 
     def search(self, **kwargs):
         """
@@ -55,14 +71,14 @@ class FootballClientApp:
 
     def all_leagues(self):
         print(f"Getting leagues information")
-        world_leagues = World(serializer=self.serializer)
+        world_leagues = World.shared(serializer=self.serializer)
         result = world_leagues.all_leagues()
         # world_leagues.serialize(entity='leagues', data=result)
         return result
 
     def all_countries(self):
         print(f"Getting countries information")
-        world_leagues = World(serializer=self.serializer)
+        world_leagues = World.shared(serializer=self.serializer)
         result = world_leagues.all_countries()
         world_leagues.serialize(entity='countries', data=result)
         return result
@@ -70,28 +86,83 @@ class FootballClientApp:
     def get_league(self, identifier):
         print(f"Getting league information for {identifier}")
         entity_id, entity_name = extract_id(identifier)
-        world_leagues = World(serializer=self.serializer)
+        if self.daemon:
+            return self.league_resolver().find_league(league_id=entity_id, league_name=entity_name)
+        world_leagues = World.shared(serializer=self.serializer)
         result = world_leagues.get_league(league_id=entity_id, league_name=entity_name)
         # world_leagues.serialize(entity='league', data=result)
         return result
 
+    def batch_leagues(self, lines, output, output_format="jsonl"):
+        """
+        Resolve league identifiers in one process, streaming one result per identifier
+        :param lines: iterable of identifiers (IDs or names), one per line, blank lines are skipped
+        :param output: text stream for the results
+        :param output_format: jsonl - {"identifier": ..., "league": record or null}
+                              tsv - identifier, ID, name, type, country, empty fields for unknown leagues
+        :return: (resolved, total) counts
+        """
+        world_leagues = self.league_resolver()
+        writer = csv.writer(output, delimiter="\t", lineterminator="\n") if output_format == "tsv" else None
+        if writer:
+            writer.writerow(["Identifier", "ID", "Name", "Type", "Country"])
+        resolved = total = 0
+        for line in lines:
+            identifier = line.strip()
+            if not identifier:
+                continue
+            entity_id, entity_name = extract_id(identifier)
+            league = world_leagues.find_league(league_id=entity_id, league_name=entity_name)
+            total += 1
+            resolved += bool(league)
+            if writer:
+                writer.writerow([identifier, league["league"]["id"], league["league"]["name"],
+                                 league["league"]["type"], league["country"]["name"]] if league
+                                else [identifier, "", "", "", ""])
+            else:
+                output.write(json.dumps({"identifier": identifier, "league": league or None}))
+                output.write("\n")
+        return resolved, total
+
+    def all_teams(self, league_id, season):
+        print(f"Getting teams information for league {league_id} in season {season}")
+        world_leagues = World.shared(serializer=self.serializer)
+        result = world_leagues.iter_teams(league_id=league_id, season=season)
+        world_leagues.serialize(entity='teams', data=result)
+        return result
+
+    def all_players(self, league_id, season):
+        print(f"Getting players information for league {league_id} in season {season}")
+        world_leagues = World.shared(serializer=self.serializer)
+        # Records are streamed page by page straight into the serializer
+        result = world_leagues.iter_players(league_id=league_id, season=season)
+        world_leagues.serialize(entity='players', data=result)
+        return result
+
     def get_team(self, identifier, season=None, league_id=None):
         print(f"Getting team information for {identifier} in season {season}")
         entity_id, entity_name = extract_id(identifier)
         print(f"ID={entity_id}, Name={entity_name}, Season={season}, League ID={league_id}")
-        # TODO: get_team() method is not implemented yet
-        raise NotImplementedError
+        world_leagues = World.shared(serializer=self.serializer)
+        for item in world_leagues.iter_teams(league_id=league_id, season=season):
+            if item["team"]["id"] == entity_id or item["team"]["name"] == entity_name:
+                return item
+        return {}
 
     def get_player(self, identifier, season=None, league_id=None):
         print(f"Getting player information for {identifier} in season {season}")
         entity_id, entity_name = extract_id(identifier)
         print(f"ID={entity_id}, Name={entity_name}, Season={season}, League ID={league_id}")
-        # TODO: get_player() method is not implemented yet
-        raise NotImplementedError
+        world_leagues = World.shared(serializer=self.serializer)
+        for item in world_leagues.iter_players(league_id=league_id, season=season):
+            if item["player"]["id"] == entity_id or item["player"]["name"] == entity_name:
+                return item
+        return {}
 
 
-def main():
+def main(argv=None):
     """
+    :param argv: command-line arguments, sys.argv by default
     :return: system exit code
     """
     parser = argparse.ArgumentParser(description='Football API CLI')
@@ -110,6 +181,8 @@ def main():
                             help='ID of the league (required for players and teams)')
     parser_get.add_argument('--season', type=int,
                             help='Season year (required for players and teams)')
+    parser_get.add_argument('--daemon', metavar='HOST:PORT',
+                            help='Forward league lookups to a running query daemon')
 
     # Command: all
     parser_all = subparsers.add_parser('all', help='Get all entities of a type')
@@ -120,10 +193,44 @@ def main():
                             help='ID of the league (required for players and teams)')
     parser_all.add_argument('--season', type=int,
                             help='Season year (required for players and teams)')
-    parser_all.add_argument('--serializer', choices=['json', 'csv'], default='json',
+    parser_all.add_argument('--serializer', choices=['json', 'csv', 'mongo', 'sqlite'], default='json',
                             help='Output format for the data')
 
-    args = parser.parse_args()
+    # Command: batch
+    parser_batch = subparsers.add_parser('batch', help='Resolve many IDs or names in one run')
+
+    parser_batch.add_argument('entity', choices=['league'],
+                              help='Type of entities to resolve')
+    parser_batch.add_argument('--input', default='-',
+                              help='File with one ID or name per line, - for stdin')
+    parser_batch.add_argument('--format', choices=['jsonl', 'tsv'], default='jsonl',
+                              help='Output format, results are streamed to stdout')
+    parser_batch.add_argument('--daemon', metavar='HOST:PORT',
+                              help='Forward lookups to a running query daemon')
+
+    # Command: serve
+    parser_serve = subparsers.add_parser('serve', help='Run the local query daemon')
+
+    parser_serve.add_argument('--host', default='127.0.0.1',
+                              help='Interface to listen on')
+    parser_serve.add_argument('--port', type=int, default=8765,
+                              help='Port to listen on')
+
+    # Command: sync
+    parser_sync = subparsers.add_parser('sync', help='Fetch and store only the changes since the last refresh')
+
+    parser_sync.add_argument('entity', choices=['leagues'],
+                             help='Type of entities to sync')
+    parser_sync.add_argument('--cache-format', choices=['json', 'binary', 'mongo', 'sqlite'], default='json',
+                             help='Format of the synced cache')
+
+    args = parser.parse_args(argv)
+    if args.action == 'batch':
+        return batch(args)
+    if args.action == 'sync':
+        return sync(args)
+    if args.action == 'serve':
+        return serve(args)
     sanity_check(args)
 
     # Create a dictionary with non-None values
@@ -135,10 +242,13 @@ def main():
     print(kwargs)
     app = FootballClientApp(action=args.action,
                             entity=args.entity,
-                            serializer=args.serializer if hasattr(args, 'serializer') else 'json')
+                            serializer=args.serializer if hasattr(args, 'serializer') else 'json',
+                            daemon=getattr(args, 'daemon', None))
     found_results = app.search(**kwargs)
     if isinstance(found_results, list):
         print(f"Found {len(found_results)} {args.entity}")
+    elif isinstance(found_results, Paginator):
+        print(f"Found {found_results.count} {args.entity} in {found_results.pages} pages")
     elif isinstance(found_results, dict):
         print(found_results)
     else:
@@ -146,5 +256,49 @@ def main():
     return 0
 
 
+def batch(args):
+    """
+    Run the batch command, keeping stdout clean for the results: diagnostics go to stderr
+    :return: system exit code
+    """
+    output = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        app = FootballClientApp(action=args.action, entity=args.entity, serializer='json', daemon=args.daemon)
+        input_file = contextlib.nullcontext(sys.stdin) if args.input == '-' else open(args.input, encoding="utf-8")
+        with input_file as lines:
+            resolved, total = app.batch_leagues(lines, output, output_format=args.format)
+        output.flush()
+        print(f"Resolved {resolved} of {total} {args.entity} identifiers")
+    return 0
+
+
+def sync(args):
+    """
+    Run the sync command, the change log goes to stdout as JSON
+    :return: system exit code
+    """
+    output = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        changes = World(serializer='json', cache_format=args.cache_format).sync_leagues()
+    output.write(json.dumps(changes.as_dict()) + "\n")
+    return 0
+
+
+def serve(args):
+    """
+    Run the query daemon until interrupted
+    :return: system exit code
+    """
+    from football_client.daemon import QueryServer
+    with QueryServer(World.shared(), host=args.host, port=args.port) as server:
+        server.warm_up()
+        print(f"Serving lookups on {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,13 +1,31 @@
-import http.client
-import json
-from football_client.settings import API_KEY, DATA_DIR
+import os
+import threading
+import time
+from urllib.parse import urlencode
+from football_client.settings import settings
+from football_client.delta import ChangeLog, diff_leagues
+from football_client.errors import ApiError
+from football_client.fileutil import FileLock
+from football_client.models import Country, League as LeagueModel, countries_model_payload, leagues_model_payload
+from football_client.paginator import Paginator
+from football_client.partial import PartialPayload
+from football_client.registry import shared_registry
+from football_client.response_cache import ResponseCache, FRESH, MISS, STALE, cache_key, normalize_params
+from football_client.scheduler import RequestScheduler
 from football_client.serializer_factory import SerializerFactory
+from football_client.singleflight import SingleFlight
 
 API_HOST = "v3.football.api-sports.io"
-HEADERS = {
-    'x-rapidapi-host': API_HOST,
-    'x-rapidapi-key': API_KEY
-}
+
+
+def api_headers():
+    """
+    API authentication headers, the key is resolved on the first request
+    """
+    return {
+        'x-rapidapi-host': API_HOST,
+        'x-rapidapi-key': settings.api_key
+    }
 
 
 class World:
@@ -15,37 +33,105 @@ class World:
     Get information about leagues and countries
     """
 
-    def __init__(self, serializer: str):
+    # Process-wide instances, see World.shared()
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, serializer: str, data_dir=None, transport=None, scheduler=None, cache=None,
+                 cache_format="json", registry=None, models=False, targeted=True, cache_compression=None):
+        """
+        :param serializer: output format, e.g. json
+        :param data_dir: cache directory, settings.data_dir by default
+        :param transport: ConnectionPool to the API host, a pool to API_HOST by default
+        :param scheduler: RequestScheduler pacing the requests, share one between World instances using the same key
+        :param cache: ResponseCache with the TTLs of the cached entities, default TTLs by default
+        :param cache_format: serializer type of the cache in data directory, binary loads faster than json
+        :param registry: CacheRegistry sharing parsed cache files and indexes, process-wide one by default
+        :param models: return leagues and countries as slotted models.League and models.Country objects,
+                       missing ones as None, instead of the API dicts; the loaded payloads are converted to
+                       the models and dropped, World.leagues and World.countries hold {"response": [model, ...]}
+        :param targeted: while the complete entity isn't cached, answer single lookups with filtered requests,
+                         e.g. /leagues?id=39, instead of fetching every league in the world
+        :param cache_compression: codec compressing the cache files, e.g. gzip, see compression.CODECS
+        """
         self.leagues = {}
         self.countries = {}
-        self.data_dir = DATA_DIR
+        # Lookup indexes, built lazily from the loaded payloads
+        self._league_index = None
+        self._country_index = None
+        self.data_dir = data_dir or settings.data_dir
+        # Created on the first request, cache-only use never imports the HTTP stack
+        self._transport = transport
+        self.scheduler = scheduler or RequestScheduler()
+        self.cache = cache or ResponseCache(self.data_dir)
+        self.registry = registry or shared_registry
+        # Coalesces concurrent identical API requests
+        self._in_flight = SingleFlight()
+        # Cache key -> thread revalidating it in the background
+        self._refreshing = {}
+        self._refresh_lock = threading.Lock()
         self.factory = SerializerFactory(self.data_dir)
+        self.cache_format = cache_format
+        self.cache_compression = cache_compression
         # Use for caching in data directory
         self.caching = {
-            "leagues": self._create_serializer(serializer="json", entity="leagues"),
-            "countries": self._create_serializer(serializer="json", entity="countries")
+            "leagues": self._create_serializer(serializer=cache_format, entity="leagues",
+                                               compression=cache_compression),
+            "countries": self._create_serializer(serializer=cache_format, entity="countries",
+                                                 compression=cache_compression)
         }
-        # Use for serializing to user-specified format
-        self.serializers = {
-            "leagues": self._create_serializer(serializer=serializer, entity="leagues"),
-            "countries": self._create_serializer(serializer=serializer, entity="countries")
+        # Use for serializing to user-specified format, created on first use
+        self.serializer_type = serializer
+        self.serializers = {}
+        self.models = models
+        # Entity -> conversion of the loaded payload to the one kept, none for the API dicts
+        self._conversions = {"leagues": leagues_model_payload, "countries": countries_model_payload} if models else {}
+        self.targeted = targeted
+        # Records of the filtered requests, until the complete entity is loaded
+        self._partial = {
+            "leagues": PartialPayload(lambda lg: lg["league"]["id"]),
+            "countries": PartialPayload(lambda country: country["name"]),
         }
 
+    @classmethod
+    def shared(cls, serializer="json", data_dir=None, cache_format="json", models=False):
+        """
+        Long-lived instance shared by the whole process, one per configuration
+        Repeated lookups reuse the loaded payloads and indexes instead of reading the cache again
+        :return: World
+        """
+        key = (cls, serializer, data_dir or settings.data_dir, cache_format, models)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(serializer=serializer, data_dir=data_dir, cache_format=cache_format,
+                                       models=models)
+            return cls._shared[key]
+
+    @property
+    def transport(self):
+        if self._transport is None:
+            from football_client.transport import ConnectionPool
+            self._transport = ConnectionPool(API_HOST)
+        return self._transport
+
     def to_plural(self, entity: str):
         """
         Convert plural to singular, e.g. leagues -> league
         """
         pairs = {
             "league": "leagues",
-            "country": "countries"
+            "country": "countries",
+            "team": "teams",
+            "player": "players"
         }
         return pairs.get(entity, entity)
 
-    def _create_serializer(self, serializer: str, entity: str):
+    def _create_serializer(self, serializer: str, entity: str, compression=None):
         """
         Create serializer of the given type for the given entity, e.g. LeaguesJsonSerializer
         """
-        serializer_cls = self.factory.create_serializer(serializer_type=serializer, entity=entity)
+        serializer_cls = self.factory.create_serializer(serializer_type=serializer, entity=entity,
+                                                        compression=compression)
         print(f"Created serializer: {serializer_cls.__class__.__name__}")
         return serializer_cls
 
@@ -54,28 +140,279 @@ class World:
         Serialize data to the user-specified format
         """
         entity = self.to_plural(entity)
+        if entity not in self.serializers:
+            self.serializers[entity] = self._create_serializer(serializer=self.serializer_type, entity=entity)
         self.serializers[entity].write(data=data)
 
-    def _request(self, entity):
+    def _send(self, entity, params=None, headers=None):
         """
-        Request data from API
-        :param entity: e.g. leagues
-        :return: dict
+        Send API request
+        :param entity: endpoint name, e.g. teams
+        :param params: query parameters, e.g. {"league": 39, "season": 2023}
+        :param headers: extra request headers
+        :return: transport.Response
         """
-        conn = http.client.HTTPSConnection(API_HOST)
         endpoint = f"/{entity}"
-        conn.request("GET", endpoint, headers=HEADERS)
-        result = conn.getresponse()
-        result_data = json.loads(result.read())
+        if params:
+            endpoint = f"{endpoint}?{urlencode(normalize_params(params))}"
+        headers = dict(api_headers(), **(headers or {}))
+        response = self.scheduler.execute(lambda: self.transport.request("GET", endpoint, headers=headers))
+        result_data = response.data
+        if response.status != 304 and not 200 <= response.status < 300:
+            errors = result_data.get("errors") if isinstance(result_data, dict) else None
+            raise ApiError(errors or {"status": f"HTTP {response.status}"})
 
         # Check for API errors
-        if "errors" in result_data and len(result_data["errors"]):
-            raise Exception(f"API Error: {result_data['errors']}")
+        if result_data and "errors" in result_data and len(result_data["errors"]):
+            raise ApiError(result_data["errors"])
+        return response
+
+    def _fetch(self, entity, params=None):
+        """
+        Request data from API without caching
+        :param entity: endpoint name, e.g. teams
+        :param params: query parameters, e.g. {"league": 39, "season": 2023}
+        :return: dict
+        """
+        return self._send(entity, params).data
+
+    def _cache_serializer(self, entity, params=None):
+        """
+        Serializer for the cached response: the entity cache for bare leagues and countries, otherwise the
+        format's shared response store or a shard file
+        :param params: query parameters without None values, see _given()
+        """
+        if not params and entity in self.caching:
+            return self.caching[entity]
+        key = cache_key(entity, params)
+        serializer = self.factory.create_response_serializer(self.cache_format, key,
+                                                             compression=self.cache_compression)
+        if serializer is not None:
+            return serializer
+        shard_dir, file_name = self.cache.shard(key)
+        return SerializerFactory(shard_dir).create_serializer(serializer_type=self.cache_format, entity=file_name,
+                                                              compression=self.cache_compression)
+
+    def _request(self, entity, params=None):
+        """
+        Request data from API, revalidating the cached copy if the server supports it
+        Concurrent identical requests share one in-flight fetch and its result
+        :param entity: e.g. leagues
+        :param params: query parameters, e.g. {"league": 39, "season": 2023}
+        :return: dict
+        """
+        params = self._given(params)
+        key = cache_key(entity, params)
+        return self._in_flight.do(key, lambda: self._request_once(key, entity, params))
+
+    @staticmethod
+    def _given(params):
+        """
+        :return: the query parameters without None values, which cache_key() and the request leave out as well
+        """
+        return {name: value for name, value in (params or {}).items() if value is not None}
+
+    def _request_once(self, key, entity, params):
+        serializer = self._cache_serializer(entity, params)
+        # World(models=True) keeps models, the payload is read again on 304
+        loaded = getattr(self, entity, None) if not params and not self.models else None
+        # Revalidate only data that is still there, a deleted cache file is fetched again
+        headers = self.cache.conditional_headers(key) if loaded or serializer.exists() else None
+        response = self._send(entity, params, headers=headers)
+        if response.status == 304:
+            print(f"Cached {key} data is still valid")
+            self.cache.touch(key)
+            return loaded or serializer.read()
 
         # Cache the data
-        self.caching[entity].write(data=result_data)
+        self.cache.write(key, serializer, response.data, headers=response.headers)
+        return response.data
+
+    def _read_cached(self, entity):
+        """
+        Cached entity payload as kept by this World, shared through the registry
+        :param entity: leagues or countries
+        :return: dict, {} if not cached
+        """
+        return self.registry.read(self.caching[entity], convert=self._conversions.get(entity))
+
+    def _keep(self, entity, data):
+        """
+        Register the entity payload just requested and return it as kept by this World: with models=True
+        converted to models, without keeping the payload itself
+        :param entity: leagues or countries
+        :param data: requested payload, or the one already kept
+        :return: dict
+        """
+        if data is getattr(self, entity):
+            return data
+        return self.registry.put(self.caching[entity], data, convert=self._conversions.get(entity))
+
+    def query(self, entity, **params):
+        """
+        Get endpoint data, e.g. query("teams", league=39, season=2023)
+        Every distinct parameter set is cached separately, so repeated jobs only fetch the missing ones
+        Stale entries are served as is while refreshed in the background
+        :return: dict
+        """
+        return self._query(entity, params)
+
+    def _query(self, entity, params):
+        params = self._given(params)
+        key = cache_key(entity, params)
+        data, state = self.cache.read(key, entity, self._cache_serializer(entity, params))
+        if state == MISS:
+            print(f"No cached {key} data. Fetching from API...")
+            return self._request(entity, params)
+        if state == STALE:
+            self._in_background(key, lambda: self._request(entity, params))
+        return data
+
+    def _load(self, entity):
+        """
+        Make sure the entity payload is loaded: memory first, then serialized data, then API
+        Stale data is served as is while it is refreshed in the background
+        :param entity: leagues or countries
+        :return: dict
+        """
+        if getattr(self, entity):
+            state = self.cache.check(entity, entity, self.caching[entity])
+        else:
+            print(f"No cached {entity} data. Trying to read from serialized data...")
+            data, state = self.cache.read(entity, entity, self.caching[entity],
+                                          reader=lambda serializer: self._read_cached(entity))
+            setattr(self, entity, data)
+
+        if not getattr(self, entity):
+            self._fetch_once(entity)
+        elif state == STALE:
+            self.refresh(entity, background=True)
+        return getattr(self, entity)
+
+    def _fetch_once(self, entity):
+        """
+        Fetch the missing entity, single-flight across the processes and threads sharing the data directory:
+        the first one fetches, the others wait for it and read the written cache
+        :param entity: leagues or countries
+        """
+        with FileLock(os.path.join(self.data_dir, f".{entity}.lock")):
+            data = self._read_cached(entity)
+            if data:
+                print(f"Serialized {entity} data was written meanwhile")
+            else:
+                print("Serialized data is empty or not found. Fetching from API...")
+                data = self._keep(entity, self._request(entity))
+            setattr(self, entity, data)
+
+    def refresh(self, entity, background=False):
+        """
+        Re-fetch entity from API, keeping the current data available until the new one arrives
+        :param entity: leagues or countries
+        :param background: don't wait for the result, at most one background refresh per entity runs at a time
+        :return: refreshing threading.Thread if background, otherwise the fresh payload
+        """
+        if not background:
+            setattr(self, entity, self._keep(entity, self._request(entity)))
+            return getattr(self, entity)
+        return self._in_background(entity, lambda: setattr(self, entity, self._refresh_once(entity)))
+
+    def _refresh_once(self, entity):
+        """
+        Re-fetch the stale entity, single-flight across the processes and threads sharing the data directory
+        like _fetch_once(): the ones waiting for the lock read the data refreshed meanwhile
+        :param entity: leagues or countries
+        :return: fresh payload
+        """
+        with FileLock(os.path.join(self.data_dir, f".{entity}.lock")):
+            if self.cache.state(entity, entity, self.caching[entity]) == FRESH:
+                data = self._read_cached(entity)
+                if data:
+                    print(f"Serialized {entity} data was refreshed meanwhile")
+                    return data
+            return self._keep(entity, self._request(entity))
+
+    def sync_leagues(self):
+        """
+        Delta sync: fetch the leagues and store only the leagues and seasons that changed since the last refresh
+        Indexed cache formats (mongo, sqlite) update just the changed records, the file formats are rewritten only
+        if something changed. Non-empty change logs are appended to leagues_changes.jsonl in the data directory
+        :return: ChangeLog, empty if nothing changed
+        """
+        with FileLock(os.path.join(self.data_dir, ".leagues.lock")):
+            serializer = self.caching["leagues"]
+            revalidate = self.leagues or serializer.exists()
+            response = self._send("leagues", headers=self.cache.conditional_headers("leagues") if revalidate else None)
+            if response.status == 304:
+                print("Cached leagues data is still valid")
+                self.cache.touch("leagues")
+                return ChangeLog()
+
+            # World(models=True) keeps no API dicts to diff against
+            previous = serializer.read() if self.models else self.leagues or self.registry.read(serializer)
+            changes = diff_leagues(previous, response.data)
+            data = response.data
+            if not previous:
+                self.cache.write("leagues", serializer, data, headers=response.headers)
+            elif changes:
+                if not serializer.apply_changes(data, changes):
+                    serializer.write(data=data)
+                self.cache.mark_fetched("leagues", response.headers)
+            else:
+                # Keep the loaded payload and its indexes, nothing to write
+                data = self.leagues or previous
+                self.cache.mark_fetched("leagues", response.headers)
+            self.leagues = self._keep("leagues", data)
+
+        print(f"Synced leagues: {changes.summary()}")
+        if changes:
+            changes.append_to(os.path.join(self.data_dir, "leagues_changes.jsonl"),
+                              synced_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+        return changes
+
+    def _in_background(self, key, refresh):
+        """
+        Run refresh in a background thread unless one is already running for the key
+        :param key: cache_key() of the refreshed entry
+        :param refresh: callable re-fetching the entry
+        :return: threading.Thread
+        """
+        def revalidate():
+            try:
+                refresh()
+            except Exception as e:
+                # Keep serving the stale data, the next lookup retries
+                print(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._refresh_lock:
+                    del self._refreshing[key]
+
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return self._refreshing[key]
+            print(f"Cached {key} data is stale. Refreshing in the background...")
+            thread = threading.Thread(target=revalidate, name=f"refresh-{key}", daemon=True)
+            self._refreshing[key] = thread
+            thread.start()
+        return thread
+
+    def iter_teams(self, league_id, season):
+        """
+        Stream teams of the league season
+        :param league_id: e.g. 39
+        :param season: e.g. 2023
+        :return: Paginator yielding team records
+        """
+        return Paginator(lambda page: self._query("teams", {"league": league_id, "season": season,
+                                                           "page": page if page > 1 else None}))
 
-        return result_data
+    def iter_players(self, league_id, season):
+        """
+        Stream players of the league season page by page, prefetching the next page
+        :param league_id: e.g. 39
+        :param season: e.g. 2023
+        :return: Paginator yielding player records
+        """
+        return Paginator(lambda page: self._query("players", {"league": league_id, "season": season, "page": page}))
 
     def get_league(self, league_id=None, league_name=None):
         """
@@ -87,17 +424,120 @@ class World:
         """
         print(f"Getting league information for {league_id or league_name}")
         if not self.leagues:
-            print("No cached leagues data. Trying to read from serialized data...")
-            self.leagues = self.caching['leagues'].read()
+            league = self._query_cache("leagues", "find", league_id=league_id, league_name=league_name)
+            if league is not None:
+                return self._as_model("leagues", league)
+            if self._is_cold("leagues"):
+                leagues = self._targeted(
+                    "leagues", {"id": league_id} if league_id else {"name": league_name},
+                    lambda lg: (league_id and lg["league"]["id"] == league_id)
+                    or (league_name and lg["league"]["name"] == league_name),
+                    unique=bool(league_id))
+                return self._as_model("leagues", leagues[0] if leagues else {})
+        self._load("leagues")
+        return self._find_one(self._get_league_index(), by_id=league_id, by_name=league_name)
+
+    def _query_cache(self, entity, lookup, **criteria):
+        """
+        Indexed cache formats (binary, mongo, sqlite) serve lookups without loading the whole entity
+        :param entity: leagues or countries
+        :param lookup: serializer method, find for a single record or select for filtered queries
+        :param criteria: lookup criteria, e.g. league_id=39
+        :return: lookup result, None if the cache can't serve the lookup
+        """
+        result = getattr(self.caching[entity], lookup)(**criteria)
+        if result is not None and self.cache.check(entity, entity, self.caching[entity]) == STALE:
+            self.refresh(entity, background=True)
+        return result
+
+    def _is_cold(self, entity):
+        """
+        :return: True if targeted lookups are enabled and the complete entity was never cached
+        """
+        return self.targeted and self.cache.state(entity, entity, self.caching[entity]) == MISS
 
+    def _targeted(self, entity, params, match, unique=False):
+        """
+        Cold-cache lookup through a filtered request, e.g. /leagues?id=39, merged into the partial records
+        Every filtered response is cached like query() results, so repeated lookups don't hit the API
+        :param entity: leagues or countries
+        :param params: API filters, e.g. {"id": 39}
+        :param match: callable(record) -> bool, the lookup itself
+        :param unique: the lookup matches at most one record, any merged match answers it
+        :return: list of matching records
+        """
+        partial = self._partial[entity]
+        key = cache_key(entity, params)
+        if key not in partial:
+            found = partial.select(match) if unique else []
+            if found:
+                return found
+            print(f"No complete {entity} data cached. Requesting {key}")
+            partial.merge(key, self._query(entity, params))
+        return partial.select(match)
+
+    def find_league(self, league_id=None, league_name=None):
+        """
+        Quiet counterpart of get_league() for bulk lookups: the leagues are loaded once, then every call is
+        a plain index lookup, without logging and freshness checks
+        :param league_id: e.g. 39
+        :param league_name: e.g. Bundesliga
+        :return: dict
+        """
         if not self.leagues:
-            print("Serialized data is empty or not found. Fetching from API...")
-            self.leagues = self._request("leagues")
+            self._load("leagues")
+        return self._find_one(self._get_league_index(), by_id=league_id, by_name=league_name)
 
-        for lg in self.leagues['response']:
-            if (league_id and lg["league"]["id"] == league_id) or (league_name and lg["league"]["name"] == league_name):
-                return lg
-        return {}
+    def find_leagues(self, league_name, ignore_case=False):
+        """
+        Find all leagues sharing the name, e.g. "Premier League" exists in several countries
+        :param league_name: e.g. Premier League
+        :param ignore_case: compare case-folded names
+        :return: list of dict
+        """
+        self._load("leagues")
+        index = self._get_league_index()
+        if ignore_case:
+            positions = index["casefold"].get(league_name.casefold(), [])
+        else:
+            positions = index["name"].get(league_name, [])
+        records = index["payload"]["response"]
+        return [records[pos] for pos in positions]
+
+    def query_leagues(self, country=None, league_type=None, season=None):
+        """
+        Leagues matching all the given filters, e.g. query_leagues(country="England", league_type="Cup", season=2023)
+        Queryable cache formats (sqlite) answer with indexed queries, otherwise the loaded leagues are scanned
+        :param country: country name or code, e.g. England or GB
+        :param league_type: League or Cup
+        :param season: year, e.g. 2023
+        :return: list of dict
+        """
+        if not self.leagues:
+            leagues = self._query_cache("leagues", "select", country=country, league_type=league_type, season=season)
+            if leagues is not None:
+                return self._as_model("leagues", leagues)
+            if country and self._is_cold("leagues"):
+                params = {"code" if self._is_country_code(country) else "country": country,
+                          "type": league_type.lower() if league_type else None, "season": season}
+                return self._as_model("leagues", self._targeted(
+                    "leagues", params, lambda lg: self._league_matches(lg, country, league_type, season)))
+        return [lg for lg in self._load("leagues")["response"]
+                if self._league_matches(lg, country, league_type, season)]
+
+    @staticmethod
+    def _league_matches(lg, country, league_type, season):
+        """
+        :param lg: /leagues record or models.League
+        :return: True if the league matches all the given filters of query_leagues()
+        """
+        if isinstance(lg, LeagueModel):
+            countries, kind, years = (lg.country.name, lg.country.code), lg.type, [s.year for s in lg.seasons]
+        else:
+            countries = (lg["country"]["name"], lg["country"]["code"])
+            kind, years = lg["league"]["type"], [s["year"] for s in lg["seasons"]]
+        return ((not country or country in countries) and (not league_type or kind == league_type)
+                and (not season or season in years))
 
     def get_country(self, country_name=None, country_code=None):
         """
@@ -106,28 +546,141 @@ class World:
         """
         print(f"Getting country information for {country_name or country_code}")
         if not self.countries:
-            print("No cached countries data. Trying to read from serialized data...")
-            self.countries = self.caching['countries'].read()
+            country = self._query_cache("countries", "find", country_name=country_name, country_code=country_code)
+            if country is not None:
+                return self._as_model("countries", country)
+            if self._is_cold("countries"):
+                countries = self._targeted(
+                    "countries", {"name": country_name} if country_name else {"code": country_code},
+                    lambda country: (country_name and country["name"] == country_name)
+                    or (country_code and country["code"] == country_code),
+                    unique=bool(country_name))
+                return self._as_model("countries", countries[0] if countries else {})
+        self._load("countries")
+        return self._find_one(self._get_country_index(), by_name=country_name, by_code=country_code)
+
+    @staticmethod
+    def _is_country_code(country):
+        """
+        :return: True for two-letter codes, e.g. GB, False for names, e.g. England or USA, the name of US
+        """
+        return len(country) == 2 and country.isalpha() and country.isupper()
 
+    def find_country(self, country_name=None, country_code=None):
+        """
+        Quiet counterpart of get_country() for bulk lookups, see find_league()
+        :return: dict
+        """
         if not self.countries:
-            print("Serialized data is empty or not found. Fetching from API...")
-            self.countries = self._request("countries")
+            self._load("countries")
+        return self._find_one(self._get_country_index(), by_name=country_name, by_code=country_code)
 
-        for country in self.countries['response']:
-            if (country_name and country["name"] == country_name) or (country_code and country["code"] == country_code):
-                return country
-        return {}
+    def close(self):
+        """
+        Close pooled API connections and release the cache serializers, e.g. the memory map of indexed lookups
+        """
+        if self._transport is not None:
+            self._transport.close()
+        for serializer in self.caching.values():
+            serializer.close()
+
+    def league_table(self):
+        """
+        Columnar copy of the leagues for analytics, e.g. seasons per country, see columnar.LeagueTable
+        Built once per loaded payload and shared through the registry
+        :return: LeagueTable
+        """
+        # NumPy is imported only by the analytics users
+        from football_client.columnar import LeagueTable
+        leagues = self._load("leagues")
+        if not self.models:
+            return self.registry.index(leagues, "league_table", LeagueTable.from_payload)
+        # The API dicts aren't kept with models, the table is built from the cache file once per loaded payload
+        return self.registry.index(leagues, "league_table",
+                                   lambda _: LeagueTable.from_payload(self.caching["leagues"].read()))
 
     def all_leagues(self):
-        self.get_league()
-        return self.leagues["response"]
+        return self._load("leagues")["response"]
 
     def all_countries(self):
-        self.get_country()
-        return self.countries["response"]
+        return self._load("countries")["response"]
+
+    def _get_league_index(self):
+        """
+        League indexes of the loaded payload, built once per payload and shared through the registry
+        :return: dict of index name -> {key: list of positions in the payload}
+        """
+        leagues = self.leagues
+        # Indexes keep the payload they were built from, so a refresh from another thread never mixes them up
+        if self._league_index is None or self._league_index["payload"] is not leagues:
+            self._league_index = self.registry.index(leagues, "leagues", self._build_league_index)
+        return self._league_index
+
+    @staticmethod
+    def _build_league_index(leagues):
+        index = {"payload": leagues, "id": {}, "name": {}, "casefold": {}}
+        for pos, lg in enumerate(leagues.get("response", [])):
+            if isinstance(lg, LeagueModel):
+                league_id, name = lg.id, lg.name
+            else:
+                league_id, name = lg["league"]["id"], lg["league"]["name"]
+            index["id"].setdefault(league_id, []).append(pos)
+            index["name"].setdefault(name, []).append(pos)
+            index["casefold"].setdefault(name.casefold(), []).append(pos)
+        return index
+
+    def _get_country_index(self):
+        """
+        Country indexes of the loaded payload, built once per payload and shared through the registry
+        :return: dict of index name -> {key: list of positions in the payload}
+        """
+        countries = self.countries
+        if self._country_index is None or self._country_index["payload"] is not countries:
+            self._country_index = self.registry.index(countries, "countries", self._build_country_index)
+        return self._country_index
+
+    @staticmethod
+    def _build_country_index(countries):
+        index = {"payload": countries, "name": {}, "code": {}}
+        for pos, country in enumerate(countries.get("response", [])):
+            if isinstance(country, Country):
+                name, code = country.name, country.code
+            else:
+                name, code = country["name"], country["code"]
+            index["name"].setdefault(name, []).append(pos)
+            index["code"].setdefault(code, []).append(pos)
+        return index
+
+    def _find_one(self, index, **criteria):
+        """
+        Return the first record matching any of the given criteria, in payload order
+        :param index: index built by _get_league_index() or _get_country_index()
+        :param criteria: by_<index name>=value, falsy values are ignored
+        :return: dict, {} if not found, or model object, None if not found
+        """
+        positions = [index[key[len("by_"):]].get(value, [None])[0] for key, value in criteria.items() if value]
+        positions = [pos for pos in positions if pos is not None]
+        if not positions:
+            return None if self.models else {}
+        return index["payload"]["response"][min(positions)]
+
+    def _as_model(self, entity, result):
+        """
+        Convert a record or list of records read from the cache to model objects if the World returns models
+        """
+        if not self.models:
+            return result
+        model = LeagueModel if entity == "leagues" else Country
+        if isinstance(result, list):
+            return [model.from_dict(record) for record in result]
+        return model.from_dict(result) if result else None
 
 
 class League:
+    """
+    League of a /leagues record, see models.League for the slotted model returned by World(models=True)
+    """
+
     def __init__(self, league_data):
         self.id = league_data["league"]["id"]
         self.type = league_data["league"]["type"]
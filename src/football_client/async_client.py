@@ -0,0 +1,132 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from football_client.api_client import API_HOST, World
+from football_client.transport import ConnectionPool
+
+
+class AsyncWorld(World):
+    """
+    asyncio flavour of World: the same lookups, with API requests issued concurrently
+    Requests run over the pooled blocking transport in worker threads, at most `concurrency` at a time
+    """
+
+    def __init__(self, serializer: str, data_dir=None, transport=None, scheduler=None, concurrency=4, **kwargs):
+        """
+        :param serializer: output format, e.g. json
+        :param data_dir: cache directory, settings.data_dir by default
+        :param transport: ConnectionPool to the API host, a pool of `concurrency` connections by default
+        :param scheduler: RequestScheduler pacing the requests, shared by all worker threads
+        :param concurrency: maximum number of requests in flight
+        :param kwargs: other World arguments, e.g. cache_format, registry, models, targeted or cache_compression
+        """
+        assert concurrency > 0, "concurrency must be positive"
+        super().__init__(serializer, data_dir=data_dir,
+                         transport=transport or ConnectionPool(API_HOST, pool_size=concurrency),
+                         scheduler=scheduler, **kwargs)
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="football_client")
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self):
+        """
+        Semaphore bound to the running event loop, recreated if the instance is reused by another loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, func, *args):
+        """
+        Run blocking call in the worker pool
+        """
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def fetch(self, entity, **params):
+        """
+        Request data from API without caching
+        :param entity: endpoint name, e.g. teams
+        :param params: query parameters, e.g. league=39, season=2023
+        :return: dict
+        """
+        return await self._run(self._fetch, entity, params)
+
+    async def query(self, entity, **params):
+        """
+        Async counterpart of World.query(), served from the parameterized cache while fresh
+        """
+        return await self._run(self._query, entity, params)
+
+    async def fetch_many(self, requests):
+        """
+        Issue several requests concurrently
+        :param requests: iterable of (entity, params dict)
+        :return: list of dict in the order of requests
+        """
+        return await asyncio.gather(*(self.fetch(entity, **params) for entity, params in requests))
+
+    async def _load_async(self, entity):
+        """
+        Async counterpart of World._load(), reading or fetching in the worker pool
+        """
+        if getattr(self, entity):
+            return self._load(entity)
+        return await self._run(self._load, entity)
+
+    async def load(self):
+        """
+        Load leagues and countries concurrently
+        """
+        await asyncio.gather(self._load_async("leagues"), self._load_async("countries"))
+
+    async def _lookup(self, entity, lookup, *args):
+        """
+        Run the World lookup, in the worker pool unless the entity is loaded and the lookup is served from memory,
+        so cold lookups take the same indexed cache and filtered request paths as World's
+        """
+        if getattr(self, entity):
+            return lookup(*args)
+        return await self._run(lookup, *args)
+
+    async def get_league(self, league_id=None, league_name=None):
+        return await self._lookup("leagues", super().get_league, league_id, league_name)
+
+    async def find_leagues(self, league_name, ignore_case=False):
+        return await self._lookup("leagues", super().find_leagues, league_name, ignore_case)
+
+    async def query_leagues(self, country=None, league_type=None, season=None):
+        return await self._lookup("leagues", super().query_leagues, country, league_type, season)
+
+    async def get_country(self, country_name=None, country_code=None):
+        return await self._lookup("countries", super().get_country, country_name, country_code)
+
+    async def all_leagues(self):
+        return (await self._load_async("leagues"))["response"]
+
+    async def all_countries(self):
+        return (await self._load_async("countries"))["response"]
+
+    async def get_teams(self, league_id, season):
+        """
+        :param league_id: e.g. 39
+        :param season: e.g. 2023
+        :return: list of dict
+        """
+        return (await self.query("teams", league=league_id, season=season))["response"]
+
+    async def get_players(self, league_id, season, page=1):
+        """
+        Get one page of league players
+        :param league_id: e.g. 39
+        :param season: e.g. 2023
+        :param page: page number, starting from 1
+        :return: dict with "paging" and "response"
+        """
+        return await self.query("players", league=league_id, season=season, page=page)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        super().close()
@@ -1,17 +1,59 @@
 import os
 import abc
+from football_client.compression import get_codec
+from football_client.fileutil import atomic_write
 
 
 class BaseSerializer(abc.ABC):
+    # Whether the serialized files can be compressed, see use_codec()
+    COMPRESSIBLE = False
+
     def __init__(self, data_dir, file_name, settings=None):
         """
         :param data_dir: normally ~/.football_client
         :param file_name: name without extension, e.g., leagues
-        :param settings: dict
+        :param settings: dict, compression: codec name, e.g. gzip
         """
         self.data_dir = data_dir
         self.settings = settings or {}
-        self.serialized_file = os.path.join(self.data_dir, f"{file_name}.{self.get_extension()}")
+        self.file_name = file_name
+        self.use_codec(self.settings.get("compression"))
+
+    def use_codec(self, name):
+        """
+        Compress the serialized files with the codec, e.g. gzip writes leagues.json.gz instead of leagues.json
+        :param name: codec name, see compression.CODECS, None for uncompressed files
+        :return: self
+        """
+        codec = get_codec(name)
+        if codec is not None and not self.COMPRESSIBLE:
+            raise ValueError(f"{type(self).__name__} doesn't support compression")
+        self.codec = codec
+        self.serialized_file = self.compressed_path(os.path.join(self.data_dir,
+                                                                 f"{self.file_name}.{self.get_extension()}"))
+        return self
+
+    def compressed_path(self, path):
+        """
+        :param path: uncompressed file path, e.g. leagues.json
+        :return: path with the codec extension, e.g. leagues.json.gz
+        """
+        return f"{path}.{self.codec.extension}" if self.codec else path
+
+    def open_file(self, path, mode="r", **kwargs):
+        """
+        Open a serialized file for reading or appending, decompressing or compressing it with the codec
+        :param kwargs: further open() arguments, e.g. encoding or newline
+        """
+        if self.codec is None:
+            return open(path, mode, **kwargs)
+        return self.codec.open(path, mode, **kwargs)
+
+    def write_file(self, path, mode="w", **kwargs):
+        """
+        Replace a serialized file atomically, compressed with the codec, see fileutil.atomic_write()
+        """
+        return atomic_write(path, mode, codec=self.codec, **kwargs)
 
     @staticmethod
     def get_extension():
@@ -34,3 +76,39 @@ class BaseSerializer(abc.ABC):
         :return: dict
         """
         raise NotImplementedError('read() must be implemented in the derived class')
+
+    def exists(self):
+        """
+        :return: True if data was written, checked without reading it
+        """
+        return os.path.exists(self.serialized_file)
+
+    def find(self, **criteria):
+        """
+        Read a single record without loading the whole serialized data, for formats that keep an index
+        :param criteria: e.g. league_id=39 or league_name="Premier League"
+        :return: matching record, {} if nothing matches, None if the lookup can't be served this way
+        """
+        return None
+
+    def select(self, **filters):
+        """
+        Read the records matching all filters without loading the whole serialized data, for queryable formats
+        :param filters: e.g. country="England", league_type="Cup", season=2023
+        :return: list of matching records, None if the query can't be served this way
+        """
+        return None
+
+    def close(self):
+        """
+        Release what is held open for reading, e.g. connections or memory maps, reopened on the next read
+        """
+
+    def apply_changes(self, data, changes):
+        """
+        Persist only the changed records, for formats that can update records in place
+        :param data: complete new payload
+        :param changes: delta.ChangeLog between the stored and the new payload
+        :return: True if applied, False if the format needs the complete payload written
+        """
+        return False
@@ -0,0 +1,183 @@
+import mmap
+import os
+import pickle
+import struct
+from football_client.base_serializer import BaseSerializer
+from football_client.fileutil import atomic_write
+
+MAGIC = b"FBC1"
+# Little-endian unsigned 32-bit length prefix
+LENGTH = struct.Struct("<I")
+
+
+class BinarySerializer(BaseSerializer):
+    """
+    Serialize data to a compact binary cache format
+
+    Layout: magic, then length-prefixed pickle (protocol 5) blocks: the payload without its "response"
+    list first, then every "response" record on its own. A list payload has an empty (None) header.
+    The cache is written and read by this package only, never load files from untrusted sources.
+    """
+
+    PROTOCOL = pickle.HIGHEST_PROTOCOL if pickle.HIGHEST_PROTOCOL < 5 else 5
+
+    def __init__(self, data_dir, file_name, settings=None):
+        """
+        :param data_dir: normally ~/.football_client/data
+        :param file_name: name without extension, e.g., leagues
+        :param settings: dict
+        """
+        super().__init__(data_dir, file_name, settings=settings)
+
+    def write(self, data):
+        """
+        Serialize data to binary cache
+        :param data: payload dict with "response" list, or any iterable of records
+        """
+        if isinstance(data, dict):
+            header = {key: value for key, value in data.items() if key != "response"}
+            records = data.get("response", [])
+        else:
+            header, records = None, data
+        # Replaced atomically: memory maps of the previous file stay valid
+        with atomic_write(self.serialized_file, "wb") as bin_file:
+            bin_file.write(MAGIC)
+            offset = len(MAGIC) + self._write_block(bin_file, header)
+            for record in records:
+                length = self._write_block(bin_file, record)
+                self._on_record(record, offset + LENGTH.size, length - LENGTH.size)
+                offset += length
+        print(f"Serialized data to {self.serialized_file}")
+
+    def _on_record(self, record, offset, length):
+        """
+        Hook called for every written record
+        :param offset: position of the pickled record in the file
+        :param length: size of the pickled record
+        """
+
+    def _write_block(self, bin_file, obj):
+        block = pickle.dumps(obj, protocol=self.PROTOCOL)
+        bin_file.write(LENGTH.pack(len(block)))
+        bin_file.write(block)
+        return LENGTH.size + len(block)
+
+    def read(self):
+        """
+        Read serialized data from binary cache
+        :return: dict, or list for a list payload
+        """
+        if not os.path.exists(self.serialized_file):
+            return {}
+        with open(self.serialized_file, "rb") as bin_file:
+            buffer = memoryview(bin_file.read())
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a binary cache file: {self.serialized_file}")
+        blocks = self._iter_blocks(buffer, len(MAGIC))
+        header = next(blocks)
+        records = list(blocks)
+        if header is None:
+            return records
+        header["response"] = records
+        return header
+
+    @staticmethod
+    def _iter_blocks(buffer, offset):
+        while offset < len(buffer):
+            (length,) = LENGTH.unpack_from(buffer, offset)
+            offset += LENGTH.size
+            yield pickle.loads(buffer[offset:offset + length])
+            offset += length
+
+    @staticmethod
+    def get_extension():
+        """
+        Get the file extension for the serialized data format (e.g., "json", "tsv")
+        """
+        return "bin"
+
+
+class LeaguesBinarySerializer(BinarySerializer):
+    """
+    Binary leagues cache with an offset index, leagues.idx: league ID and name -> byte range of the record
+
+    find() memory-maps the cache and decodes only the requested record, so looking up a league or two
+    doesn't pay for loading all of them. The index is tied to the size and modification time of the cache
+    file, a missing or outdated index makes find() fall back to the full load.
+    """
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="leagues", settings=None)
+        self.index_file = os.path.join(self.data_dir, "leagues.idx")
+        self._index = None
+        self._mmap = None
+        self._mapped_stat = None
+
+    def write(self, data):
+        """
+        Serialize leagues data to binary cache and index it
+        """
+        self.close()
+        self._index = {"id": {}, "name": {}}
+        super().write(data)
+        stat = os.stat(self.serialized_file)
+        self._index["file"] = (stat.st_size, stat.st_mtime_ns)
+        with atomic_write(self.index_file, "wb") as idx_file:
+            pickle.dump(self._index, idx_file, protocol=self.PROTOCOL)
+        print(f"Serialized leagues index to {self.index_file}")
+
+    def _on_record(self, record, offset, length):
+        self._index["id"].setdefault(record["league"]["id"], (offset, length))
+        self._index["name"].setdefault(record["league"]["name"], (offset, length))
+
+    def _get_index(self):
+        """
+        :return: index matching the current cache file, None if there is no such index
+        """
+        try:
+            stat = os.stat(self.serialized_file)
+        except FileNotFoundError:
+            return None
+        if self._index is None or self._index.get("file") != (stat.st_size, stat.st_mtime_ns):
+            self._index = None
+            if os.path.exists(self.index_file):
+                with open(self.index_file, "rb") as idx_file:
+                    index = pickle.load(idx_file)
+                if index.get("file") == (stat.st_size, stat.st_mtime_ns):
+                    self._index = index
+        return self._index
+
+    def _get_mmap(self):
+        stat = self._index["file"]
+        if self._mmap is None or self._mapped_stat != stat:
+            self.close()
+            with open(self.serialized_file, "rb") as bin_file:
+                self._mmap = mmap.mmap(bin_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_stat = stat
+        return self._mmap
+
+    def find(self, league_id=None, league_name=None):
+        """
+        Decode a single league from the memory-mapped cache
+        :param league_id: e.g. 39
+        :param league_name: e.g. Bundesliga
+        :return: dict, {} if not found, None if there is no valid index
+        """
+        index = self._get_index() if (league_id or league_name) else None
+        if index is None:
+            return None
+        ranges = [index[key].get(value) for key, value in (("id", league_id), ("name", league_name)) if value]
+        ranges = [found for found in ranges if found]
+        if not ranges:
+            return {}
+        # First record in the file wins, as in a linear scan
+        offset, length = min(ranges)
+        return pickle.loads(self._get_mmap()[offset:offset + length])
+
+    def close(self):
+        """
+        Release the memory map
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -0,0 +1,243 @@
+import datetime
+from array import array
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Day number of missing season dates
+NO_DATE = -1
+
+
+def _day(value):
+    """
+    :param value: ISO date, e.g. 2023-08-11, or None
+    :return: proleptic Gregorian ordinal, NO_DATE if missing
+    """
+    return datetime.date.fromisoformat(value).toordinal() if value else NO_DATE
+
+
+class _Categories:
+    """
+    Categorical column: values are stored as small integer codes into the list of distinct values
+    """
+
+    def __init__(self, typecode="h"):
+        self.values = []
+        self.codes = array(typecode)
+        self._lookup = {}
+
+    def append(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def code(self, value):
+        return self._lookup.get(value)
+
+
+class LeagueTable:
+    """
+    Columnar copy of the leagues payload for analytics over all leagues and seasons
+
+    One row per league (id, type, country) and one row per season (league row, year, start and end day,
+    current flag), in compact array columns. Types and countries are categorical. With NumPy installed the
+    filters and group-bys are vectorized over zero-copy views of the columns, otherwise they loop over
+    the arrays in Python.
+
+    Filters shared by the helpers: league_type (League, Cup), country (name or code), season (year the
+    league has a season in).
+    """
+
+    def __init__(self, use_numpy=None):
+        """
+        :param use_numpy: vectorize with NumPy, by default if it is installed
+        """
+        if use_numpy and numpy is None:
+            raise ImportError("use_numpy requires numpy: pip install numpy")
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        self.ids = array("q")
+        self.names = []
+        self.types = _Categories("b")
+        self.countries = _Categories("h")
+        # Country name -> code, countries are filtered by either
+        self.country_codes = {}
+        self.season_league = array("l")
+        self.season_year = array("h")
+        self.season_start = array("l")
+        self.season_end = array("l")
+        self.season_current = array("b")
+        # Seasons per league row
+        self.season_counts = array("h")
+        self._views = None
+        # Year -> league rows with a season that year, built on first use by the Python loops
+        self._rows_by_year = None
+
+    @classmethod
+    def from_payload(cls, leagues, use_numpy=None):
+        """
+        :param leagues: /leagues payload, e.g. World.leagues
+        :return: LeagueTable
+        """
+        table = cls(use_numpy=use_numpy)
+        for row, lg in enumerate(leagues.get("response", [])):
+            table.ids.append(lg["league"]["id"])
+            table.names.append(lg["league"]["name"])
+            table.types.append(lg["league"]["type"])
+            table.countries.append(lg["country"]["name"])
+            table.country_codes.setdefault(lg["country"]["name"], lg["country"]["code"])
+            table.season_counts.append(len(lg["seasons"]))
+            for season in lg["seasons"]:
+                table.season_league.append(row)
+                table.season_year.append(season["year"])
+                table.season_start.append(_day(season["start"]))
+                table.season_end.append(_day(season["end"]))
+                table.season_current.append(bool(season.get("current")))
+        return table
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _np(self, name):
+        """
+        Zero-copy NumPy view of an array column
+        """
+        if self._views is None:
+            columns = {
+                "ids": self.ids, "types": self.types.codes, "countries": self.countries.codes,
+                "season_league": self.season_league, "season_year": self.season_year,
+                "season_start": self.season_start, "season_end": self.season_end,
+                "season_current": self.season_current,
+            }
+            self._views = {key: numpy.frombuffer(column, dtype=column.typecode) if len(column) else
+                           numpy.zeros(0, dtype=column.typecode) for key, column in columns.items()}
+        return self._views[name]
+
+    def _country_code(self, country):
+        code = self.countries.code(country)
+        if code is None:
+            code = next((self.countries.code(name) for name, iso in self.country_codes.items() if iso == country), None)
+        return code
+
+    def league_mask(self, league_type=None, country=None, season=None):
+        """
+        :return: one boolean per league row, True for the leagues matching all filters
+        """
+        type_code = self.types.code(league_type) if league_type else None
+        country_code = self._country_code(country) if country else None
+        if self.use_numpy:
+            mask = numpy.ones(len(self), dtype=bool)
+            if league_type:
+                mask &= self._np("types") == (-1 if type_code is None else type_code)
+            if country:
+                mask &= self._np("countries") == (-1 if country_code is None else country_code)
+            if season:
+                in_season = numpy.zeros(len(self), dtype=bool)
+                in_season[self._np("season_league")[self._np("season_year") == season]] = True
+                mask &= in_season
+            return mask
+        mask = [True] * len(self)
+        if league_type:
+            mask = [selected and code == type_code for selected, code in zip(mask, self.types.codes)]
+        if country:
+            mask = [selected and code == country_code for selected, code in zip(mask, self.countries.codes)]
+        if season:
+            if self._rows_by_year is None:
+                rows_by_year = {}
+                for row, year in zip(self.season_league, self.season_year):
+                    rows_by_year.setdefault(year, set()).add(row)
+                self._rows_by_year = rows_by_year
+            rows = self._rows_by_year.get(season, set())
+            mask = [selected and row in rows for row, selected in enumerate(mask)]
+        return mask
+
+    def filter(self, league_type=None, country=None, season=None):
+        """
+        IDs of the leagues matching all filters, e.g. all cups in England with a 2023 season
+        :return: list of league IDs in the payload order
+        """
+        mask = self.league_mask(league_type=league_type, country=country, season=season)
+        if self.use_numpy:
+            return self._np("ids")[mask].tolist()
+        return [league_id for league_id, selected in zip(self.ids, mask) if selected]
+
+    def count_leagues(self, by, **filters):
+        """
+        Number of leagues per type or country
+        :param by: type or country
+        :param filters: league_type, country, season
+        :return: dict of value -> count, values without leagues are left out
+        """
+        categories = self._categories(by)
+        mask = self.league_mask(**filters)
+        if self.use_numpy:
+            codes = self._np("types" if by == "type" else "countries")[mask]
+            return self._to_dict(categories, numpy.bincount(codes, minlength=len(categories.values)))
+        return {categories.values[code]: count
+                for code, count in Counter(code for code, selected in zip(categories.codes, mask) if selected).items()}
+
+    def count_seasons(self, by, year=None, active_on=None, current=None, **filters):
+        """
+        Number of league seasons per type, country or year, e.g. seasons per country
+        :param by: type, country or year
+        :param year: count only the seasons of the year
+        :param active_on: datetime.date, count only the seasons running that day
+        :param current: count only the current (True) or past (False) seasons
+        :param filters: league filters, league_type, country, season
+        :return: dict of value -> count, values without seasons are left out
+        """
+        league_mask = self.league_mask(**filters)
+        day = active_on.toordinal() if active_on else None
+        if self.use_numpy:
+            rows = self._np("season_league")
+            mask = league_mask[rows]
+            if year is not None:
+                mask &= self._np("season_year") == year
+            if day is not None:
+                mask &= (self._np("season_start") <= day) & (day <= self._np("season_end"))
+            if current is not None:
+                mask &= self._np("season_current") == bool(current)
+            if by == "year":
+                years, counts = numpy.unique(self._np("season_year")[mask], return_counts=True)
+                return dict(zip(years.tolist(), counts.tolist()))
+            categories = self._categories(by)
+            codes = self._np("types" if by == "type" else "countries")[rows[mask]]
+            return self._to_dict(categories, numpy.bincount(codes, minlength=len(categories.values)))
+        categories = None if by == "year" else self._categories(by)
+        if categories is not None and year is None and day is None and current is None:
+            # Per-league season counts are enough, no need to visit the seasons
+            per_league = self.season_counts
+        else:
+            per_league = [0] * len(self)
+            years = Counter()
+            for row, season_year, start, end, is_current in zip(self.season_league, self.season_year,
+                                                                self.season_start, self.season_end,
+                                                                self.season_current):
+                if not league_mask[row] or (year is not None and season_year != year) \
+                        or (day is not None and not start <= day <= end) \
+                        or (current is not None and bool(is_current) != bool(current)):
+                    continue
+                per_league[row] += 1
+                years[season_year] += 1
+            if categories is None:
+                return dict(years)
+        counter = Counter()
+        for code, selected, count in zip(categories.codes, league_mask, per_league):
+            if selected and count:
+                counter[code] += count
+        return {categories.values[code]: count for code, count in counter.items()}
+
+    def _categories(self, by):
+        if by == "type":
+            return self.types
+        if by == "country":
+            return self.countries
+        raise ValueError(f"Unsupported group-by column: {by}")
+
+    @staticmethod
+    def _to_dict(categories, counts):
+        return {categories.values[code]: count for code, count in enumerate(counts.tolist()) if count}
@@ -1,4 +1,6 @@
 import csv
+import itertools
+import os
 from football_client.base_serializer import BaseSerializer
 
 
@@ -7,6 +9,11 @@ class CsvSerializer(BaseSerializer):
     Serialize data to CSV ot TSV
     """
 
+    COMPRESSIBLE = True
+    # Rows per writerows() call and size of the file buffer
+    CHUNK_ROWS = 4096
+    BUFFER_SIZE = 1024 * 1024
+
     def __init__(self, data_dir, file_name, settings=None):
         """
         :param data_dir: normally ~/.football_client/data
@@ -19,34 +26,70 @@ class CsvSerializer(BaseSerializer):
         assert settings is None or "delimiter" in settings, "delimiter must be specified in settings"
         super().__init__(data_dir, file_name, settings=settings)
 
-    def write(self, data):
+    def write(self, data, append=False):
         """
         Serialize data to CSV or TSV
-        :param data:
-        :return:
+        :param data: any iterable of items, e.g. a generator, consumed chunk by chunk
+        :param append: append rows to the existing file, the header is written only to a new or empty file
         """
         headers = self.settings.get("headers", [])
         columns = self.settings.get("columns", [])
         delimiter = self.settings.get("delimiter", "\t")
-        with open(self.serialized_file, "w", newline="", encoding="utf-8") as tsv_file:
+        write_header = not (append and os.path.isfile(self.serialized_file) and os.path.getsize(self.serialized_file))
+        # A new file replaces the previous one atomically, appended rows go to the file in place
+        if append:
+            tsv_open = self.open_file(self.serialized_file, "a", newline="", encoding="utf-8",
+                                      buffering=self.BUFFER_SIZE)
+        else:
+            tsv_open = self.write_file(self.serialized_file, newline="", encoding="utf-8", buffering=self.BUFFER_SIZE)
+        with tsv_open as tsv_file:
             writer = csv.writer(tsv_file, delimiter=delimiter)
             # Write header
-            writer.writerow(headers)
+            if write_header:
+                writer.writerow(headers)
             # Write data
-            for item in data:
-                # Default behavior: write columns as is
-                writer.writerow([item.get(col, "") for col in columns])
+            rows = (self._to_row(item, columns) for item in data)
+            while True:
+                chunk = list(itertools.islice(rows, self.CHUNK_ROWS))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
         print("Serialized data to TSV.")
 
-    def read(self):
+    @staticmethod
+    def _to_row(item, columns):
+        """
+        Default behavior: write columns as is
+        """
+        return [item.get(col, "") for col in columns]
+
+    def iter_rows(self, columns=None):
+        """
+        Lazily read serialized data from CSV or TSV
+        :param columns: header names to keep, all columns by default
+        :return: generator of dict
+        """
+        delimiter = self.settings.get("delimiter", "\t")
+        with self.open_file(self.serialized_file, "r", newline="", encoding="utf-8",
+                            buffering=self.BUFFER_SIZE) as tsv_file:
+            reader = csv.reader(tsv_file, delimiter=delimiter)
+            headers = next(reader, [])
+            if columns is None:
+                columns = headers
+            missing = set(columns) - set(headers)
+            if missing:
+                raise KeyError(f"Unknown columns: {', '.join(sorted(missing))}")
+            positions = [headers.index(col) for col in columns]
+            for row in reader:
+                yield {col: row[pos] if pos < len(row) else None for col, pos in zip(columns, positions)}
+
+    def read(self, columns=None):
         """
         Read serialized data from CSV or TSV
+        :param columns: header names to keep, all columns by default
         :return: list
         """
-        delimiter = self.settings.get("delimiter", "\t")
-        with open(self.serialized_file, "r", newline="", encoding="utf-8") as tsv_file:
-            reader = csv.DictReader(tsv_file, delimiter=delimiter)
-            return [row for row in reader]
+        return list(self.iter_rows(columns=columns))
 
     @staticmethod
     def get_extension():
@@ -72,25 +115,60 @@ class LeaguesCsvSerializer(CsvSerializer):
         }
         super().__init__(data_dir, file_name="leagues", settings=leagues_settings)
 
-    def write(self, data):
+    @staticmethod
+    def _to_row(item, columns):
         """
-        Overload for leagues
-        :param data:
-        :return:
+        Overloaded behavior: write seasons as comma-separated list
         """
-        headers = self.settings.get("headers", [])
-        delimiter = self.settings.get("delimiter", "\t")
-        with open(self.serialized_file, "w", newline="", encoding="utf-8") as tsv_file:
-            writer = csv.writer(tsv_file, delimiter=delimiter)
-            # Write header
-            writer.writerow(headers)
-            # Write data
-            for item in data:
-                # Overloaded behavior: write seasons as comma-separated list
-                writer.writerow([
-                    item["id"],
-                    item["name"],
-                    item["type"],
-                    item["country"], ", ".join(map(str, item["seasons"]))
-                ])
-        print("Serialized data to TSV.")
+        return [item["id"], item["name"], item["type"], item["country"], ", ".join(map(str, item["seasons"]))]
+
+
+class TeamsCsvSerializer(CsvSerializer):
+    """
+    Serialize teams data to CSV or TSV
+    """
+
+    def __init__(self, data_dir):
+        teams_settings = {
+            "headers": ["ID", "Name", "Code", "Country", "Founded", "Venue", "City"],
+            "columns": ["id", "name", "code", "country", "founded", "venue", "city"],
+            "delimiter": "\t"
+        }
+        super().__init__(data_dir, file_name="teams", settings=teams_settings)
+
+    @staticmethod
+    def _to_row(item, columns):
+        """
+        Overloaded behavior: flatten API team record
+        """
+        team = item["team"]
+        venue = item.get("venue") or {}
+        return [team["id"], team["name"], team.get("code") or "", team.get("country") or "",
+                team.get("founded") or "", venue.get("name") or "", venue.get("city") or ""]
+
+
+class PlayersCsvSerializer(CsvSerializer):
+    """
+    Serialize players data to CSV or TSV
+    """
+
+    def __init__(self, data_dir):
+        players_settings = {
+            "headers": ["ID", "Name", "Age", "Nationality", "Team", "Position", "Appearances", "Goals"],
+            "columns": ["id", "name", "age", "nationality", "team", "position", "appearances", "goals"],
+            "delimiter": "\t"
+        }
+        super().__init__(data_dir, file_name="players", settings=players_settings)
+
+    @staticmethod
+    def _to_row(item, columns):
+        """
+        Overloaded behavior: flatten API player record, statistics of the first team
+        """
+        player = item["player"]
+        statistics = (item.get("statistics") or [{}])[0]
+        games = statistics.get("games") or {}
+        goals = statistics.get("goals") or {}
+        return [player["id"], player["name"], player.get("age") or "", player.get("nationality") or "",
+                (statistics.get("team") or {}).get("name", ""), games.get("position") or "",
+                games.get("appearences") or 0, goals.get("total") or 0]
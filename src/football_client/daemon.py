@@ -0,0 +1,160 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+from football_client.errors import ApiError
+from football_client.response_cache import STALE
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """
+    Lookups over keep-alive HTTP/1.1, every response is {"result": ...} or {"errors": ...}
+
+    GET /league?id=39 or /league?name=Bundesliga
+    GET /country?name=England or /country?code=GB
+    GET /seasons?league=39
+    GET /stats
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Small responses, don't wait for delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        route = self.server.routes.get(url.path)
+        if route is None:
+            self._reply(404, {"errors": {"endpoint": f"Unknown endpoint {url.path}"}})
+            return
+        try:
+            self._reply(200, {"result": route(params)})
+        except (KeyError, ValueError) as e:
+            self._reply(400, {"errors": {"parameters": f"Bad parameters: {e}"}})
+        except ApiError as e:
+            self._reply(502, {"errors": e.errors})
+        except Exception as e:
+            # Keep the connection usable, the client gets the error instead of a dropped connection
+            self._reply(500, {"errors": {"server": f"{type(e).__name__}: {e}"}})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    Local query daemon keeping a World with its payloads and indexes hot in memory
+    Every client connection is served by its own thread
+    """
+
+    daemon_threads = True
+    # Seconds between freshness checks of an entity, stale data is refreshed in the background
+    REVALIDATE_INTERVAL = 1.0
+
+    def __init__(self, world, host="127.0.0.1", port=0):
+        """
+        :param world: World serving the lookups, normally World.shared()
+        :param host: interface to listen on, localhost only by default
+        :param port: 0 to pick a free port
+        """
+        self.world = world
+        # Entity -> time.monotonic() of its last freshness check
+        self._checked = {}
+        self._checked_lock = threading.Lock()
+        self.routes = {
+            "/league": self.league,
+            "/country": self.country,
+            "/seasons": self.seasons,
+            "/stats": self.stats,
+        }
+        super().__init__((host, port), QueryHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def warm_up(self):
+        """
+        Load the payloads and build the indexes before serving
+        """
+        self.world.find_league(league_id=0)
+        self.world.find_country(country_code="")
+
+    def revalidate(self, entity):
+        """
+        The bulk lookups skip the TTL checks: check the freshness at most every REVALIDATE_INTERVAL seconds,
+        so a long-running daemon refreshes stale data in the background while serving it
+        :param entity: leagues or countries
+        """
+        now = time.monotonic()
+        with self._checked_lock:
+            if now - self._checked.get(entity, float("-inf")) < self.REVALIDATE_INTERVAL:
+                return
+            self._checked[entity] = now
+        if self.world.cache.check(entity, entity, self.world.caching[entity]) == STALE:
+            self.world.refresh(entity, background=True)
+
+    def league(self, params):
+        league_id = int(params["id"]) if "id" in params else None
+        self.revalidate("leagues")
+        return self.world.find_league(league_id=league_id, league_name=params.get("name")) or None
+
+    def country(self, params):
+        self.revalidate("countries")
+        return self.world.find_country(country_name=params.get("name"), country_code=params.get("code")) or None
+
+    def seasons(self, params):
+        self.revalidate("leagues")
+        league = self.world.find_league(league_id=int(params["league"]))
+        return league["seasons"] if league else None
+
+    def stats(self, params):
+        return {"cache": self.world.cache.stats.as_dict(), "registry": self.world.registry.stats.as_dict()}
+
+
+class DaemonClient:
+    """
+    Thin client forwarding lookups to a running QueryServer
+    Offers the World bulk lookup methods, so it can stand in for World in the CLI
+    """
+
+    def __init__(self, url, pool_size=1):
+        """
+        :param url: host:port of the daemon
+        :param pool_size: keep-alive connections, one per concurrently querying thread
+        """
+        from football_client.transport import ConnectionPool
+        host, port = url.rsplit(":", 1)
+        self.transport = ConnectionPool(host, int(port), secure=False, pool_size=pool_size)
+
+    def _get(self, path, **params):
+        params = {name: value for name, value in params.items() if value is not None}
+        response = self.transport.request("GET", f"{path}?{urlencode(params)}")
+        if response.status != 200:
+            raise ApiError(response.data.get("errors") if response.data else {"daemon": f"HTTP {response.status}"})
+        return response.data["result"]
+
+    def find_league(self, league_id=None, league_name=None):
+        return self._get("/league", id=league_id, name=league_name) or {}
+
+    def find_country(self, country_name=None, country_code=None):
+        return self._get("/country", name=country_name, code=country_code) or {}
+
+    def get_seasons(self, league_id):
+        return self._get("/seasons", league=league_id) or []
+
+    def stats(self):
+        return self._get("/stats")
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,101 @@
+import json
+import os
+
+
+class ChangeLog:
+    """
+    Differences between two /leagues payloads, per league ID and per league season
+
+    Leagues are modified when their league or country details change; season changes (start, end, current
+    flag, coverage) are listed separately as (league ID, year) pairs.
+    """
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.modified = []
+        self.seasons_added = []
+        self.seasons_removed = []
+        self.seasons_modified = []
+        # League ID -> record of the new payload, for every added or changed league
+        self.records = {}
+        # Whether the payload envelope (results, paging, ...) changed
+        self.envelope_changed = False
+
+    def __bool__(self):
+        return bool(self.records or self.removed or self.envelope_changed)
+
+    @property
+    def changed(self):
+        """
+        :return: IDs of the leagues to be written, added ones included, in the new payload order
+        """
+        return list(self.records)
+
+    def as_dict(self):
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "modified": self.modified,
+            "seasons_added": self.seasons_added,
+            "seasons_removed": self.seasons_removed,
+            "seasons_modified": self.seasons_modified,
+        }
+
+    def summary(self):
+        return ", ".join(f"{len(items)} {name.replace('_', ' ')}" for name, items in self.as_dict().items())
+
+    def append_to(self, path, **fields):
+        """
+        Append the change log to a JSON lines file, for consumers processing just the deltas
+        :param fields: extra fields of the line, e.g. synced_at
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "a") as log_file:
+            log_file.write(json.dumps(dict(fields, **self.as_dict())))
+            log_file.write("\n")
+
+
+def _by_id(payload):
+    leagues = {}
+    for lg in (payload or {}).get("response", []):
+        leagues.setdefault(lg["league"]["id"], lg)
+    return leagues
+
+
+def diff_leagues(previous, current):
+    """
+    :param previous: cached /leagues payload, empty if there is none
+    :param current: freshly fetched /leagues payload
+    :return: ChangeLog
+    """
+    changes = ChangeLog()
+    old = _by_id(previous)
+    new = _by_id(current)
+    changes.envelope_changed = {key: value for key, value in (previous or {}).items() if key != "response"} != \
+        {key: value for key, value in current.items() if key != "response"}
+    changes.removed = [league_id for league_id in old if league_id not in new]
+    for lg in old.values():
+        if lg["league"]["id"] not in new:
+            changes.seasons_removed += [(lg["league"]["id"], season["year"]) for season in lg["seasons"]]
+    for league_id, lg in new.items():
+        before = old.get(league_id)
+        if before is None:
+            changes.added.append(league_id)
+            changes.seasons_added += [(league_id, season["year"]) for season in lg["seasons"]]
+            changes.records[league_id] = lg
+            continue
+        if before == lg:
+            continue
+        changes.records[league_id] = lg
+        if before["league"] != lg["league"] or before["country"] != lg["country"]:
+            changes.modified.append(league_id)
+        old_seasons = {season["year"]: season for season in before["seasons"]}
+        new_seasons = {season["year"]: season for season in lg["seasons"]}
+        changes.seasons_removed += [(league_id, year) for year in old_seasons if year not in new_seasons]
+        for year, season in new_seasons.items():
+            if year not in old_seasons:
+                changes.seasons_added.append((league_id, year))
+            elif old_seasons[year] != season:
+                changes.seasons_modified.append((league_id, year))
+    return changes
@@ -0,0 +1,20 @@
+class ApiError(Exception):
+    """
+    API responded with errors
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"API Error: {errors}")
+
+
+class RateLimitError(ApiError):
+    """
+    Requests are still throttled after all retries
+    """
+
+
+class QuotaExceededError(ApiError):
+    """
+    Daily request quota is exhausted, retrying before the quota reset is pointless
+    """
@@ -0,0 +1,122 @@
+import contextlib
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, FileLock only serializes the threads of the process there
+    fcntl = None
+
+
+def _proc_umask():
+    """
+    :return: the process umask as reported by procfs (Linux 4.7+), None where it isn't
+    """
+    try:
+        with open("/proc/self/status") as status:
+            return next((int(line.split()[1], 8) for line in status if line.startswith("Umask:")), None)
+    except OSError:
+        return None
+
+
+def _initial_umask():
+    umask = _proc_umask()
+    if umask is None:
+        # Elsewhere the umask can only be read by setting it, which affects every thread: done once, at import
+        umask = os.umask(0)
+        os.umask(umask)
+    return umask
+
+
+_PROC_UMASK = _proc_umask() is not None
+_IMPORT_UMASK = _initial_umask()
+
+
+def _umask():
+    """
+    :return: the current process umask, the one at import time where procfs doesn't report it
+    """
+    umask = _proc_umask() if _PROC_UMASK else None
+    return _IMPORT_UMASK if umask is None else umask
+
+
+# Lock file path -> threading.Lock shared by all FileLock instances of the path
+_thread_locks = {}
+_thread_locks_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w", codec=None, **kwargs):
+    """
+    Write a file through a temporary file in the same directory, renamed over the target on success
+    Readers see either the previous or the complete new file, never a partially written one
+    :param path: target file
+    :param mode: "w" or "wb"
+    :param codec: compression.Codec compressing the written data as it is written
+    :param kwargs: further open() arguments, e.g. encoding or newline
+    :return: file object of the temporary file
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file private (0600), give it the mode open() would, for processes sharing the directory
+        os.chmod(temp_path, 0o666 & ~_umask())
+        if codec is None:
+            with os.fdopen(fd, mode, **kwargs) as temp_file:
+                yield temp_file
+        else:
+            with os.fdopen(fd, "wb") as temp_file, codec.open(temp_file, mode, **kwargs) as stream:
+                yield stream
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+class FileLock:
+    """
+    Advisory exclusive lock on a lock file, serializing processes sharing a data directory and threads
+    within a process. Blocks until the lock is available. Not reentrant.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: lock file, created if missing, e.g. ~/.football_client/data/.leagues.lock
+        """
+        self.path = path
+        self._file = None
+        with _thread_locks_lock:
+            self._thread_lock = _thread_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "a")
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            self._close()
+            raise
+
+    def release(self):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._close()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
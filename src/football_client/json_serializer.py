@@ -3,11 +3,34 @@ import json
 from football_client.base_serializer import BaseSerializer
 
 
+class JsonArrayWriter:
+    """
+    Write a JSON array item by item, same output as json.dump(list(items), indent=4) nested at the given depth
+    """
+
+    def __init__(self, json_file, depth=0):
+        self.json_file = json_file
+        self.indent = "\n" + "    " * (depth + 1)
+        self.end = "\n" + "    " * depth + "]"
+        self.separator = "["
+
+    def append(self, item):
+        # JSON strings never contain raw newlines, so re-indenting by lines is safe
+        item_json = json.dumps(item, indent=4).replace("\n", self.indent)
+        self.json_file.write(f"{self.separator}{self.indent}{item_json}")
+        self.separator = ","
+
+    def close(self):
+        self.json_file.write("[]" if self.separator == "[" else self.end)
+
+
 class JsonSerializer(BaseSerializer):
     """
     Serialize data to JSON
     """
 
+    COMPRESSIBLE = True
+
     def __init__(self, data_dir, file_name, settings):
         """
         :param data_dir: normally ~/.football_client/data
@@ -19,11 +42,25 @@ class JsonSerializer(BaseSerializer):
     def write(self, data):
         """
         Serialize data to JSON
+        :param data: dict or list, any other iterable is streamed as a JSON array item by item
         """
-        with open(self.serialized_file, "w") as json_file:
-            json.dump(data, json_file, indent=4)
+        with self.write_file(self.serialized_file) as json_file:
+            if isinstance(data, (dict, list)):
+                json.dump(data, json_file, indent=4)
+            else:
+                self._dump_iterable(data, json_file)
         print(f"Serialized data to {self.serialized_file}")
 
+    @staticmethod
+    def _dump_iterable(items, json_file):
+        """
+        Same output as json.dump(list(items), indent=4) without materializing the list
+        """
+        array = JsonArrayWriter(json_file)
+        for item in items:
+            array.append(item)
+        array.close()
+
     def read(self):
         """
         Read serialized data from JSON
@@ -32,7 +69,7 @@ class JsonSerializer(BaseSerializer):
         data = {}
         if not os.path.exists(self.serialized_file):
             return data
-        with open(self.serialized_file, "r") as json_file:
+        with self.open_file(self.serialized_file, "r") as json_file:
             data = json.load(json_file)
         return data
 
@@ -47,6 +84,10 @@ class JsonSerializer(BaseSerializer):
 class LeaguesJsonSerializer(JsonSerializer):
     """
     Serialize leagues data to JSON and additional simplified files
+
+    The leagues are traversed once: each league is streamed to the full, simplified leagues and simplified
+    seasons files as it is visited, without building the simplified lists. All three files are replaced
+    atomically, the output is the same as of json.dump(..., indent=4).
     """
 
     def __init__(self, data_dir):
@@ -54,43 +95,68 @@ class LeaguesJsonSerializer(JsonSerializer):
 
     def write(self, data):
         """
-        Serialize leagues data to JSON and additional simplified files
+        Serialize leagues data to JSON and additional simplified files, compressed with the same codec
         """
-        super().write(data)  # Call the base class write method
+        leagues_simplified_file = self.compressed_path(os.path.join(self.data_dir, "leagues_simplified.json"))
+        seasons_simplified_file = self.compressed_path(os.path.join(self.data_dir, "seasons_simplified.json"))
+        with self.write_file(self.serialized_file) as json_file, \
+                self.write_file(leagues_simplified_file) as leagues_json_f, \
+                self.write_file(seasons_simplified_file) as seasons_json_f:
+            leagues = JsonArrayWriter(leagues_json_f)
+            seasons = JsonArrayWriter(seasons_json_f)
 
-        leagues_simplified_file = os.path.join(self.data_dir, "leagues_simplified.json")
-        seasons_simplified_file = os.path.join(self.data_dir, "seasons_simplified.json")
-        with open(leagues_simplified_file, "w") as leagues_json_f:
-            json.dump(self._write_leagues(data), leagues_json_f, indent=4)
+            def project(lg):
+                leagues.append(self._simplify_league(lg))
+                for season in lg["seasons"]:
+                    seasons.append(self._simplify_season(lg, season))
+
+            self._dump_payload(data, json_file, on_record=project)
+            leagues.close()
+            seasons.close()
+        print(f"Serialized data to {self.serialized_file}")
         print(f"Serialized simplified leagues data to {leagues_simplified_file}")
-        with open(seasons_simplified_file, "w") as seasons_json_f:
-            json.dump(self._write_seasons(data), seasons_json_f, indent=4)
         print(f"Serialized simplified seasons data to {seasons_simplified_file}")
 
     @staticmethod
-    def _write_leagues(leagues_data):
-        simplified_leagues = []
-        for lg in leagues_data["response"]:
-            simplified_leagues.append({
-                "id": lg["league"]["id"],
-                "name": lg["league"]["name"],
-                "type": lg["league"]["type"],
-                "country": lg["country"]["name"],
-                "seasons": [season["year"] for season in lg["seasons"]],
-            })
-        return simplified_leagues
+    def _dump_payload(payload, json_file, on_record):
+        """
+        Same output as json.dump(payload, indent=4): the envelope fields are dumped one by one and the records of
+        payload["response"] streamed, calling on_record for every record as it is written
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get("response"), list):
+            json.dump(payload, json_file, indent=4)
+            return
+        separator = "{"
+        for key, value in payload.items():
+            json_file.write(f"{separator}\n    {json.dumps(key)}: ")
+            if key == "response":
+                records = JsonArrayWriter(json_file, depth=1)
+                for record in value:
+                    records.append(record)
+                    on_record(record)
+                records.close()
+            else:
+                json_file.write(json.dumps(value, indent=4).replace("\n", "\n    "))
+            separator = ","
+        json_file.write("\n}")
+
+    @staticmethod
+    def _simplify_league(lg):
+        return {
+            "id": lg["league"]["id"],
+            "name": lg["league"]["name"],
+            "type": lg["league"]["type"],
+            "country": lg["country"]["name"],
+            "seasons": [season["year"] for season in lg["seasons"]],
+        }
 
     @staticmethod
-    def _write_seasons(leagues_data):
-        seasons = []
-        for lg in leagues_data["response"]:
-            for season in lg["seasons"]:
-                seasons.append({
-                    "id": lg["league"]["id"],
-                    "name": lg["league"]["name"],
-                    "country": lg["country"]["name"],
-                    "year": season["year"],
-                    "start": season["start"],
-                    "end": season["end"]
-                })
-        return seasons
+    def _simplify_season(lg, season):
+        return {
+            "id": lg["league"]["id"],
+            "name": lg["league"]["name"],
+            "country": lg["country"]["name"],
+            "year": season["year"],
+            "start": season["start"],
+            "end": season["end"]
+        }
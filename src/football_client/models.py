@@ -0,0 +1,176 @@
+import sys
+
+
+def _intern(value):
+    """
+    Intern repeated strings (country names, league types, season dates), so all records share one copy
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Model:
+    """
+    Base of the slotted model classes: no per-instance __dict__, fields are the __slots__
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name)
+                                                 for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Country(Model):
+    __slots__ = ("name", "code", "flag")
+
+    def __init__(self, name, code=None, flag=None):
+        self.name = _intern(name)
+        self.code = _intern(code)
+        self.flag = flag
+
+    @classmethod
+    def from_dict(cls, country):
+        """
+        :param country: /countries record or the country of a /leagues record
+        """
+        return cls(country["name"], country.get("code"), country.get("flag"))
+
+
+class Season(Model):
+    __slots__ = ("year", "start", "end", "current")
+
+    def __init__(self, year, start=None, end=None, current=False):
+        self.year = year
+        self.start = _intern(start)
+        self.end = _intern(end)
+        self.current = current
+
+    @classmethod
+    def from_dict(cls, season):
+        return cls(season["year"], season.get("start"), season.get("end"), season.get("current", False))
+
+
+class League(Model):
+    """
+    League of the /leagues payload
+    Unlike api_client.League, country is a Country and seasons are Season objects
+    """
+
+    __slots__ = ("id", "name", "type", "logo", "country", "seasons")
+
+    def __init__(self, league_id, name, league_type=None, logo=None, country=None, seasons=()):
+        """
+        :param country: Country
+        :param seasons: tuple of Season
+        """
+        self.id = league_id
+        self.name = name
+        self.type = _intern(league_type)
+        self.logo = logo
+        self.country = country
+        self.seasons = seasons
+
+    @classmethod
+    def from_dict(cls, lg, countries=None):
+        """
+        :param lg: /leagues record
+        :param countries: dict of country name -> Country shared by the converted leagues
+        """
+        country = countries.get(lg["country"]["name"]) if countries is not None else None
+        if country is None:
+            country = Country.from_dict(lg["country"])
+            if countries is not None:
+                countries[country.name] = country
+        return cls(lg["league"]["id"], lg["league"]["name"], lg["league"]["type"], lg["league"].get("logo"),
+                   country, tuple(Season.from_dict(season) for season in lg["seasons"]))
+
+    @property
+    def current_season(self):
+        """
+        :return: Season, None if no season is current
+        """
+        return next((season for season in self.seasons if season.current), None)
+
+
+class Team(Model):
+    __slots__ = ("id", "name", "code", "country", "founded", "national", "logo")
+
+    def __init__(self, team_id, name, code=None, country=None, founded=None, national=False, logo=None):
+        self.id = team_id
+        self.name = name
+        self.code = code
+        self.country = _intern(country)
+        self.founded = founded
+        self.national = national
+        self.logo = logo
+
+    @classmethod
+    def from_dict(cls, record):
+        """
+        :param record: /teams record
+        """
+        team = record["team"]
+        return cls(team["id"], team["name"], team.get("code"), team.get("country"), team.get("founded"),
+                   team.get("national", False), team.get("logo"))
+
+
+class Player(Model):
+    __slots__ = ("id", "name", "firstname", "lastname", "age", "nationality", "photo")
+
+    def __init__(self, player_id, name, firstname=None, lastname=None, age=None, nationality=None, photo=None):
+        self.id = player_id
+        self.name = name
+        self.firstname = firstname
+        self.lastname = lastname
+        self.age = age
+        self.nationality = _intern(nationality)
+        self.photo = photo
+
+    @classmethod
+    def from_dict(cls, record):
+        """
+        :param record: /players record
+        """
+        player = record["player"]
+        return cls(player["id"], player["name"], player.get("firstname"), player.get("lastname"), player.get("age"),
+                   player.get("nationality"), player.get("photo"))
+
+
+def leagues_from_payload(leagues):
+    """
+    :param leagues: /leagues payload
+    :return: list of League, leagues of one country share its Country
+    """
+    countries = {}
+    return [League.from_dict(lg, countries) for lg in leagues.get("response", [])]
+
+
+def countries_from_payload(countries):
+    """
+    :param countries: /countries payload
+    :return: list of Country
+    """
+    return [Country.from_dict(country) for country in countries.get("response", [])]
+
+
+def leagues_model_payload(leagues):
+    """
+    :param leagues: /leagues payload
+    :return: {"response": list of League}, kept by World(models=True) instead of the payload
+    """
+    return {"response": leagues_from_payload(leagues)}
+
+
+def countries_model_payload(countries):
+    """
+    :param countries: /countries payload
+    :return: {"response": list of Country}, kept by World(models=True) instead of the payload
+    """
+    return {"response": countries_from_payload(countries)}
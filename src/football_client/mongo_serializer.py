@@ -0,0 +1,344 @@
+import itertools
+import threading
+import uuid
+from football_client.base_serializer import BaseSerializer
+from football_client.settings import settings as client_settings
+
+try:
+    import pymongo
+    from pymongo import ASCENDING, ReplaceOne
+except ImportError:
+    pymongo = None
+
+# Connection string -> MongoClient, clients are thread-safe and keep their own connection pools
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(uri=None):
+    """
+    Shared client for the connection string
+    mongomock:// strings connect to the in-memory mongomock stand-in instead of a server, e.g. in tests
+    :param uri: e.g. mongodb://localhost:27017/football_client, settings.mongo_uri by default
+    :return: MongoClient
+    """
+    uri = uri or client_settings.mongo_uri
+    if pymongo is None:
+        raise ImportError("The mongo serializer requires pymongo: pip install pymongo")
+    with _clients_lock:
+        if uri not in _clients:
+            if uri.startswith("mongomock://"):
+                import mongomock
+                _clients[uri] = mongomock.MongoClient("mongodb://" + uri[len("mongomock://"):])
+            else:
+                _clients[uri] = pymongo.MongoClient(uri, serverSelectionTimeoutMS=5000)
+        return _clients[uri]
+
+
+class MongoSerializer(BaseSerializer):
+    """
+    Store records in a MongoDB collection named after the entity
+
+    Every record is a document identified by its KEY, inserted in unordered bulk_write batches into a new
+    collection, which then replaces the current one by a rename, so readers never see a partially written
+    collection. The payload envelope (results, paging, ...) is kept in the payloads collection, so read() returns
+    the data in the shape it was written.
+    """
+
+    BATCH_SIZE = 1000
+    # Dotted path of the record field identifying it, None identifies records by position
+    KEY = None
+    # Indexed fields, lookups in find() must go through one of them
+    INDEXES = ()
+    # find() criteria -> field, e.g. league_id -> league.id
+    FIELDS = {}
+    # Collections derived from the records, see _on_batch(), replaced together with the records
+    DERIVED = ()
+    PAYLOADS = "payloads"
+
+    def __init__(self, data_dir, file_name, settings=None):
+        """
+        :param data_dir: normally ~/.football_client/data, not used for storage
+        :param file_name: collection name, e.g., leagues
+        :param settings: dict, uri: connection string, settings.mongo_uri by default
+        """
+        super().__init__(data_dir, file_name, settings=settings)
+        self.collection_name = file_name
+        self._database = None
+
+    @property
+    def database(self):
+        """
+        Database named in the connection string, indexes are created on first use
+        """
+        if self._database is None:
+            database = get_client(self.settings.get("uri")).get_default_database("football_client")
+            self._create_indexes({name: database[name] for name in (self.collection_name,) + self.DERIVED})
+            self._database = database
+        return self._database
+
+    @property
+    def collection(self):
+        return self.database[self.collection_name]
+
+    def _create_indexes(self, collections):
+        """
+        :param collections: dict of collection name -> Collection, the records collection and the DERIVED ones
+        """
+        collection = collections[self.collection_name]
+        collection.create_index([("_pos", ASCENDING)])
+        for field in self.INDEXES:
+            collection.create_index([(field, ASCENDING)])
+
+    @staticmethod
+    def get_extension():
+        """
+        Get the file extension for the serialized data format (e.g., "json", "tsv")
+        """
+        return "mongo"
+
+    @staticmethod
+    def _get_field(record, path):
+        for name in path.split("."):
+            record = record[name]
+        return record
+
+    def _document_id(self, record, pos):
+        return self._get_field(record, self.KEY) if self.KEY else pos
+
+    def write(self, data):
+        """
+        Write records to new collections replacing the current ones
+        :param data: payload dict with the records in "response", list or any other iterable of records
+        """
+        envelope = None
+        records = data
+        if isinstance(data, dict):
+            envelope = {key: value for key, value in data.items() if key != "response"}
+            records = data.get("response", [])
+        database = self.database
+        suffix = f"writing-{uuid.uuid4().hex}"
+        targets = {name: database[f"{name}.{suffix}"] for name in (self.collection_name,) + self.DERIVED}
+        try:
+            self._create_indexes(targets)
+            written = self._write_documents(targets, records)
+            for name, target in targets.items():
+                # Atomic replacement, the indexes move along
+                target.rename(name, dropTarget=True)
+        except BaseException:
+            for target in targets.values():
+                target.drop()
+            raise
+        database[self.PAYLOADS].replace_one({"_id": self.collection_name}, {"envelope": envelope, "count": written},
+                                            upsert=True)
+        print(f"Serialized {written} records to {self.collection.full_name}")
+
+    def _write_documents(self, collections, records):
+        """
+        :param collections: dict of collection name -> Collection written to
+        :return: number of written records
+        """
+        written = 0
+        records = iter(records)
+        while True:
+            batch = list(itertools.islice(records, self.BATCH_SIZE))
+            if not batch:
+                return written
+            requests = []
+            for pos, record in enumerate(batch, start=written):
+                document = dict(record, _pos=pos)
+                document_id = self._document_id(record, pos)
+                requests.append(ReplaceOne({"_id": document_id}, document, upsert=True))
+            collections[self.collection_name].bulk_write(requests, ordered=False)
+            self._on_batch(batch, collections)
+            written += len(batch)
+
+    def _on_batch(self, records, collections):
+        """
+        Called after every written batch, for the DERIVED collections
+        :param collections: dict of collection name -> Collection written to
+        """
+
+    @staticmethod
+    def _to_record(document):
+        document.pop("_id", None)
+        document.pop("_pos", None)
+        return document
+
+    def exists(self):
+        return self.database[self.PAYLOADS].find_one({"_id": self.collection_name}, {"_id": 1}) is not None
+
+    def read(self):
+        """
+        Read the records in the written order
+        :return: dict or list in the written shape, {} if nothing was written
+        """
+        payload = self.database[self.PAYLOADS].find_one({"_id": self.collection_name})
+        if payload is None:
+            return {}
+        records = [self._to_record(document) for document in self.collection.find().sort("_pos", ASCENDING)]
+        if payload["envelope"] is None:
+            return records
+        return dict(payload["envelope"], response=records)
+
+    def find(self, **criteria):
+        """
+        Indexed lookup of the first written record matching any of the criteria
+        :param criteria: keys of FIELDS, e.g. league_id=39
+        :return: matching record, {} if nothing matches, None if nothing was written
+        """
+        conditions = [{self.FIELDS[name]: value} for name, value in criteria.items() if value]
+        if not conditions or self.database[self.PAYLOADS].find_one({"_id": self.collection_name}) is None:
+            return None
+        document = self.collection.find_one({"$or": conditions}, sort=[("_pos", ASCENDING)])
+        return self._to_record(document) if document else {}
+
+
+class LeaguesMongoSerializer(MongoSerializer):
+    """
+    Leagues collection, plus seasons: one document per league season, indexed by league ID and year
+    """
+
+    KEY = "league.id"
+    INDEXES = ("league.id", "league.name", "country.code")
+    FIELDS = {"league_id": "league.id", "league_name": "league.name"}
+    DERIVED = ("seasons",)
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="leagues", settings=None)
+
+    def _create_indexes(self, collections):
+        super()._create_indexes(collections)
+        collections["seasons"].create_index([("league_id", ASCENDING), ("year", ASCENDING)])
+
+    def _on_batch(self, records, collections):
+        requests = []
+        for lg in records:
+            for season in lg["seasons"]:
+                document = {
+                    "league_id": lg["league"]["id"],
+                    "name": lg["league"]["name"],
+                    "country": lg["country"]["name"],
+                    "year": season["year"],
+                    "start": season["start"],
+                    "end": season["end"],
+                    "current": season.get("current", False),
+                }
+                requests.append(ReplaceOne({"_id": f"{lg['league']['id']}:{season['year']}"}, document, upsert=True))
+        if requests:
+            collections["seasons"].bulk_write(requests, ordered=False)
+
+    def apply_changes(self, data, changes):
+        """
+        Upsert and delete just the changed leagues and their seasons in place
+        Changed leagues keep their position, added ones are appended
+        """
+        if not self.exists():
+            return False
+        stale = changes.removed + changes.changed
+        if stale:
+            self.database.seasons.delete_many({"league_id": {"$in": stale}})
+        if changes.removed:
+            self.collection.delete_many({"_id": {"$in": changes.removed}})
+        positions = {document["_id"]: document["_pos"]
+                     for document in self.collection.find({"_id": {"$in": changes.changed}}, projection={"_pos": True})}
+        last = self.collection.find_one(sort=[("_pos", pymongo.DESCENDING)], projection={"_pos": True})
+        next_pos = last["_pos"] + 1 if last else 0
+        requests = []
+        for league_id, lg in changes.records.items():
+            if league_id not in positions:
+                positions[league_id] = next_pos
+                next_pos += 1
+            document = dict(lg, _pos=positions[league_id])
+            requests.append(ReplaceOne({"_id": league_id}, document, upsert=True))
+        if requests:
+            self.collection.bulk_write(requests, ordered=False)
+            self._on_batch(list(changes.records.values()), {"seasons": self.database.seasons})
+        self.database[self.PAYLOADS].update_one(
+            {"_id": self.collection_name},
+            {"$set": {"envelope": {key: value for key, value in data.items() if key != "response"},
+                      "count": len(data.get("response", []))}})
+        print(f"Applied {len(changes.records)} changed and {len(changes.removed)} removed leagues "
+              f"to {self.collection.full_name}")
+        return True
+
+    def find_seasons(self, league_id):
+        """
+        :param league_id: e.g. 39
+        :return: list of seasons of the league, by year
+        """
+        documents = self.database.seasons.find({"league_id": league_id}, projection={"_id": False})
+        return list(documents.sort("year", ASCENDING))
+
+
+class CountriesMongoSerializer(MongoSerializer):
+    """
+    Countries collection, the name identifies a country: code is null for international "countries"
+    """
+
+    KEY = "name"
+    INDEXES = ("name", "code")
+    FIELDS = {"country_name": "name", "country_code": "code"}
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="countries", settings=None)
+
+
+class TeamsMongoSerializer(MongoSerializer):
+    KEY = "team.id"
+    INDEXES = ("team.id", "team.name")
+    FIELDS = {"team_id": "team.id", "team_name": "team.name"}
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="teams", settings=None)
+
+
+class PlayersMongoSerializer(MongoSerializer):
+    KEY = "player.id"
+    INDEXES = ("player.id", "player.name")
+    FIELDS = {"player_id": "player.id", "player_name": "player.name"}
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="players", settings=None)
+
+
+class MongoResponseSerializer(MongoSerializer):
+    """
+    Response of a parameterized query, one document of the responses collection keyed by the cache key,
+    instead of a collection per query
+    """
+
+    def __init__(self, data_dir, key):
+        """
+        :param key: cache_key() with parameters, e.g. leagues?country=England
+        """
+        super().__init__(data_dir, file_name="responses", settings=None)
+        self.key = key
+
+    def _create_indexes(self, collections):
+        """
+        Responses are looked up by _id only
+        """
+
+    def write(self, data):
+        """
+        Replace the response document, atomically
+        :param data: payload dict, list or any other iterable of records
+        """
+        if not isinstance(data, (dict, list)):
+            data = list(data)
+        self.collection.replace_one({"_id": self.key}, {"data": data}, upsert=True)
+        print(f"Serialized {self.key} to {self.collection.full_name}")
+
+    def exists(self):
+        return self.collection.find_one({"_id": self.key}, {"_id": 1}) is not None
+
+    def read(self):
+        """
+        :return: dict or list in the written shape, {} if nothing was written
+        """
+        document = self.collection.find_one({"_id": self.key})
+        return document["data"] if document else {}
+
+    def find(self, **criteria):
+        return None
@@ -0,0 +1,56 @@
+class Paginator:
+    """
+    Stream records of a paginated endpoint, e.g. /players?league=39&season=2023
+
+    Pages are requested one ahead: the next page is fetched in a background thread while the records
+    of the current one are consumed, and at most two pages are held in memory at a time.
+    """
+
+    def __init__(self, fetch_page, prefetch=True):
+        """
+        :param fetch_page: callable(page number) -> payload with "paging" and "response"
+        :param prefetch: fetch the next page while the current one is processed
+        """
+        self.fetch_page = fetch_page
+        self.prefetch = prefetch
+        # Progress counters, updated while iterating
+        self.pages = 0
+        self.count = 0
+
+    def iter_pages(self):
+        """
+        :return: generator of page payloads
+        """
+        if not self.prefetch:
+            page = 1
+            while page:
+                payload = self.fetch_page(page)
+                page = self._next_page(payload)
+                yield payload
+            return
+
+        # Imported here, concurrent.futures is a noticeable part of the CLI start-up
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="football_client_prefetch") as executor:
+            pending = executor.submit(self.fetch_page, 1)
+            while pending:
+                payload = pending.result()
+                next_page = self._next_page(payload)
+                pending = executor.submit(self.fetch_page, next_page) if next_page else None
+                yield payload
+
+    def __iter__(self):
+        for payload in self.iter_pages():
+            self.pages += 1
+            for record in payload.get("response", []):
+                self.count += 1
+                yield record
+
+    @staticmethod
+    def _next_page(payload):
+        """
+        :return: next page number or None on the last page
+        """
+        paging = payload.get("paging") or {}
+        current = paging.get("current", 1)
+        return current + 1 if current < paging.get("total", 1) else None
@@ -0,0 +1,50 @@
+import threading
+
+
+class PartialPayload:
+    """
+    Records of an entity merged from filtered API requests, used while the complete payload isn't cached
+
+    Every filtered response is complete for its filter, e.g. /leagues?country=England holds all English leagues,
+    so the merged requests are tracked and repeating one is answered from here. Records are merged by ID,
+    keeping the first copy; the merged responses themselves are never modified, they may be shared.
+    """
+
+    def __init__(self, record_id):
+        """
+        :param record_id: callable(record) -> ID of the record, e.g. the league ID
+        """
+        self._record_id = record_id
+        self.records = []
+        self._ids = set()
+        # cache_key() of every merged request
+        self.complete_for = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        """
+        :param key: cache_key() of a filtered request
+        :return: True if the request was merged, the records matching its filter are all here
+        """
+        return key in self.complete_for
+
+    def merge(self, key, payload):
+        """
+        :param key: cache_key() of the filtered request
+        :param payload: its response payload
+        """
+        with self._lock:
+            for record in payload.get("response", []):
+                record_id = self._record_id(record)
+                if record_id not in self._ids:
+                    self._ids.add(record_id)
+                    self.records.append(record)
+            self.complete_for.add(key)
+
+    def select(self, match):
+        """
+        :param match: callable(record) -> bool
+        :return: list of the matching records, in the merged order
+        """
+        with self._lock:
+            return [record for record in self.records if match(record)]
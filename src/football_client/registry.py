@@ -0,0 +1,124 @@
+import os
+import threading
+
+
+class RegistryStats:
+    """
+    How much work the registry saved
+    """
+
+    def __init__(self):
+        self.reads = 0
+        self.reads_avoided = 0
+        self.index_builds = 0
+        self.index_builds_avoided = 0
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class CacheRegistry:
+    """
+    Process-wide registry of parsed cache files and the lookup indexes built over them
+
+    Every World reading the same cache file gets the same parsed payload, re-read only when the file
+    changes on disk. Payloads are shared between threads and must be treated as read-only.
+    """
+
+    def __init__(self):
+        # (cache file path, conversion) -> {"stamp": (mtime, size), "data": payload, "indexes": {kind: index}}
+        self._entries = {}
+        # id(payload) -> entry, payloads are kept alive by their entries
+        self._by_payload = {}
+        self._lock = threading.Lock()
+        self._path_locks = {}
+        self.stats = RegistryStats()
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _path_lock(self, path):
+        with self._lock:
+            return self._path_locks.setdefault(path, threading.Lock())
+
+    def read(self, serializer, convert=None):
+        """
+        Parsed content of the serializer file, shared with other readers of the same file
+        :param convert: callable(payload) -> payload kept instead of the parsed one, e.g.
+                        models.leagues_model_payload, shared with the readers using the same conversion
+        :return: dict
+        """
+        path = serializer.serialized_file
+        key = (path, convert)
+        with self._path_lock(path):
+            stamp = self._stamp(path)
+            entry = self._entries.get(key)
+            if stamp is not None and entry is not None and entry["stamp"] == stamp:
+                self.stats.reads_avoided += 1
+                return entry["data"]
+            data = serializer.read()
+            self.stats.reads += 1
+            if data and convert is not None:
+                data = convert(data)
+            if stamp is not None and data:
+                self._register(key, stamp, data)
+            return data
+
+    def put(self, serializer, data, convert=None):
+        """
+        Register the payload just written by the serializer
+        :param convert: see read()
+        :return: registered payload, converted if convert is given
+        """
+        path = serializer.serialized_file
+        key = (path, convert)
+        if data and convert is not None:
+            data = convert(data)
+        with self._path_lock(path):
+            stamp = self._stamp(path)
+            if stamp is not None:
+                self._register(key, stamp, data)
+        return data
+
+    def _register(self, key, stamp, data):
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                self._by_payload.pop(id(previous["data"]), None)
+            entry = {"stamp": stamp, "data": data, "indexes": {}}
+            self._entries[key] = entry
+            self._by_payload[id(data)] = entry
+
+    def index(self, payload, kind, build):
+        """
+        Lookup index over the payload, built once per registered payload
+        :param payload: parsed payload, e.g. World.leagues
+        :param kind: index name, e.g. leagues
+        :param build: callable(payload) -> index
+        """
+        with self._lock:
+            entry = self._by_payload.get(id(payload))
+            index = entry["indexes"].get(kind) if entry is not None and entry["data"] is payload else None
+        if index is not None:
+            self.stats.index_builds_avoided += 1
+            return index
+        index = build(payload)
+        self.stats.index_builds += 1
+        with self._lock:
+            if entry is not None and entry["data"] is payload:
+                entry["indexes"][kind] = index
+        return index
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_payload.clear()
+
+
+# Registry shared by all World instances of the process
+shared_registry = CacheRegistry()
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlencode
+from football_client.fileutil import FileLock, atomic_write
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+
+def normalize_params(params):
+    """
+    Canonical form of query parameters: None values dropped, values as strings, sorted by name
+    :param params: dict, e.g. {"season": 2023, "league": 39}
+    :return: list of (name, value)
+    """
+    return sorted((name, str(value)) for name, value in (params or {}).items() if value is not None)
+
+
+def cache_key(entity, params=None):
+    """
+    :param entity: endpoint name, e.g. teams
+    :param params: query parameters
+    :return: e.g. "teams?league=39&season=2023", or just "leagues" for a bare endpoint
+    """
+    params = normalize_params(params)
+    return f"{entity}?{urlencode(params)}" if params else entity
+
+
+class CacheStats:
+    """
+    Cache effectiveness counters, use them to tune the TTLs
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.refreshed = 0
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class ResponseCache:
+    """
+    Freshness bookkeeping for the serialized API responses
+
+    Stores per-key fetch timestamps and validators (ETag, Last-Modified). Bare endpoints keep theirs in
+    cache_meta.json next to the cached files; parameterized requests live in a sharded layout,
+    cache/<entity>/<2 hex digits>/<sha1 of the key>.json, with the metadata in a .meta.json sidecar.
+    The payloads themselves are read and written by the serializers.
+    """
+
+    # Leagues change when seasons roll over, countries practically never
+    DEFAULT_TTL = {
+        "leagues": DAY,
+        "countries": 30 * DAY,
+        "teams": 7 * DAY,
+        "players": DAY,
+        "fixtures": HOUR,
+    }
+
+    def __init__(self, data_dir, ttl=None, default_ttl=DAY, clock=time.time):
+        """
+        :param data_dir: normally ~/.football_client/data
+        :param ttl: dict of entity -> seconds, overrides DEFAULT_TTL
+        :param default_ttl: seconds, for entities without explicit TTL
+        :param clock: wall clock, replaceable in tests
+        """
+        self.data_dir = data_dir
+        self.meta_file = os.path.join(data_dir, "cache_meta.json")
+        self.ttl = dict(self.DEFAULT_TTL, **(ttl or {}))
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        # Metadata file path -> {key: entry}, and the file (mtime, size) it was read at
+        self._meta = {}
+        self._meta_stamps = {}
+        self._lock = threading.RLock()
+
+    def shard(self, key):
+        """
+        Location of a parameterized entry
+        :param key: cache_key() with parameters
+        :return: (directory, file name without extension)
+        """
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        entity = key.split("?", 1)[0]
+        return os.path.join(self.data_dir, "cache", entity, digest[:2]), digest
+
+    def _meta_file(self, key):
+        if "?" not in key:
+            return self.meta_file
+        shard_dir, file_name = self.shard(key)
+        return os.path.join(shard_dir, f"{file_name}.meta.json")
+
+    @staticmethod
+    def _stamp(meta_file):
+        try:
+            stat = os.stat(meta_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_meta(self, meta_file):
+        self._meta[meta_file] = {}
+        self._meta_stamps[meta_file] = self._stamp(meta_file)
+        if self._meta_stamps[meta_file] is not None:
+            with open(meta_file, "r") as json_file:
+                self._meta[meta_file] = json.load(json_file)
+
+    def _get_meta(self, key):
+        """
+        Metadata of the key's file, re-read whenever another process or cache instance has saved it
+        """
+        meta_file = self._meta_file(key)
+        if meta_file not in self._meta or self._meta_stamps[meta_file] != self._stamp(meta_file):
+            self._load_meta(meta_file)
+        return self._meta[meta_file]
+
+    def _save_meta(self, key):
+        """
+        Save the key's entry, merged into the file as saved by other processes meanwhile
+        """
+        meta_file = self._meta_file(key)
+        entry = self._meta[meta_file][key]
+        lock_file = os.path.join(os.path.dirname(meta_file), f".{os.path.basename(meta_file)}.lock")
+        with FileLock(lock_file):
+            self._load_meta(meta_file)
+            self._meta[meta_file][key] = entry
+            with atomic_write(meta_file) as json_file:
+                json.dump(self._meta[meta_file], json_file, indent=4)
+            self._meta_stamps[meta_file] = self._stamp(meta_file)
+
+    def ttl_for(self, entity):
+        return self.ttl.get(entity, self.default_ttl)
+
+    def state(self, key, entity, serializer=None):
+        """
+        Freshness of the cached entry, without touching the counters
+        :param key: cache_key(), e.g. leagues
+        :param entity: endpoint name used to pick the TTL
+        :param serializer: serializer holding the payload, its file time is used for entries without metadata
+        :return: FRESH, STALE or MISS
+        """
+        with self._lock:
+            fetched_at = self._get_meta(key).get(key, {}).get("fetched_at")
+        if (fetched_at is None and serializer is not None and os.path.exists(serializer.serialized_file)
+                and serializer.exists()):
+            # Written before the metadata was tracked, the file may hold other data, e.g. sqlite responses
+            fetched_at = os.path.getmtime(serializer.serialized_file)
+        if fetched_at is None:
+            return MISS
+        return FRESH if self._clock() - fetched_at < self.ttl_for(entity) else STALE
+
+    def check(self, key, entity, serializer=None):
+        """
+        Same as state(), counting the lookup
+        """
+        state = self.state(key, entity, serializer)
+        self._count(state)
+        return state
+
+    def read(self, key, entity, serializer, reader=None):
+        """
+        Read the cached payload
+        :param reader: callable(serializer) -> data, serializer.read() by default
+        :return: (data, state), data is empty on MISS
+        """
+        data = reader(serializer) if reader else serializer.read()
+        state = self.state(key, entity, serializer) if data else MISS
+        self._count(state)
+        return data, state
+
+    def _count(self, state):
+        with self._lock:
+            if state == FRESH:
+                self.stats.hits += 1
+            elif state == STALE:
+                self.stats.stale += 1
+            else:
+                self.stats.misses += 1
+
+    def write(self, key, serializer, data, headers=None):
+        """
+        Store the fetched payload and its validators
+        :param headers: response headers, for ETag and Last-Modified
+        """
+        serializer.write(data=data)
+        self.mark_fetched(key, headers)
+
+    def mark_fetched(self, key, headers=None):
+        """
+        Record a refresh of the entry, whose data the caller already stored
+        :param headers: response headers, for ETag and Last-Modified
+        """
+        with self._lock:
+            entry = {"fetched_at": self._clock()}
+            for header in ("ETag", "Last-Modified"):
+                if headers and headers.get(header):
+                    entry[header] = headers.get(header)
+            self._get_meta(key)[key] = entry
+            self.stats.refreshed += 1
+            self._save_meta(key)
+
+    def touch(self, key):
+        """
+        Server confirmed the cached entry is still valid (HTTP 304)
+        """
+        with self._lock:
+            self._get_meta(key).setdefault(key, {})["fetched_at"] = self._clock()
+            self.stats.revalidated += 1
+            self._save_meta(key)
+
+    def conditional_headers(self, key):
+        """
+        :return: If-None-Match / If-Modified-Since headers for revalidating the entry
+        """
+        with self._lock:
+            entry = self._get_meta(key).get(key, {})
+        headers = {}
+        if entry.get("ETag"):
+            headers["If-None-Match"] = entry["ETag"]
+        if entry.get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["Last-Modified"]
+        return headers
@@ -0,0 +1,184 @@
+import random
+import threading
+import time
+from football_client.errors import QuotaExceededError, RateLimitError
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        """
+        :param rate: tokens added per second
+        :param capacity: maximum number of tokens
+        :param clock: monotonic time source, replaceable in tests
+        :param sleep: sleep function, replaceable in tests
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        Take one token, waiting for it if the bucket is empty
+        :return: seconds waited
+        """
+        with self._lock:
+            self._refill()
+            # Reserve the token right away, so concurrent callers queue up behind each other
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    def reconfigure(self, rate=None, capacity=None, tokens=None):
+        """
+        Adjust the bucket to what the server reports
+        :param rate: new refill rate
+        :param capacity: new burst size
+        :param tokens: upper bound for the available tokens
+        """
+        with self._lock:
+            self._refill()
+            if rate:
+                self.rate = rate
+            if capacity:
+                self.capacity = capacity
+            self.tokens = min(self.tokens, self.capacity)
+            if tokens is not None:
+                self.tokens = min(self.tokens, tokens)
+
+
+class RequestScheduler:
+    """
+    Pace API requests to the api-sports quotas and retry throttled ones with exponential backoff
+
+    Quotas are learned from the response headers:
+    X-RateLimit-Limit / X-RateLimit-Remaining - requests per minute
+    x-ratelimit-requests-limit / x-ratelimit-requests-remaining - requests per day, reset at 00:00 UTC
+    """
+
+    DAY = 24 * 60 * 60
+
+    def __init__(self, requests_per_minute=10, max_retries=5, backoff=1.0, max_backoff=60.0,
+                 clock=time.monotonic, sleep=time.sleep, wall_clock=time.time):
+        """
+        :param requests_per_minute: initial per-minute quota (free plan), updated from the response headers
+        :param max_retries: retries of a throttled request before giving up
+        :param backoff: first retry delay in seconds, doubled on every retry
+        :param max_backoff: retry delay cap in seconds
+        :param wall_clock: UNIX time source for the daily quota reset, replaceable in tests
+        """
+        self.bucket = TokenBucket(rate=requests_per_minute / 60, capacity=requests_per_minute,
+                                  clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._wall_clock = wall_clock
+        self.daily_remaining = None
+        # UTC day number the daily quota ran out on
+        self._exhausted_day = None
+        # Guards the daily quota state, updated and reset from concurrent requests
+        self._lock = threading.Lock()
+        # Counters for monitoring
+        self.requests = 0
+        self.retries = 0
+        self.waited = 0.0
+
+    def execute(self, send):
+        """
+        Send request when the quota allows, retrying throttled responses
+        :param send: callable returning transport.Response
+        :return: transport.Response
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.daily_quota_exhausted():
+                raise QuotaExceededError({"requests": "Daily request quota is exhausted"})
+            self.waited += self.bucket.acquire()
+            response = send()
+            self.requests += 1
+            self.update_from_headers(response.headers)
+            if not self.is_throttled(response):
+                return response
+            if attempt < self.max_retries:
+                self.retries += 1
+                delay = self._retry_delay(response, attempt)
+                self.waited += delay
+                self._sleep(delay)
+        raise RateLimitError(self._errors(response) or {"rateLimit": f"HTTP {response.status}"})
+
+    def update_from_headers(self, headers):
+        """
+        Sync the pacing with the quota state reported by the server
+        :param headers: http.client.HTTPMessage or dict, header names are case-insensitive
+        """
+        headers = self._lower_headers(headers)
+        per_minute = self._int_header(headers, "x-ratelimit-limit")
+        remaining = self._int_header(headers, "x-ratelimit-remaining")
+        self.bucket.reconfigure(rate=per_minute / 60 if per_minute else None, capacity=per_minute,
+                                tokens=remaining)
+        daily_remaining = self._int_header(headers, "x-ratelimit-requests-remaining")
+        if daily_remaining is not None:
+            with self._lock:
+                self.daily_remaining = daily_remaining
+                if daily_remaining == 0:
+                    self._exhausted_day = self._utc_day()
+
+    def daily_quota_exhausted(self):
+        """
+        :return: True if the server reported no requests left today, the quota is assumed renewed on the next day
+        """
+        with self._lock:
+            if self.daily_remaining != 0:
+                return False
+            if self._utc_day() != self._exhausted_day:
+                # Let the next response report the renewed quota
+                self.daily_remaining = None
+                return False
+            return True
+
+    def _utc_day(self):
+        return int(self._wall_clock() // self.DAY)
+
+    @staticmethod
+    def _lower_headers(headers):
+        return {name.lower(): value for name, value in (headers or {}).items()}
+
+    @staticmethod
+    def _int_header(headers, name):
+        try:
+            return int(headers[name])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _errors(response):
+        return response.data.get("errors") if isinstance(response.data, dict) else None
+
+    def is_throttled(self, response):
+        """
+        api-sports signals throttling either by HTTP 429 or by a "rateLimit" error in a 200 response
+        """
+        errors = self._errors(response)
+        return response.status == 429 or (isinstance(errors, dict) and "rateLimit" in errors)
+
+    def _retry_delay(self, response, attempt):
+        retry_after = self._int_header(self._lower_headers(response.headers), "retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        # Jitter spreads the retries of concurrent workers
+        return delay * random.uniform(0.5, 1.0)
@@ -1,32 +1,85 @@
-from football_client.json_serializer import JsonSerializer, LeaguesJsonSerializer
-from football_client.csv_serializer import CsvSerializer, LeaguesCsvSerializer
+import importlib
 
 
 class SerializerFactory:
-    def __init__(self, data_dir):
-        self.data_dir = data_dir
+    # Serializer classes as "module:class", imported on first use to keep the start-up fast
+    SERIALIZER_TYPES = {
+        "json": "football_client.json_serializer:JsonSerializer",
+        "csv": "football_client.csv_serializer:CsvSerializer",
+        "binary": "football_client.binary_serializer:BinarySerializer",
+        "mongo": "football_client.mongo_serializer:MongoSerializer",
+        "sqlite": "football_client.sqlite_serializer:SqliteSerializer",
+    }
 
-    def create_serializer(self, serializer_type, entity):
-        serializer_types = {
-            "json": JsonSerializer,
-            "csv": CsvSerializer,
+    ENTITY_SERIALIZERS = {
+        "leagues": {
+            "json": "football_client.json_serializer:LeaguesJsonSerializer",
+            "csv": "football_client.csv_serializer:LeaguesCsvSerializer",
+            "binary": "football_client.binary_serializer:LeaguesBinarySerializer",
+            "mongo": "football_client.mongo_serializer:LeaguesMongoSerializer",
+            "sqlite": "football_client.sqlite_serializer:LeaguesSqliteSerializer",
+        },
+        "countries": {
+            "mongo": "football_client.mongo_serializer:CountriesMongoSerializer",
+            "sqlite": "football_client.sqlite_serializer:CountriesSqliteSerializer",
+        },
+        "teams": {
+            "csv": "football_client.csv_serializer:TeamsCsvSerializer",
+            "mongo": "football_client.mongo_serializer:TeamsMongoSerializer",
+        },
+        "players": {
+            "csv": "football_client.csv_serializer:PlayersCsvSerializer",
+            "mongo": "football_client.mongo_serializer:PlayersMongoSerializer",
         }
+        # Add more entity-specific serializers as needed
+    }
 
-        entity_serializers = {
-            "leagues": {
-                "json": LeaguesJsonSerializer,
-                "csv": LeaguesCsvSerializer,
-            }
-            # Add more entity-specific serializers as needed
-        }
+    # Formats keeping the responses of parameterized queries together, keyed by the cache key,
+    # the other formats write a file per response
+    RESPONSE_SERIALIZERS = {
+        "mongo": "football_client.mongo_serializer:MongoResponseSerializer",
+        "sqlite": "football_client.sqlite_serializer:SqliteResponseSerializer",
+    }
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
 
-        entity_serializer_cls = entity_serializers.get(entity, {}).get(serializer_type, None)
+    @staticmethod
+    def _load_class(path):
+        module_name, class_name = path.split(":")
+        return getattr(importlib.import_module(module_name), class_name)
 
-        if entity_serializer_cls:
-            return entity_serializer_cls(self.data_dir)
+    def create_serializer(self, serializer_type, entity, compression=None):
+        """
+        :param serializer_type: e.g. json
+        :param entity: e.g. leagues
+        :param compression: codec compressing the serialized files, e.g. gzip, see compression.CODECS
+        """
+        entity_serializer_path = self.ENTITY_SERIALIZERS.get(entity, {}).get(serializer_type, None)
+
+        if entity_serializer_path:
+            serializer = self._load_class(entity_serializer_path)(self.data_dir)
         else:
-            serializer_cls = serializer_types.get(serializer_type, None)
-            if serializer_cls:
-                return serializer_cls(self.data_dir, file_name=entity, settings=None)
+            serializer_path = self.SERIALIZER_TYPES.get(serializer_type, None)
+            if serializer_path:
+                serializer = self._load_class(serializer_path)(self.data_dir, file_name=entity, settings=None)
             else:
                 raise ValueError(f"Unsupported serializer or entity: {serializer_type}, {entity}")
+        if compression:
+            serializer.use_codec(compression)
+        return serializer
+
+    def create_response_serializer(self, serializer_type, key, compression=None):
+        """
+        :param serializer_type: e.g. mongo
+        :param key: cache_key() with parameters, e.g. leagues?country=England
+        :param compression: codec compressing the serialized data, see compression.CODECS
+        :return: serializer of the response, None if the format has no shared store for responses
+        """
+        serializer_path = self.RESPONSE_SERIALIZERS.get(serializer_type)
+        if serializer_path is None:
+            return None
+        serializer = self._load_class(serializer_path)(self.data_dir, key)
+        if compression:
+            serializer.use_codec(compression)
+        return serializer
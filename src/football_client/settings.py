@@ -29,5 +29,60 @@ def get_data_dir():
     return data_dir
 
 
-API_KEY = get_api_key()
-DATA_DIR = get_data_dir()
+def get_mongo_uri():
+    """
+    MongoDB connection string for the mongo serializer, the path names the database
+    """
+    return os.environ.get("FOOTBALL_MONGO_URI", "mongodb://localhost:27017/football_client")
+
+
+class Settings:
+    """
+    Settings resolved on first use, so importing the package has no side effects
+    and cache-only use never needs the API key
+    """
+
+    def __init__(self):
+        self._api_key = None
+        self._data_dir = None
+        self._mongo_uri = None
+
+    @property
+    def api_key(self):
+        if self._api_key is None:
+            self._api_key = get_api_key()
+        return self._api_key
+
+    @property
+    def data_dir(self):
+        if self._data_dir is None:
+            self._data_dir = get_data_dir()
+        return self._data_dir
+
+    @property
+    def mongo_uri(self):
+        if self._mongo_uri is None:
+            self._mongo_uri = get_mongo_uri()
+        return self._mongo_uri
+
+    def reset(self):
+        """
+        Forget resolved values, e.g. after changing the environment
+        """
+        self._api_key = None
+        self._data_dir = None
+        self._mongo_uri = None
+
+
+settings = Settings()
+
+
+def __getattr__(name):
+    """
+    Backward compatibility: API_KEY and DATA_DIR module attributes, resolved on access
+    """
+    if name == "API_KEY":
+        return settings.api_key
+    if name == "DATA_DIR":
+        return settings.data_dir
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
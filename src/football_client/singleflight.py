@@ -0,0 +1,51 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls: while a call for a key is in flight, other callers with the same key
+    wait for it and share its result or exception instead of repeating the work
+    """
+
+    def __init__(self):
+        # Key -> _Call in flight
+        self._calls = {}
+        self._lock = threading.Lock()
+        # Callers served by another caller's call
+        self.shared = 0
+
+    def do(self, key, fn):
+        """
+        :param key: hashable identity of the call, e.g. cache key of a request
+        :param fn: callable doing the work, run by the first caller only
+        :return: result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,349 @@
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from football_client.base_serializer import BaseSerializer
+
+
+class SqliteSerializer(BaseSerializer):
+    """
+    Store records in an SQLite database file, one row per record
+
+    The database runs in WAL mode, so lookups from other threads and processes keep reading the previous
+    data while a write is in progress. Every write replaces the stored data in a single transaction,
+    inserting the rows with executemany() in batches. Subclasses add normalized, indexed tables.
+    """
+
+    BATCH_SIZE = 1000
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS payload (id INTEGER PRIMARY KEY CHECK (id = 1), envelope TEXT);
+        CREATE TABLE IF NOT EXISTS records (pos INTEGER PRIMARY KEY, data TEXT NOT NULL);
+    """
+    TABLES = ("records",)
+
+    def __init__(self, data_dir, file_name, settings=None):
+        """
+        :param data_dir: normally ~/.football_client/data
+        :param file_name: name without extension, e.g., leagues
+        :param settings: dict
+        """
+        super().__init__(data_dir, file_name, settings=settings)
+        # sqlite3 connections can't be shared between threads
+        self._local = threading.local()
+
+    @staticmethod
+    def get_extension():
+        """
+        Get the file extension for the serialized data format (e.g., "json", "tsv")
+        """
+        return "sqlite"
+
+    def connect(self):
+        """
+        Connection of the calling thread, the schema is created on first use
+        :return: sqlite3.Connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(self.data_dir, exist_ok=True)
+            connection = sqlite3.connect(self.serialized_file)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self.SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def write(self, data):
+        """
+        Replace the stored records
+        :param data: payload dict with the records in "response", list or any other iterable of records
+        """
+        envelope = None
+        records = data
+        if isinstance(data, dict):
+            envelope = {key: value for key, value in data.items() if key != "response"}
+            records = data.get("response", [])
+        connection = self.connect()
+        written = 0
+        with connection:
+            for table in self.TABLES:
+                connection.execute(f"DELETE FROM {table}")
+            records = iter(records)
+            while True:
+                batch = list(itertools.islice(records, self.BATCH_SIZE))
+                if not batch:
+                    break
+                self._insert(connection, batch, written)
+                written += len(batch)
+            connection.execute("INSERT OR REPLACE INTO payload (id, envelope) VALUES (1, ?)", (json.dumps(envelope),))
+        # Move the changes into the database file, its modification time tells readers the data changed
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        print(f"Serialized {written} records to {self.serialized_file}")
+
+    def _insert(self, connection, records, first_pos):
+        """
+        Insert a batch of records
+        :param first_pos: position of the first record in the written data
+        """
+        connection.executemany("INSERT INTO records (pos, data) VALUES (?, ?)",
+                               [(pos, json.dumps(record)) for pos, record in enumerate(records, start=first_pos)])
+
+    def _records_query(self):
+        return "SELECT data FROM records ORDER BY pos"
+
+    def _has_data(self, connection):
+        return connection.execute("SELECT 1 FROM payload").fetchone() is not None
+
+    def exists(self):
+        return os.path.exists(self.serialized_file) and self._has_data(self.connect())
+
+    def read(self):
+        """
+        Read the records in the written order
+        :return: dict or list in the written shape, {} if nothing was written
+        """
+        if not os.path.exists(self.serialized_file):
+            return {}
+        connection = self.connect()
+        row = connection.execute("SELECT envelope FROM payload").fetchone()
+        if row is None:
+            return {}
+        records = [json.loads(data) for data, in connection.execute(self._records_query())]
+        envelope = json.loads(row[0])
+        if envelope is None:
+            return records
+        return dict(envelope, response=records)
+
+    def close(self):
+        """
+        Close the connection of the calling thread
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class LeaguesSqliteSerializer(SqliteSerializer):
+    """
+    Leagues database with normalized leagues and seasons tables, seasons mirror seasons_simplified.json
+
+    find() and select() answer lookups and filtered queries with indexed SQL, without loading the payload.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS payload (id INTEGER PRIMARY KEY CHECK (id = 1), envelope TEXT);
+        CREATE TABLE IF NOT EXISTS leagues (
+            pos INTEGER PRIMARY KEY,
+            id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT,
+            country TEXT,
+            country_code TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS leagues_id ON leagues (id);
+        CREATE INDEX IF NOT EXISTS leagues_name ON leagues (name);
+        CREATE INDEX IF NOT EXISTS leagues_country ON leagues (country, type);
+        CREATE INDEX IF NOT EXISTS leagues_country_code ON leagues (country_code, type);
+        CREATE TABLE IF NOT EXISTS seasons (
+            league_id INTEGER NOT NULL,
+            year INTEGER NOT NULL,
+            start TEXT,
+            end TEXT,
+            current INTEGER,
+            PRIMARY KEY (league_id, year)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS seasons_year ON seasons (year, league_id);
+    """
+    TABLES = ("leagues", "seasons")
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="leagues", settings=None)
+
+    def _insert(self, connection, records, first_pos):
+        self._insert_at(connection, enumerate(records, start=first_pos))
+
+    @staticmethod
+    def _insert_at(connection, positioned):
+        """
+        :param positioned: iterable of (position, league)
+        """
+        positioned = list(positioned)
+        connection.executemany(
+            "INSERT INTO leagues (pos, id, name, type, country, country_code, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(pos, lg["league"]["id"], lg["league"]["name"], lg["league"]["type"], lg["country"]["name"],
+              lg["country"]["code"], json.dumps(lg)) for pos, lg in positioned])
+        connection.executemany(
+            "INSERT OR REPLACE INTO seasons (league_id, year, start, end, current) VALUES (?, ?, ?, ?, ?)",
+            [(lg["league"]["id"], season["year"], season["start"], season["end"], season.get("current"))
+             for _, lg in positioned for season in lg["seasons"]])
+
+    def _records_query(self):
+        return "SELECT data FROM leagues ORDER BY pos"
+
+    def apply_changes(self, data, changes):
+        """
+        Update, insert and delete just the changed leagues and their seasons in one transaction
+        """
+        if not os.path.exists(self.serialized_file):
+            return False
+        connection = self.connect()
+        if not self._has_data(connection):
+            return False
+        with connection:
+            positions = dict(connection.execute("SELECT id, pos FROM leagues"))
+            stale = [(league_id,) for league_id in changes.removed + changes.changed]
+            connection.executemany("DELETE FROM leagues WHERE id = ?", stale)
+            connection.executemany("DELETE FROM seasons WHERE league_id = ?", stale)
+            # Changed leagues keep their position, added ones are appended
+            next_pos = max(positions.values(), default=-1) + 1
+            positioned = []
+            for league_id, lg in changes.records.items():
+                if league_id not in positions:
+                    positions[league_id] = next_pos
+                    next_pos += 1
+                positioned.append((positions[league_id], lg))
+            self._insert_at(connection, positioned)
+            connection.execute("UPDATE payload SET envelope = ? WHERE id = 1",
+                               (json.dumps({key: value for key, value in data.items() if key != "response"}),))
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        print(f"Applied {len(changes.records)} changed and {len(changes.removed)} removed leagues "
+              f"to {self.serialized_file}")
+        return True
+
+    def find(self, league_id=None, league_name=None):
+        """
+        Indexed lookup of a single league
+        :param league_id: e.g. 39
+        :param league_name: e.g. Bundesliga
+        :return: dict, {} if not found, None if nothing was written
+        """
+        if not (league_id or league_name) or not os.path.exists(self.serialized_file):
+            return None
+        connection = self.connect()
+        if not self._has_data(connection):
+            return None
+        # First league in the payload order wins, as in a linear scan
+        row = connection.execute("SELECT data FROM leagues WHERE id = ? OR name = ? ORDER BY pos LIMIT 1",
+                                 (league_id, league_name)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def select(self, country=None, league_type=None, season=None):
+        """
+        Leagues matching all the given filters, e.g. all cups in England with a 2023 season
+        :param country: country name or code, e.g. England or GB
+        :param league_type: League or Cup
+        :param season: year, e.g. 2023
+        :return: list of dict in the payload order, None if nothing was written
+        """
+        if not os.path.exists(self.serialized_file):
+            return None
+        connection = self.connect()
+        if not self._has_data(connection):
+            return None
+        conditions, params = [], []
+        if country:
+            conditions.append("(country = ? OR country_code = ?)")
+            params += [country, country]
+        if league_type:
+            conditions.append("type = ?")
+            params.append(league_type)
+        if season:
+            conditions.append("id IN (SELECT league_id FROM seasons WHERE year = ?)")
+            params.append(season)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return [json.loads(data) for data, in connection.execute(f"SELECT data FROM leagues {where} ORDER BY pos",
+                                                                 params)]
+
+
+class CountriesSqliteSerializer(SqliteSerializer):
+    """
+    Countries database, indexed by name and code, the records are kept whole in the data column
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS payload (id INTEGER PRIMARY KEY CHECK (id = 1), envelope TEXT);
+        CREATE TABLE IF NOT EXISTS countries (
+            pos INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            code TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS countries_name ON countries (name);
+        CREATE INDEX IF NOT EXISTS countries_code ON countries (code);
+    """
+    TABLES = ("countries",)
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, file_name="countries", settings=None)
+
+    def _insert(self, connection, records, first_pos):
+        connection.executemany("INSERT INTO countries (pos, name, code, data) VALUES (?, ?, ?, ?)",
+                               [(pos, country["name"], country.get("code"), json.dumps(country))
+                                for pos, country in enumerate(records, start=first_pos)])
+
+    def _records_query(self):
+        return "SELECT data FROM countries ORDER BY pos"
+
+    def find(self, country_name=None, country_code=None):
+        """
+        Indexed lookup of a single country
+        :return: dict, {} if not found, None if nothing was written
+        """
+        if not (country_name or country_code) or not os.path.exists(self.serialized_file):
+            return None
+        connection = self.connect()
+        if not self._has_data(connection):
+            return None
+        row = connection.execute("SELECT data FROM countries WHERE name = ? OR code = ? ORDER BY pos LIMIT 1",
+                                 (country_name, country_code)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+
+class SqliteResponseSerializer(SqliteSerializer):
+    """
+    Response of a parameterized query, one row of the responses table in the entity database keyed by the
+    cache key, instead of a database file per query
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, data TEXT NOT NULL) WITHOUT ROWID;
+    """
+
+    def __init__(self, data_dir, key):
+        """
+        :param key: cache_key() with parameters, e.g. leagues?country=England
+        """
+        super().__init__(data_dir, file_name=key.split("?", 1)[0], settings=None)
+        self.key = key
+
+    def write(self, data):
+        """
+        Replace the response row
+        :param data: payload dict, list or any other iterable of records
+        """
+        if not isinstance(data, (dict, list)):
+            data = list(data)
+        connection = self.connect()
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO responses (key, data) VALUES (?, ?)",
+                               (self.key, json.dumps(data)))
+        # No checkpoint: the database file time tells readers the entity data changed, not the responses
+        print(f"Serialized {self.key} to {self.serialized_file}")
+
+    def _row(self):
+        if not os.path.exists(self.serialized_file):
+            return None
+        return self.connect().execute("SELECT data FROM responses WHERE key = ?", (self.key,)).fetchone()
+
+    def exists(self):
+        return self._row() is not None
+
+    def read(self):
+        """
+        :return: dict or list in the written shape, {} if nothing was written
+        """
+        row = self._row()
+        return json.loads(row[0]) if row else {}
@@ -0,0 +1,187 @@
+import http.client
+import json
+import queue
+import threading
+import zlib
+from collections import namedtuple
+
+# Parsed API response: HTTP status, response headers (http.client.HTTPMessage) and decoded JSON body
+Response = namedtuple("Response", ["status", "headers", "data"])
+
+
+class ConnectionPool:
+    """
+    Pool of persistent keep-alive HTTP(S) connections to a single host
+    """
+
+    # Errors meaning the server has dropped an idle keep-alive connection
+    STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                               BrokenPipeError, ConnectionResetError)
+    # Content-Encoding -> zlib wbits of the stream format, deflate detects the zlib or gzip header
+    # and falls back to raw deflate, which some servers send instead of the zlib format
+    CONTENT_ENCODINGS = {"gzip": 16 + zlib.MAX_WBITS, "x-gzip": 16 + zlib.MAX_WBITS, "deflate": 32 + zlib.MAX_WBITS}
+    # Bytes read from the socket per decompression step
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, host, port=None, secure=True, pool_size=4, timeout=30, compress=True):
+        """
+        :param host: e.g. v3.football.api-sports.io
+        :param port: None for the scheme default
+        :param secure: use HTTPS
+        :param pool_size: maximum number of open connections
+        :param timeout: socket timeout in seconds
+        :param compress: ask for gzip or deflate encoded responses
+        """
+        assert pool_size > 0, "pool_size must be positive"
+        self.host = host
+        self.port = port
+        self.secure = secure
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.compress = compress
+        self._idle = queue.LifoQueue()
+        # Guards _open and the counters, notified whenever a connection is released or discarded
+        self._available = threading.Condition()
+        self._open = 0
+        # Counters for monitoring the reuse rate
+        self.connections_created = 0
+        self.requests_sent = 0
+        # Response body bytes as transferred, before decompression
+        self.bytes_received = 0
+
+    def _new_connection(self):
+        connection_cls = http.client.HTTPSConnection if self.secure else http.client.HTTPConnection
+        with self._available:
+            self.connections_created += 1
+        return connection_cls(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self):
+        """
+        Take the most recently used idle connection, open a new one or wait until one is released
+        :return: (connection, reused)
+        """
+        with self._available:
+            while True:
+                try:
+                    return self._idle.get_nowait(), True
+                except queue.Empty:
+                    pass
+                # A discarded connection frees a slot for a new one
+                if self._open < self.pool_size:
+                    self._open += 1
+                    return self._new_connection(), False
+                self._available.wait()
+
+    def _release(self, conn):
+        with self._available:
+            self._idle.put(conn)
+            self._available.notify()
+
+    def _discard(self, conn):
+        conn.close()
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+
+    def request(self, method, path, headers=None):
+        """
+        Send request over a pooled connection
+        :param method: e.g. GET
+        :param path: e.g. /leagues
+        :param headers: dict
+        :return: Response
+        """
+        headers = dict(headers or {})
+        headers.setdefault("Connection", "keep-alive")
+        if self.compress:
+            headers.setdefault("Accept-Encoding", "gzip, deflate")
+        conn, reused = self._acquire()
+        try:
+            try:
+                result, body = self._send(conn, method, path, headers)
+            except self.STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # Idle connection was closed by the server, retry once over a fresh socket
+                conn.close()
+                conn = self._new_connection()
+                result, body = self._send(conn, method, path, headers)
+        except Exception:
+            self._discard(conn)
+            raise
+        if result.will_close:
+            self._discard(conn)
+        else:
+            self._release(conn)
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            if 200 <= result.status < 300:
+                raise
+            # Error pages of proxies and gateways are often HTML, the status tells what went wrong
+            data = None
+        return Response(status=result.status, headers=result.msg, data=data)
+
+    def _send(self, conn, method, path, headers):
+        conn.request(method, path, headers=headers)
+        with self._available:
+            self.requests_sent += 1
+        result = conn.getresponse()
+        # Drain the body so the connection can be reused
+        return result, self._read_body(result)
+
+    def _read_body(self, result):
+        """
+        Read the response body, decompressing an encoded one chunk by chunk as it arrives,
+        so the compressed body is never held in memory as a whole
+        :return: decoded body, bytes or bytearray
+        """
+        encoding = (result.getheader("Content-Encoding") or "").strip().lower()
+        if encoding not in self.CONTENT_ENCODINGS:
+            body = result.read()
+            self._count_received(len(body))
+            return body
+        decompressor = zlib.decompressobj(self.CONTENT_ENCODINGS[encoding])
+        body = bytearray()
+        # Compressed bytes read before the header was accepted, decoded again as raw deflate on a header error
+        head = b"" if encoding == "deflate" else None
+        received = 0
+        while True:
+            chunk = result.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            received += len(chunk)
+            try:
+                body += decompressor.decompress(chunk)
+            except zlib.error:
+                if head is None:
+                    raise
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                body += decompressor.decompress(head + chunk)
+                head = None
+            if head is not None:
+                head = None if body else head + chunk
+        body += decompressor.flush()
+        self._count_received(received)
+        return body
+
+    def _count_received(self, size):
+        with self._available:
+            self.bytes_received += size
+
+    def close(self):
+        """
+        Close all idle connections
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,54 @@
+"""
+Benchmark: serial World requests vs AsyncWorld at increasing concurrency against a local server with latency
+Usage: PYTHONPATH=src python test/bench_async.py [requests] [latency_ms]
+"""
+import asyncio
+import contextlib
+import io
+import sys
+import time
+import helpers
+from football_client.api_client import World
+from football_client.async_client import AsyncWorld
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+    payload = {"errors": [], "response": [{"team": {"id": 1, "name": "Mock FC"}}]}
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        with helpers.MockApiServer(routes={"/teams": payload}, latency=latency) as server:
+            with contextlib.redirect_stdout(io.StringIO()):
+                world = World(serializer="json", data_dir=data_dir.path, transport=server.transport(pool_size=1),
+                              scheduler=helpers.unthrottled_scheduler())
+            started = time.perf_counter()
+            for league_id in range(requests):
+                world._fetch("teams", {"league": league_id, "season": 2023})
+            serial = time.perf_counter() - started
+            world.close()
+            print(f"{requests} requests, {latency * 1000:.0f} ms latency")
+            print(f"serial:         {serial:.3f} s")
+
+            for concurrency in (2, 4, 8, 16, 32):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    async_world = AsyncWorld(serializer="json", data_dir=data_dir.path,
+                                             transport=server.transport(pool_size=concurrency),
+                                             scheduler=helpers.unthrottled_scheduler(),
+                                             concurrency=concurrency)
+
+                async def fetch_all():
+                    await asyncio.gather(*(async_world.fetch("teams", league=league_id, season=2023)
+                                           for league_id in range(requests)))
+
+                started = time.perf_counter()
+                asyncio.run(fetch_all())
+                elapsed = time.perf_counter() - started
+                async_world.close()
+                print(f"concurrency {concurrency:2}: {elapsed:.3f} s ({serial / elapsed:.1f}x)")
+    finally:
+        data_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: load time and file size of the leagues cache, indented JSON vs binary,
+and cold single-league lookups in fresh processes, full load vs memory-mapped index
+Usage: PYTHONPATH=src python test/bench_cache_format.py [leagues]
+"""
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import timeit
+import helpers
+from football_client.serializer_factory import SerializerFactory
+
+# Cold process: import, construct World and resolve one league, report wall time and peak RSS (VmHWM, Linux)
+LOOKUP_SCRIPT = """
+import contextlib, io, sys, time
+def peak_rss_mb():
+    with open("/proc/self/status") as status:
+        return next(int(line.split()[1]) // 1024 for line in status if line.startswith("VmHWM"))
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    from football_client.api_client import World
+    world = World(serializer="json", data_dir=sys.argv[1], cache_format=sys.argv[2])
+    league = world.get_league(league_id=7)
+assert league["league"]["id"] == 7
+print(time.perf_counter() - started, peak_rss_mb())
+"""
+
+
+def cold_lookup(data_dir, cache_format):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run([sys.executable, "-c", LOOKUP_SCRIPT, data_dir, cache_format], env=env,
+                            check=True, capture_output=True, text=True).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    payload = helpers.make_leagues_payload(leagues_count)
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        factory = SerializerFactory(data_dir.path)
+        print(f"{leagues_count} leagues")
+        for serializer_type in ("json", "binary"):
+            serializer = factory.create_serializer(serializer_type=serializer_type, entity="leagues")
+            with contextlib.redirect_stdout(io.StringIO()):
+                write_time = min(timeit.repeat(lambda: serializer.write(payload), number=1, repeat=3))
+            read_time = min(timeit.repeat(serializer.read, number=1, repeat=5))
+            size = os.path.getsize(serializer.serialized_file)
+            print(f"{serializer_type:7} size {size / 1024:8.0f} KB, write {write_time * 1000:7.1f} ms, "
+                  f"load {read_time * 1000:7.1f} ms")
+
+        print("Cold single-league lookup")
+        for label, cache_format in (("json", "json"), ("mmap index", "binary")):
+            elapsed, peak_mb = cold_lookup(data_dir.path, cache_format)
+            print(f"{label:10} {elapsed * 1000:7.1f} ms, peak RSS {peak_mb} MB")
+        os.remove(os.path.join(data_dir.path, "leagues.idx"))
+        elapsed, peak_mb = cold_lookup(data_dir.path, "binary")
+        print(f"{'binary':10} {elapsed * 1000:7.1f} ms, peak RSS {peak_mb} MB (no index, full load)")
+    finally:
+        data_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: analytics over all leagues and seasons, nested dict loops vs columnar LeagueTable
+(Python loops over the array columns and, if installed, NumPy), plus memory of payload vs columns
+Usage: PYTHONPATH=src python test/bench_columnar.py [leagues]
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+from collections import Counter
+import helpers
+from football_client import columnar
+from football_client.columnar import LeagueTable
+
+
+def dict_analytics(payload):
+    per_country = Counter(lg["country"]["name"] for lg in payload["response"] for _ in lg["seasons"])
+    cups = [lg["league"]["id"] for lg in payload["response"]
+            if lg["league"]["type"] == "Cup" and any(s["year"] == 2016 for s in lg["seasons"])]
+    return per_country, cups
+
+
+def table_analytics(table):
+    return table.count_seasons("country"), table.filter(league_type="Cup", season=2016)
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    payload_json = json.dumps(helpers.make_leagues_payload(leagues_count))
+    payload, payload_size = traced(lambda: json.loads(payload_json))
+    seasons = sum(len(lg["seasons"]) for lg in payload["response"])
+    print(f"{leagues_count} leagues, {seasons} seasons, payload {payload_size / 1024:.0f} KiB")
+    dict_time = min(timeit.repeat(lambda: dict_analytics(payload), number=1, repeat=5))
+    print(f"   dict loops: {dict_time * 1000:.2f} ms")
+    backends = [False] + ([True] if columnar.numpy is not None else [])
+    for use_numpy in backends:
+        table, table_size = traced(lambda: LeagueTable.from_payload(payload, use_numpy=use_numpy))
+        assert table_analytics(table) == (dict(dict_analytics(payload)[0]), dict_analytics(payload)[1])
+        table_time = min(timeit.repeat(lambda: table_analytics(table), number=1, repeat=5))
+        name = "numpy" if use_numpy else "array"
+        print(f"{name:>13}: {table_time * 1000:.2f} ms ({dict_time / table_time:.1f}x), "
+              f"columns {table_size / 1024:.0f} KiB ({table_size / payload_size:.1%} of payload)")
+
+
+if __name__ == "__main__":
+    main()
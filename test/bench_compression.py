@@ -0,0 +1,58 @@
+"""
+Benchmark: bytes on disk, write and read time and peak read memory of the leagues cache per compression codec
+Usage: PYTHONPATH=src python test/bench_compression.py [leagues]
+"""
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+import tracemalloc
+import helpers
+from football_client.compression import CODECS
+from football_client.serializer_factory import SerializerFactory
+
+
+def best_of(action, runs=3):
+    """
+    :return: best wall time of the runs
+    """
+    elapsed = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        action()
+        elapsed.append(time.perf_counter() - started)
+    return min(elapsed)
+
+
+def measure(data_dir, payload, codec):
+    serializer = SerializerFactory(data_dir).create_serializer(serializer_type="json", entity="leagues",
+                                                               compression=codec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        write_time = best_of(lambda: serializer.write(payload))
+    read_time = best_of(serializer.read)
+    tracemalloc.start()
+    serializer.read()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return os.path.getsize(serializer.serialized_file), write_time, read_time, peak
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    payload = helpers.make_leagues_payload(leagues_count)
+    codecs = [None] + [name for name in CODECS if name != "zstd" or importlib.util.find_spec("zstandard")]
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        results = {codec or "none": measure(data_dir.path, payload, codec) for codec in codecs}
+    finally:
+        data_dir.cleanup()
+    print(f"{leagues_count} leagues")
+    for name, (size, write_time, read_time, peak) in results.items():
+        print(f"{name:>5}: {size / 1024:7.0f} KiB on disk, write {write_time * 1000:4.0f} ms, "
+              f"read {read_time * 1000:4.0f} ms, read peak {peak / 1024:.0f} KiB allocated")
+
+
+if __name__ == "__main__":
+    main()
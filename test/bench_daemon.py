@@ -0,0 +1,67 @@
+"""
+Benchmark: one CLI process per lookup vs lookups served by the query daemon
+Usage: PYTHONPATH=src python test/bench_daemon.py [leagues] [lookups] [clients]
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import helpers
+from football_client.api_client import World
+from football_client.daemon import DaemonClient, QueryServer
+
+
+def cold_cli(data_dir, ids):
+    env = dict(os.environ, FOOTBALL_DATA_DIR=data_dir, PYTHONPATH=os.pathsep.join(sys.path))
+    started = time.perf_counter()
+    for league_id in ids:
+        subprocess.run([sys.executable, "-m", "cli.football_cli", "get", "league", str(league_id)],
+                       env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - started
+
+
+def daemon_lookups(url, ids, clients):
+    client = DaemonClient(url, pool_size=clients)
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            list(executor.map(lambda league_id: client.find_league(league_id=league_id), ids))
+        return time.perf_counter() - started
+    finally:
+        client.close()
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    clients = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    with open(os.path.join(data_dir.path, "leagues.json"), "w") as json_file:
+        json.dump(helpers.make_leagues_payload(leagues_count), json_file)
+    with open(os.path.join(data_dir.path, "countries.json"), "w") as json_file:
+        json.dump({"response": [{"name": "England", "code": "GB", "flag": None}]}, json_file)
+    ids = [random.randint(1, leagues_count) for _ in range(lookups)]
+    server = QueryServer(World(serializer="json", data_dir=data_dir.path))
+    try:
+        server.warm_up()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        cli_time = cold_cli(data_dir.path, ids[:10]) / 10
+        single_time = daemon_lookups(server.url, ids, 1)
+        concurrent_time = daemon_lookups(server.url, ids, clients)
+    finally:
+        server.shutdown()
+        server.server_close()
+        data_dir.cleanup()
+    print(f"{lookups} lookups over {leagues_count} leagues")
+    print(f"process per lookup: {cli_time * 1000:.1f} ms/lookup ({1 / cli_time:.1f} req/s)")
+    print(f"daemon, 1 client:   {single_time / lookups * 1000:.3f} ms/lookup ({lookups / single_time:.0f} req/s)")
+    print(f"daemon, {clients} clients:  {concurrent_time / lookups * 1000:.3f} ms/lookup "
+          f"({lookups / concurrent_time:.0f} req/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: time and peak memory of writing the leagues cache with its simplified files,
+three passes with materialized lists (previous LeaguesJsonSerializer.write) vs single-pass streaming
+Usage: PYTHONPATH=src python test/bench_leagues_write.py [leagues]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+import helpers
+from football_client.json_serializer import LeaguesJsonSerializer
+
+
+def three_pass_write(data_dir, data):
+    with open(os.path.join(data_dir, "leagues.json"), "w") as json_file:
+        json.dump(data, json_file, indent=4)
+    simplified_leagues = []
+    for lg in data["response"]:
+        simplified_leagues.append({
+            "id": lg["league"]["id"],
+            "name": lg["league"]["name"],
+            "type": lg["league"]["type"],
+            "country": lg["country"]["name"],
+            "seasons": [season["year"] for season in lg["seasons"]],
+        })
+    with open(os.path.join(data_dir, "leagues_simplified.json"), "w") as leagues_json_f:
+        json.dump(simplified_leagues, leagues_json_f, indent=4)
+    seasons = []
+    for lg in data["response"]:
+        for season in lg["seasons"]:
+            seasons.append({
+                "id": lg["league"]["id"],
+                "name": lg["league"]["name"],
+                "country": lg["country"]["name"],
+                "year": season["year"],
+                "start": season["start"],
+                "end": season["end"]
+            })
+    with open(os.path.join(data_dir, "seasons_simplified.json"), "w") as seasons_json_f:
+        json.dump(seasons, seasons_json_f, indent=4)
+
+
+def measure(write):
+    """
+    :return: best wall time of 3 runs, peak of traced allocations in a separate run
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed = []
+        for _ in range(3):
+            started = time.perf_counter()
+            write()
+            elapsed.append(time.perf_counter() - started)
+        tracemalloc.start()
+        write()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return min(elapsed), peak
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    payload = helpers.make_leagues_payload(leagues_count)
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        serializer = LeaguesJsonSerializer(data_dir.path)
+        results = {
+            "three passes": measure(lambda: three_pass_write(data_dir.path, payload)),
+            "single pass": measure(lambda: serializer.write(payload)),
+        }
+    finally:
+        data_dir.cleanup()
+    print(f"{leagues_count} leagues")
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:>12}: {elapsed * 1000:.0f} ms, peak {peak / 1024:.0f} KiB allocated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Micro-benchmark: linear scan vs indexed World.get_league lookups
+Usage: PYTHONPATH=src python test/bench_lookups.py [leagues] [lookups]
+"""
+import contextlib
+import io
+import random
+import sys
+import timeit
+import helpers
+from football_client.api_client import World
+
+
+def linear_scan(leagues, league_id=None, league_name=None):
+    for lg in leagues['response']:
+        if (league_id and lg["league"]["id"] == league_id) or (league_name and lg["league"]["name"] == league_name):
+            return lg
+    return {}
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    payload = helpers.make_leagues_payload(leagues_count)
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            world = World(serializer="json", data_dir=data_dir.path)
+        world.leagues = payload
+        ids = [random.randint(1, leagues_count) for _ in range(lookups)]
+
+        def scan():
+            for league_id in ids:
+                linear_scan(payload, league_id=league_id)
+
+        def indexed():
+            for league_id in ids:
+                world.get_league(league_id=league_id)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            scan_time = min(timeit.repeat(scan, number=1, repeat=3))
+            indexed_time = min(timeit.repeat(indexed, number=1, repeat=3))
+    finally:
+        data_dir.cleanup()
+    print(f"{lookups} lookups over {leagues_count} leagues")
+    print(f"linear scan: {scan_time * 1000:.1f} ms")
+    print(f"indexed:     {indexed_time * 1000:.1f} ms ({scan_time / indexed_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: memory retained by the leagues payload as parsed API dicts vs slotted models, measured
+with tracemalloc, for the conversion alone and for a World with the leagues loaded, which keeps the models
+instead of the payload with models=True
+Usage: PYTHONPATH=src python test/bench_models.py [leagues]
+"""
+import contextlib
+import gc
+import io
+import json
+import sys
+import time
+import tracemalloc
+import helpers
+from football_client.api_client import World
+from football_client.models import leagues_from_payload
+from football_client.registry import CacheRegistry
+
+
+def retained(build):
+    """
+    :return: (result, bytes still allocated by build once it returns, seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def loaded_world(data_dir, models):
+    """
+    :return: World with the leagues loaded from the cache in data_dir
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(serializer="json", data_dir=data_dir, registry=CacheRegistry(), models=models)
+        world.find_league(league_id=1)
+    return world
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    payload = helpers.make_leagues_payload(leagues_count)
+    payload_json = json.dumps(payload)
+    parsed, payload_size, _ = retained(lambda: json.loads(payload_json))
+    del parsed
+    leagues, models_size, elapsed = retained(lambda: leagues_from_payload(json.loads(payload_json)))
+    seasons = sum(len(lg.seasons) for lg in leagues)
+    del leagues
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            World(serializer="json", data_dir=data_dir.path).caching["leagues"].write(payload)
+        world, world_size, _ = retained(lambda: loaded_world(data_dir.path, models=False))
+        del world
+        world, world_models_size, _ = retained(lambda: loaded_world(data_dir.path, models=True))
+        del world
+    finally:
+        data_dir.cleanup()
+    print(f"{leagues_count} leagues, {seasons} seasons")
+    print(f"                     dicts: {payload_size / 1024:.0f} KiB")
+    print(f"                    models: {models_size / 1024:.0f} KiB ({models_size / payload_size:.1%}), "
+          f"parse and convert {elapsed * 1000:.0f} ms (traced)")
+    print(f"  World(models=False) retains: {world_size / 1024:.0f} KiB, payload and indexes")
+    print(f"   World(models=True) retains: {world_models_size / 1024:.0f} KiB "
+          f"({world_models_size / world_size:.1%}), models and indexes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark: leagues ingest throughput, JSON files vs MongoDB bulk upserts, and single-league lookups
+Runs against the in-memory mongomock stand-in unless FOOTBALL_MONGO_URI points to a server,
+e.g. FOOTBALL_MONGO_URI=mongodb://localhost:27017/football_client_bench
+mongomock scans its documents on every upsert, only the numbers of a real server are meaningful
+Usage: PYTHONPATH=src python test/bench_mongo.py [leagues] [lookups]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import timeit
+import helpers
+
+os.environ.setdefault("FOOTBALL_MONGO_URI", "mongomock://localhost/football_client_bench")
+
+from football_client.serializer_factory import SerializerFactory  # noqa: E402
+
+
+def main():
+    mongomock = os.environ["FOOTBALL_MONGO_URI"].startswith("mongomock://")
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else (100 if mongomock else 1200)
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    payload = helpers.make_leagues_payload(leagues_count)
+    ids = [random.randint(1, leagues_count) for _ in range(lookups)]
+    data_dir = helpers.TempDataDir(with_leagues=False)
+    try:
+        factory = SerializerFactory(data_dir.path)
+        print(f"{leagues_count} leagues, {os.environ['FOOTBALL_MONGO_URI']}")
+        for serializer_type in ("json", "mongo"):
+            serializer = factory.create_serializer(serializer_type=serializer_type, entity="leagues")
+            with contextlib.redirect_stdout(io.StringIO()):
+                write_time = min(timeit.repeat(lambda: serializer.write(payload), number=1, repeat=3))
+            read_time = min(timeit.repeat(serializer.read, number=1, repeat=3))
+            print(f"{serializer_type:>6}: ingest {write_time * 1000:.0f} ms "
+                  f"({leagues_count / write_time:.0f} leagues/s), read {read_time * 1000:.0f} ms")
+            if serializer_type == "mongo":
+                lookup_time = timeit.timeit(lambda: [serializer.find(league_id=league_id) for league_id in ids],
+                                            number=1)
+                print(f"        indexed lookup {lookup_time / lookups * 1000:.3f} ms/league")
+                serializer.database.client.drop_database(serializer.database.name)
+    finally:
+        data_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark: cumulative import time of the CLI and the client modules, read from python -X importtime
+in fresh interpreters, without an API key or data directory
+Usage: PYTHONPATH=src python test/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MODULES = ["cli.football_cli", "football_client.api_client", "football_client.settings"]
+
+
+def import_times(runs):
+    """
+    :return: dict of module -> median cumulative import time in microseconds
+    """
+    times = {module: [] for module in MODULES}
+    with tempfile.TemporaryDirectory(prefix="football_client_home_") as home:
+        env = {key: value for key, value in os.environ.items()
+               if key not in ("FOOTBALL_API_KEY", "FOOTBALL_DATA_DIR")}
+        env.update(HOME=home, PYTHONPATH=os.pathsep.join(sys.path))
+        for _ in range(runs):
+            result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import cli.football_cli"],
+                                    env=env, check=True, capture_output=True, text=True)
+            for line in result.stderr.splitlines():
+                if not line.startswith("import time:") or "|" not in line:
+                    continue
+                _, cumulative, module = line.split("|")
+                if module.strip() in times and cumulative.strip().isdigit():
+                    times[module.strip()].append(int(cumulative))
+    return {module: statistics.median(values) for module, values in times.items() if values}
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"Median of {runs} runs")
+    for module, cumulative in import_times(runs).items():
+        print(f"{module:>28}: {cumulative / 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
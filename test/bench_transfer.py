@@ -0,0 +1,49 @@
+"""
+Benchmark: bytes transferred, request latency and peak memory of fetching the leagues payload from the local
+stand-in server, identity vs gzip encoded responses
+On loopback the transfer itself is nearly free, so the time on a slower link is estimated from the bytes;
+the gzip loopback latency includes the stand-in server compressing every response
+Usage: PYTHONPATH=src python test/bench_transfer.py [leagues] [link Mbit/s]
+"""
+import statistics
+import sys
+import time
+import tracemalloc
+import helpers
+from football_client.transport import ConnectionPool
+
+
+def measure(server, compress, requests=10):
+    """
+    :return: (bytes per response, median latency, peak of traced allocations of one request)
+    """
+    with ConnectionPool("127.0.0.1", server.port, secure=False, pool_size=1, compress=compress) as pool:
+        pool.request("GET", "/leagues")
+        received = pool.bytes_received
+        elapsed = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            pool.request("GET", "/leagues")
+            elapsed.append(time.perf_counter() - started)
+        tracemalloc.start()
+        pool.request("GET", "/leagues")
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return received, statistics.median(elapsed), peak
+
+
+def main():
+    leagues_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    link_mbit = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    payload = helpers.make_leagues_payload(leagues_count)
+    with helpers.MockApiServer(routes={"/leagues": payload}, compress=True) as server:
+        results = {"identity": measure(server, compress=False), "gzip": measure(server, compress=True)}
+    print(f"{leagues_count} leagues")
+    for name, (received, latency, peak) in results.items():
+        link_time = received * 8 / (link_mbit * 10 ** 6)
+        print(f"{name:>8}: {received / 1024:7.0f} KiB transferred, loopback {latency * 1000:4.0f} ms, "
+              f"+{link_time * 1000:5.0f} ms at {link_mbit:g} Mbit/s, peak {peak / 1024:.0f} KiB allocated")
+
+
+if __name__ == "__main__":
+    main()
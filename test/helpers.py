@@ -0,0 +1,153 @@
+import copy
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from football_client.scheduler import RequestScheduler
+from football_client.transport import ConnectionPool
+
+# Settings are resolved from the environment, keep tests away from the real home directory
+os.environ.setdefault("FOOTBALL_API_KEY", "test-api-key")
+os.environ.setdefault("FOOTBALL_DATA_DIR", tempfile.mkdtemp(prefix="football_client_test_"))
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+MOCK_LEAGUES_FILE = os.path.join(ASSETS_DIR, "mock_leagues.json")
+
+
+def load_mock_leagues():
+    """
+    :return: mock /leagues payload
+    """
+    with open(MOCK_LEAGUES_FILE) as json_file:
+        return json.load(json_file)
+
+
+def make_leagues_payload(count):
+    """
+    Generate a synthetic /leagues payload by cloning the mock leagues with new IDs and names
+    :param count: number of leagues
+    :return: dict
+    """
+    payload = load_mock_leagues()
+    templates = payload["response"]
+    response = []
+    for i in range(count):
+        lg = copy.deepcopy(templates[i % len(templates)])
+        lg["league"]["id"] = i + 1
+        lg["league"]["name"] = f"{lg['league']['name']} {i // len(templates)}"
+        response.append(lg)
+    payload["response"] = response
+    payload["results"] = count
+    return payload
+
+
+def unthrottled_scheduler():
+    """
+    :return: RequestScheduler that never paces requests against the local mock server
+    """
+    return RequestScheduler(requests_per_minute=10 ** 9)
+
+
+class TempDataDir:
+    """
+    Temporary data directory with the mock leagues cache in place
+    """
+
+    def __init__(self, with_leagues=True):
+        self.path = tempfile.mkdtemp(prefix="football_client_test_")
+        if with_leagues:
+            shutil.copy(MOCK_LEAGUES_FILE, os.path.join(self.path, "leagues.json"))
+
+    def cleanup(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class _CountingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        # Called once per accepted TCP connection, i.e. once per handshake
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class MockApiServer:
+    """
+    Local stand-in for the API host serving canned JSON payloads over keep-alive HTTP/1.1
+    """
+
+    def __init__(self, routes=None, latency=0.0, compress=False):
+        """
+        :param routes: dict of path (without query) -> payload dict, or callable(handler) -> (status, headers, payload)
+        :param latency: seconds to sleep before each response
+        :param compress: gzip the bodies for clients accepting gzip
+        """
+        self.routes = routes or {}
+        self.latency = latency
+        self.compress = compress
+        self.requests = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes, avoid delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append(self.path)
+                if server.latency:
+                    time.sleep(server.latency)
+                route = server.routes.get(urlsplit(self.path).path)
+                if route is None:
+                    status, headers, payload = 404, {}, {"errors": {"endpoint": "Not found"}}
+                elif callable(route):
+                    status, headers, payload = route(self)
+                else:
+                    status, headers, payload = 200, {}, route
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                if server.compress and body and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    headers = dict(headers, **{"Content-Encoding": "gzip"})
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = _CountingHTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def connections(self):
+        return self.server.connections
+
+    def transport(self, pool_size=4):
+        """
+        :return: ConnectionPool pointed at this server
+        """
+        return ConnectionPool("127.0.0.1", self.port, secure=False, pool_size=pool_size)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import time
+import unittest
+import helpers
+from football_client.async_client import AsyncWorld
+
+
+class InFlightRoute:
+    """
+    Route handler tracking the peak number of concurrent requests
+    """
+
+    def __init__(self, payload, latency):
+        self.payload = payload
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, handler):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return 200, {}, self.payload
+
+
+class TestAsyncWorld(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_lookup_api_matches_world(self):
+        routes = {"/leagues": helpers.load_mock_leagues(),
+                  "/countries": {"errors": [], "response": [{"name": "France", "code": "FR", "flag": None}]}}
+        with helpers.MockApiServer(routes=routes) as server:
+            world = AsyncWorld(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                               scheduler=helpers.unthrottled_scheduler())
+
+            async def lookups():
+                await world.load()
+                return (await world.get_league(league_id=61), await world.get_country(country_code="FR"),
+                        await world.find_leagues("serie a", ignore_case=True), await world.all_leagues())
+
+            league, country, found, leagues = asyncio.run(lookups())
+            world.close()
+        self.assertEqual(league["league"]["name"], "Ligue 1")
+        self.assertEqual(country["name"], "France")
+        self.assertEqual([lg["league"]["id"] for lg in found], [71])
+        self.assertEqual(len(leagues), 5)
+        self.assertEqual(sorted(server.requests), ["/countries", "/leagues"])
+
+    def test_requests_run_concurrently_up_to_limit(self):
+        route = InFlightRoute({"errors": [], "response": [{"team": {"id": 1}}]}, latency=0.05)
+        with helpers.MockApiServer(routes={"/teams": route}) as server:
+            world = AsyncWorld(serializer="json", data_dir=self.data_dir.path,
+                               transport=server.transport(pool_size=4),
+                               scheduler=helpers.unthrottled_scheduler(), concurrency=4)
+
+            async def fetch_all():
+                return await asyncio.gather(*(world.get_teams(league_id=lg, season=2023) for lg in range(12)))
+
+            results = asyncio.run(fetch_all())
+            world.close()
+        self.assertEqual(len(results), 12)
+        # The requests overlapped, at most 4 at a time
+        self.assertEqual(route.peak, 4)
+        self.assertIn("/teams?league=11&season=2023", server.requests)
+
+    def test_cold_lookups_take_the_world_paths(self):
+        leagues = helpers.load_mock_leagues()
+
+        def filtered(handler):
+            response = [lg for lg in leagues["response"] if f"id={lg['league']['id']}" in handler.path]
+            return 200, {}, dict(leagues, results=len(response), response=response)
+
+        with helpers.MockApiServer(routes={"/leagues": filtered}) as server:
+            world = AsyncWorld(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                               scheduler=helpers.unthrottled_scheduler())
+            league = asyncio.run(world.get_league(league_id=61))
+            world.close()
+        self.assertEqual(league["league"]["name"], "Ligue 1")
+        # A filtered request instead of loading every league
+        self.assertEqual(server.requests, ["/leagues?id=61"])
+        self.assertEqual(world.leagues, {})
+
+    def test_world_options_forwarded(self):
+        data_dir = helpers.TempDataDir()
+        try:
+            world = AsyncWorld.shared(serializer="json", data_dir=data_dir.path, cache_format="json", models=True)
+            self.assertIs(AsyncWorld.shared(serializer="json", data_dir=data_dir.path, models=True), world)
+            self.assertIsInstance(world, AsyncWorld)
+            self.assertEqual(asyncio.run(world.get_league(league_id=61)).country.name, "France")
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.binary_serializer import BinarySerializer, LeaguesBinarySerializer
+from football_client.serializer_factory import SerializerFactory
+
+
+class TestBinarySerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_roundtrip(self):
+        serializer = SerializerFactory(self.data_dir.path).create_serializer(serializer_type="binary",
+                                                                             entity="leagues")
+        self.assertIsInstance(serializer, BinarySerializer)
+        self.assertEqual(serializer.read(), {})
+        payload = helpers.load_mock_leagues()
+        serializer.write(payload)
+        self.assertEqual(serializer.read(), payload)
+        self.assertTrue(serializer.serialized_file.endswith("leagues.bin"))
+
+    def test_iterable_roundtrip(self):
+        serializer = BinarySerializer(self.data_dir.path, file_name="players")
+        serializer.write({"id": i} for i in range(3))
+        self.assertEqual(serializer.read(), [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_rejects_foreign_file(self):
+        serializer = BinarySerializer(self.data_dir.path, file_name="leagues")
+        with open(serializer.serialized_file, "wb") as bin_file:
+            bin_file.write(b"{}")
+        with self.assertRaises(ValueError):
+            serializer.read()
+
+    def test_world_binary_cache(self):
+        routes = {"/leagues": helpers.load_mock_leagues()}
+        with helpers.MockApiServer(routes=routes) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format="binary", targeted=False)
+            world.get_league(league_id=61)
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format="binary", targeted=False)
+            self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(server.requests, ["/leagues"])
+        self.assertIsInstance(world.caching["leagues"], BinarySerializer)
+
+
+class TestLeaguesBinaryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        LeaguesBinarySerializer(self.data_dir.path).write(helpers.make_leagues_payload(500))
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def world(self):
+        return World(serializer="json", data_dir=self.data_dir.path, cache_format="binary")
+
+    def test_find_decodes_single_record(self):
+        serializer = LeaguesBinarySerializer(self.data_dir.path)
+        self.assertEqual(serializer.find(league_id=123)["league"]["id"], 123)
+        self.assertEqual(serializer.find(league_name="Ligue 1 3")["league"]["id"], 18)
+        self.assertEqual(serializer.find(league_id=100500), {})
+        self.assertIsNone(serializer.find())
+        serializer.close()
+
+    def test_world_lookup_without_full_load(self):
+        world = self.world()
+        self.assertEqual(world.get_league(league_id=250)["league"]["id"], 250)
+        self.assertEqual(world.leagues, {})
+        mapped = world.caching["leagues"]._mmap
+        world.close()
+        self.assertTrue(mapped.closed)
+        self.assertEqual(world.get_league(league_id=251)["league"]["id"], 251)
+        world.close()
+
+    def test_fallback_to_full_load(self):
+        os.remove(os.path.join(self.data_dir.path, "leagues.idx"))
+        world = self.world()
+        self.assertEqual(world.get_league(league_id=250)["league"]["id"], 250)
+        self.assertEqual(len(world.leagues["response"]), 500)
+
+    def test_outdated_index_ignored(self):
+        # Cache replaced by a writer that doesn't maintain the index
+        BinarySerializer(self.data_dir.path, file_name="leagues").write(helpers.make_leagues_payload(3))
+        self.assertIsNone(LeaguesBinarySerializer(self.data_dir.path).find(league_id=250))
+        self.assertEqual(self.world().get_league(league_id=250), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import contextlib
+import io
+import json
+import os
+import time
+import unittest
+import helpers
+from cli.football_cli import FootballClientApp, main
+from football_client.settings import settings
+
+
+class TestBatchCommand(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # The CLI works on the shared World over the configured data directory, point it at a temporary one
+        cls.data_dir = helpers.TempDataDir()
+        cls.previous_data_dir = os.environ.get("FOOTBALL_DATA_DIR")
+        os.environ["FOOTBALL_DATA_DIR"] = cls.data_dir.path
+        settings.reset()
+        cls.input_dir = helpers.TempDataDir(with_leagues=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.previous_data_dir is None:
+            os.environ.pop("FOOTBALL_DATA_DIR")
+        else:
+            os.environ["FOOTBALL_DATA_DIR"] = cls.previous_data_dir
+        settings.reset()
+        cls.input_dir.cleanup()
+        cls.data_dir.cleanup()
+
+    def run_batch(self, identifiers, output_format):
+        input_file = os.path.join(self.input_dir.path, "identifiers.txt")
+        with open(input_file, "w") as ids_file:
+            ids_file.write("\n".join(identifiers))
+        output, diagnostics = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(diagnostics):
+            self.assertEqual(main(["batch", "league", "--input", input_file, "--format", output_format]), 0)
+        return output.getvalue().splitlines(), diagnostics.getvalue()
+
+    def test_jsonl_output(self):
+        lines, diagnostics = self.run_batch(["61", "Serie A", "", "100500"], "jsonl")
+        results = [json.loads(line) for line in lines]
+        self.assertEqual([result["identifier"] for result in results], ["61", "Serie A", "100500"])
+        self.assertEqual(results[0]["league"]["league"]["name"], "Ligue 1")
+        self.assertEqual(results[1]["league"]["league"]["id"], 71)
+        self.assertIsNone(results[2]["league"])
+        self.assertIn("Resolved 2 of 3 league identifiers", diagnostics)
+
+    def test_tsv_output(self):
+        lines, _ = self.run_batch(["144", "Unknown League"], "tsv")
+        self.assertEqual(lines, ["Identifier\tID\tName\tType\tCountry",
+                                 "144\t144\tJupiler Pro League\tLeague\tBelgium",
+                                 "Unknown League\t\t\t\t"])
+
+    def test_hundred_thousand_identifiers(self):
+        identifiers = ["4", "Ligue 1", "71", "Confederations Cup", "999"] * 20000
+        app = FootballClientApp(action="batch", entity="league", serializer="json")
+        output = io.StringIO()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resolved, total = app.batch_leagues(identifiers, output, output_format="tsv")
+        elapsed = time.perf_counter() - started
+        self.assertEqual((resolved, total), (80000, 100000))
+        self.assertLess(elapsed, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
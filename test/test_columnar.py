@@ -0,0 +1,75 @@
+import datetime
+import unittest
+from collections import Counter
+import helpers
+from football_client import columnar
+from football_client.api_client import World
+from football_client.columnar import LeagueTable
+
+
+class ColumnarTests:
+    """
+    Checks of the columnar helpers against plain loops over the payload, run for every backend
+    """
+
+    use_numpy = None
+
+    def setUp(self):
+        self.payload = helpers.make_leagues_payload(200)
+        self.table = LeagueTable.from_payload(self.payload, use_numpy=self.use_numpy)
+
+    def test_filter(self):
+        expected = [lg["league"]["id"] for lg in self.payload["response"]
+                    if lg["league"]["type"] == "Cup" and any(s["year"] == 2016 for s in lg["seasons"])]
+        self.assertEqual(self.table.filter(league_type="Cup", season=2016), expected)
+        self.assertEqual(self.table.filter(country="FR"), self.table.filter(country="France"))
+        self.assertEqual(len(self.table.filter(country="France")), 40)
+        self.assertEqual(self.table.filter(country="Spain"), [])
+        self.assertEqual(self.table.filter(league_type="Friendly"), [])
+        self.assertEqual(len(self.table.filter()), 200)
+
+    def test_count_leagues(self):
+        expected = Counter(lg["league"]["type"] for lg in self.payload["response"])
+        self.assertEqual(self.table.count_leagues("type"), dict(expected))
+        self.assertEqual(self.table.count_leagues("country", league_type="Cup"), {"World": 80})
+
+    def test_count_seasons(self):
+        response = self.payload["response"]
+        expected = Counter(lg["country"]["name"] for lg in response for _ in lg["seasons"])
+        self.assertEqual(self.table.count_seasons("country"), dict(expected))
+        expected = Counter(s["year"] for lg in response if lg["league"]["type"] == "League" for s in lg["seasons"])
+        self.assertEqual(self.table.count_seasons("year", league_type="League"), dict(expected))
+        self.assertEqual(self.table.count_seasons("type", year=2023), {"League": 120})
+        self.assertEqual(self.table.count_seasons("type", current=True),
+                         dict(Counter(lg["league"]["type"] for lg in response for s in lg["seasons"] if s["current"])))
+        # Euro 2016 and the 2016 Brazilian season
+        self.assertEqual(self.table.count_seasons("country", active_on=datetime.date(2016, 6, 20)),
+                         {"World": 40, "Brazil": 40})
+        with self.assertRaises(ValueError):
+            self.table.count_seasons("name")
+
+
+class TestPythonColumns(ColumnarTests, unittest.TestCase):
+    use_numpy = False
+
+
+@unittest.skipIf(columnar.numpy is None, "numpy is not installed")
+class TestNumpyColumns(ColumnarTests, unittest.TestCase):
+    use_numpy = True
+
+
+class TestWorldLeagueTable(unittest.TestCase):
+
+    def test_table_shared_per_payload(self):
+        data_dir = helpers.TempDataDir()
+        try:
+            world = World(serializer="json", data_dir=data_dir.path)
+            table = world.league_table()
+            self.assertIs(world.league_table(), table)
+            self.assertEqual(table.filter(country="World", league_type="Cup"), [4, 21])
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
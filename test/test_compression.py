@@ -0,0 +1,74 @@
+import gzip
+import importlib.util
+import json
+import os
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.compression import CODECS, get_codec
+from football_client.csv_serializer import CsvSerializer
+from football_client.serializer_factory import SerializerFactory
+
+SETTINGS = {"headers": ["id", "name"], "columns": ["id", "name"], "delimiter": "\t"}
+# zstd needs the zstandard package
+AVAILABLE_CODECS = [name for name in CODECS if name != "zstd" or importlib.util.find_spec("zstandard")]
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        self.factory = SerializerFactory(self.data_dir.path)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_json_roundtrip_per_codec(self):
+        payload = helpers.make_leagues_payload(30)
+        plain = self.factory.create_serializer(serializer_type="json", entity="leagues")
+        plain.write(payload)
+        for name in AVAILABLE_CODECS:
+            with self.subTest(codec=name):
+                serializer = self.factory.create_serializer(serializer_type="json", entity="leagues", compression=name)
+                serializer.write(payload)
+                extension = get_codec(name).extension
+                self.assertTrue(serializer.serialized_file.endswith(f"leagues.json.{extension}"))
+                self.assertLess(os.path.getsize(serializer.serialized_file), os.path.getsize(plain.serialized_file))
+                self.assertEqual(serializer.read(), payload)
+                simplified = os.path.join(self.data_dir.path, f"seasons_simplified.json.{extension}")
+                with get_codec(name).open(simplified) as json_file:
+                    self.assertEqual(len(json.load(json_file)), sum(len(lg["seasons"]) for lg in payload["response"]))
+
+    def test_output_is_standard_gzip(self):
+        serializer = self.factory.create_serializer(serializer_type="json", entity="countries", compression="gzip")
+        serializer.write({"response": [{"name": "World"}]})
+        with gzip.open(os.path.join(self.data_dir.path, "countries.json.gz"), "rt") as json_file:
+            self.assertEqual(json.load(json_file), {"response": [{"name": "World"}]})
+
+    def test_csv_append(self):
+        serializer = CsvSerializer(self.data_dir.path, file_name="players", settings=dict(SETTINGS, compression="lzma"))
+        serializer.write({"id": i, "name": f"Player {i}"} for i in range(3))
+        serializer.write(({"id": i, "name": f"Player {i}"} for i in range(3, 5)), append=True)
+        self.assertEqual([row["id"] for row in serializer.iter_rows()], ["0", "1", "2", "3", "4"])
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            self.factory.create_serializer(serializer_type="json", entity="leagues", compression="rar")
+        with self.assertRaises(ValueError):
+            self.factory.create_serializer(serializer_type="binary", entity="leagues", compression="gzip")
+
+    def test_world_compressed_cache(self):
+        with helpers.MockApiServer(routes={"/leagues": helpers.load_mock_leagues()}) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), targeted=False, cache_compression="bz2")
+            world.get_league(league_id=61)
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_compression="bz2")
+            self.assertEqual(world.get_league(league_id=71)["league"]["name"], "Serie A")
+        self.assertEqual(server.requests, ["/leagues"])
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir.path, "leagues.json.bz2")))
+        self.assertFalse(os.path.exists(os.path.join(self.data_dir.path, "leagues.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+import helpers
+from football_client.csv_serializer import CsvSerializer, LeaguesCsvSerializer
+
+SETTINGS = {"headers": ["id", "name", "country"], "columns": ["id", "name", "country"], "delimiter": "\t"}
+
+# Streams a synthetic million-row dataset through the serializer and reports the peak RSS in MB
+MILLION_ROWS_SCRIPT = """
+import sys
+from football_client.csv_serializer import CsvSerializer
+def peak_rss_mb():
+    with open("/proc/self/status") as status:
+        return next(int(line.split()[1]) // 1024 for line in status if line.startswith("VmHWM"))
+serializer = CsvSerializer(sys.argv[1], file_name="players", settings={
+    "headers": ["id", "name", "country"], "columns": ["id", "name", "country"], "delimiter": "\\t"})
+serializer.write({"id": i, "name": f"Player {i}", "country": "Brazil"} for i in range(1000000))
+count = sum(1 for row in serializer.iter_rows(columns=["id"]) if row["id"])
+print(count, peak_rss_mb())
+"""
+
+
+class TestCsvSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        self.serializer = CsvSerializer(self.data_dir.path, file_name="players", settings=SETTINGS)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_generator_roundtrip(self):
+        self.serializer.write({"id": i, "name": f"Player {i}", "country": "Brazil"} for i in range(10000))
+        rows = self.serializer.iter_rows()
+        self.assertEqual(next(rows), {"id": "0", "name": "Player 0", "country": "Brazil"})
+        self.assertEqual(len(self.serializer.read()), 10000)
+
+    def test_append_writes_header_once(self):
+        self.serializer.write([{"id": 1, "name": "A", "country": "France"}], append=True)
+        self.serializer.write([{"id": 2, "name": "B", "country": "Brazil"}], append=True)
+        with open(self.serializer.serialized_file) as tsv_file:
+            self.assertEqual(tsv_file.read().splitlines(), ["id\tname\tcountry", "1\tA\tFrance", "2\tB\tBrazil"])
+
+    def test_column_projection(self):
+        self.serializer.write([{"id": 1, "name": "A", "country": "France"}])
+        self.assertEqual(self.serializer.read(columns=["country", "id"]), [{"country": "France", "id": "1"}])
+        with self.assertRaises(KeyError):
+            self.serializer.read(columns=["age"])
+
+    def test_leagues_serializer(self):
+        serializer = LeaguesCsvSerializer(self.data_dir.path)
+        serializer.write(iter([{"id": 61, "name": "Ligue 1", "type": "League", "country": "France",
+                                "seasons": [2022, 2023]}]))
+        self.assertEqual(serializer.read(columns=["ID", "Seasons"]), [{"ID": "61", "Seasons": "2022, 2023"}])
+
+    @unittest.skipUnless(os.path.exists("/proc/self/status"), "peak RSS is read from procfs")
+    def test_million_rows_bounded_memory(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, "-c", MILLION_ROWS_SCRIPT, self.data_dir.path], env=env,
+                                check=True, capture_output=True, text=True).stdout.split()
+        count, peak_mb = int(output[-2]), int(output[-1])
+        self.assertEqual(count, 1000000)
+        # A materialized list of a million rows alone takes several hundred MB
+        self.assertLess(peak_mb, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
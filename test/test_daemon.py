@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+import helpers
+from concurrent.futures import ThreadPoolExecutor
+from football_client.api_client import World
+from football_client.daemon import DaemonClient, QueryServer
+from football_client.errors import ApiError
+from football_client.response_cache import ResponseCache
+
+
+class TestQueryDaemon(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = helpers.TempDataDir()
+        cls.world = World(serializer="json", data_dir=cls.data_dir.path)
+        cls.world.countries = {"response": [
+            {"name": "England", "code": "GB", "flag": None},
+            {"name": "France", "code": "FR", "flag": None},
+        ]}
+        cls.server = QueryServer(cls.world)
+        cls.server.warm_up()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.data_dir.cleanup()
+
+    def setUp(self):
+        self.client = DaemonClient(self.server.url, pool_size=4)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_league_lookups(self):
+        self.assertEqual(self.client.find_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(self.client.find_league(league_name="Serie A")["league"]["id"], 71)
+        self.assertEqual(self.client.find_league(league_id=100500), {})
+
+    def test_country_and_seasons_lookups(self):
+        self.assertEqual(self.client.find_country(country_code="FR")["name"], "France")
+        self.assertEqual(self.client.find_country(country_name="Spain"), {})
+        seasons = self.client.get_seasons(61)
+        self.assertEqual(seasons, self.world.find_league(league_id=61)["seasons"])
+        self.assertEqual(self.client.get_seasons(100500), [])
+
+    def test_bad_requests(self):
+        with self.assertRaises(ApiError):
+            self.client.get_seasons("Ligue 1")
+        with self.assertRaises(ApiError):
+            self.client._get("/teams")
+
+    def test_concurrent_clients_share_keep_alive_connections(self):
+        created = self.client.transport.connections_created
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            names = list(executor.map(lambda _: self.client.find_league(league_id=71)["league"]["name"], range(200)))
+        self.assertEqual(names, ["Serie A"] * 200)
+        self.assertLessEqual(self.client.transport.connections_created - created, 4)
+
+
+class TestDaemonMaintenance(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir()
+        self.leagues = helpers.load_mock_leagues()
+        self.api = helpers.MockApiServer(routes={"/leagues": self.leagues, "/countries": {"response": []}})
+        self.api.__enter__()
+        self.now = time.time()
+        cache = ResponseCache(self.data_dir.path, clock=lambda: self.now)
+        self.world = World(serializer="json", data_dir=self.data_dir.path, cache=cache,
+                           transport=self.api.transport(), scheduler=helpers.unthrottled_scheduler())
+        self.server = QueryServer(self.world)
+        self.server.warm_up()
+        self.api.requests.clear()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = DaemonClient(self.server.url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.api.__exit__(None, None, None)
+        self.data_dir.cleanup()
+
+    def test_stale_data_refreshed_in_background(self):
+        # Two days later the warmed up leagues are stale
+        self.now += 2 * 24 * 3600
+        for _ in range(5):
+            self.assertEqual(self.client.find_league(league_id=61)["league"]["name"], "Ligue 1")
+        refreshing = self.world._refreshing.get("leagues")
+        if refreshing:
+            refreshing.join()
+        # Once per REVALIDATE_INTERVAL, not once per lookup
+        self.assertEqual(self.api.requests, ["/leagues"])
+
+    def test_unexpected_error_answered(self):
+        def broken(**kwargs):
+            raise OSError("Disk failure")
+
+        self.world.find_country = broken
+        with self.assertRaises(ApiError) as raised:
+            self.client.find_country(country_code="FR")
+        self.assertIn("Disk failure", raised.exception.errors["server"])
+        # The connection stays usable
+        self.assertEqual(self.client.find_league(league_id=71)["league"]["name"], "Serie A")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import copy
+import importlib.util
+import json
+import os
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.delta import diff_leagues
+from football_client.settings import settings
+
+HAS_MONGOMOCK = importlib.util.find_spec("pymongo") is not None and importlib.util.find_spec("mongomock") is not None
+
+
+def changed_payload(payload):
+    """
+    Copy of the payload with one league renamed, one season changed, one league removed and one added
+    """
+    changed = copy.deepcopy(payload)
+    changed["response"][0]["league"]["name"] = "Renamed"
+    changed["response"][1]["seasons"][0]["current"] = not changed["response"][1]["seasons"][0]["current"]
+    removed = changed["response"].pop(2)
+    added = copy.deepcopy(removed)
+    added["league"]["id"] = 100000
+    changed["response"].append(added)
+    return changed, removed
+
+
+class TestDiffLeagues(unittest.TestCase):
+
+    def test_diff(self):
+        payload = helpers.make_leagues_payload(5)
+        self.assertFalse(diff_leagues(payload, copy.deepcopy(payload)))
+        changed, removed = changed_payload(payload)
+        first, second = (lg["league"]["id"] for lg in payload["response"][:2])
+        changes = diff_leagues(payload, changed)
+        self.assertEqual(changes.added, [100000])
+        self.assertEqual(changes.removed, [removed["league"]["id"]])
+        self.assertEqual(changes.modified, [first])
+        self.assertEqual(changes.seasons_modified, [(second, payload["response"][1]["seasons"][0]["year"])])
+        self.assertEqual(len(changes.seasons_added), len(removed["seasons"]))
+        self.assertEqual(len(changes.seasons_removed), len(removed["seasons"]))
+        self.assertEqual(changes.changed, [first, second, 100000])
+
+    def test_cold_cache_adds_everything(self):
+        payload = helpers.make_leagues_payload(3)
+        changes = diff_leagues({}, payload)
+        self.assertEqual(changes.added, [lg["league"]["id"] for lg in payload["response"]])
+        self.assertTrue(changes.envelope_changed)
+
+
+class TestSyncLeagues(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        self.payload = helpers.make_leagues_payload(20)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def sync(self, cache_format, payloads):
+        """
+        Sync once per payload
+        :return: (list of ChangeLog, World)
+        """
+        served = []
+        with helpers.MockApiServer(routes={"/leagues": lambda handler: (200, {}, served[-1])}) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format=cache_format)
+            results = []
+            for payload in payloads:
+                served.append(payload)
+                results.append(world.sync_leagues())
+        return results, world
+
+    def test_unchanged_payload_is_not_rewritten(self):
+        leagues_file = os.path.join(self.data_dir.path, "leagues.json")
+        changes, _ = self.sync("json", [self.payload])
+        self.assertEqual(len(changes[0].added), 20)
+        os.utime(leagues_file, (0, 0))
+        changes, world = self.sync("json", [copy.deepcopy(self.payload)])
+        self.assertFalse(changes[0])
+        self.assertEqual(os.stat(leagues_file).st_mtime, 0)
+        self.assertEqual(world.leagues, self.payload)
+        self.assertEqual(world.cache.stats.refreshed, 1)
+
+    def test_change_log(self):
+        changed, _ = changed_payload(self.payload)
+        (_, changes), world = self.sync("json", [self.payload, changed])
+        self.assertEqual(world.caching["leagues"].read(), changed)
+        with open(os.path.join(self.data_dir.path, "leagues_changes.jsonl")) as log_file:
+            lines = [json.loads(line) for line in log_file]
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[1]["added"], [100000])
+        self.assertEqual(lines[1]["modified"], changes.modified)
+        self.assertIn("synced_at", lines[1])
+
+    def test_sqlite_applies_only_changes(self):
+        changed, removed = changed_payload(self.payload)
+        (_, changes), world = self.sync("sqlite", [self.payload, changed])
+        serializer = world.caching["leagues"]
+        self.assertEqual(len(changes.changed), 3)
+        self.assertEqual(serializer.read(), changed)
+        self.assertEqual(serializer.find(league_id=removed["league"]["id"]), {})
+        self.assertEqual(serializer.select(season=changed["response"][-1]["seasons"][0]["year"])[-1]["league"]["id"],
+                         100000)
+
+    @unittest.skipUnless(HAS_MONGOMOCK, "pymongo and mongomock are required")
+    def test_mongo_applies_only_changes(self):
+        from football_client import mongo_serializer
+        os.environ["FOOTBALL_MONGO_URI"] = "mongomock://localhost/football_client_delta"
+        settings.reset()
+        client = mongo_serializer.get_client()
+        try:
+            changed, removed = changed_payload(self.payload)
+            _, world = self.sync("mongo", [self.payload, changed])
+            serializer = world.caching["leagues"]
+            self.assertEqual(serializer.read(), changed)
+            self.assertEqual(serializer.find_seasons(removed["league"]["id"]), [])
+            self.assertEqual(len(serializer.find_seasons(100000)), len(removed["seasons"]))
+        finally:
+            client.drop_database("football_client_delta")
+            os.environ.pop("FOOTBALL_MONGO_URI")
+            settings.reset()
+
+
+if __name__ == '__main__':
+    unittest.main()
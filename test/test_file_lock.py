@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+import helpers
+from football_client import fileutil
+from football_client.fileutil import FileLock, atomic_write
+
+# Worker process: resolve a league through its own World sharing the data directory
+WORKER_SCRIPT = """
+import contextlib, io, sys
+from football_client.api_client import World
+from football_client.scheduler import RequestScheduler
+from football_client.transport import ConnectionPool
+with contextlib.redirect_stdout(io.StringIO()):
+    world = World(serializer="json", data_dir=sys.argv[1], scheduler=RequestScheduler(requests_per_minute=10 ** 9),
+                  transport=ConnectionPool("127.0.0.1", int(sys.argv[2]), secure=False), targeted=False)
+    league = world.get_league(league_id=61)
+print(league["league"]["name"])
+"""
+
+
+class TestAtomicWrite(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        self.path = os.path.join(self.data_dir.path, "data.txt")
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_mode_follows_umask(self):
+        umask = os.umask(0o022)
+        try:
+            with atomic_write(self.path) as text_file:
+                text_file.write("data")
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_failed_write_keeps_previous_file(self):
+        with atomic_write(self.path) as target:
+            target.write("complete")
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as target:
+                target.write("torn")
+                raise RuntimeError("interrupted")
+        with open(self.path) as result:
+            self.assertEqual(result.read(), "complete")
+        self.assertEqual(os.listdir(self.data_dir.path), ["data.txt"])
+
+    def test_lock_serializes_threads(self):
+        # Each thread uses its own FileLock, as World does, with and without flock()
+        for flock_available in (True, False):
+            active, overlaps = [], []
+
+            def critical_section():
+                with FileLock(os.path.join(self.data_dir.path, ".test.lock")):
+                    active.append(1)
+                    overlaps.append(len(active))
+                    time.sleep(0.01)
+                    active.pop()
+
+            with self.subTest(flock=flock_available):
+                fcntl = fileutil.fcntl
+                if not flock_available:
+                    fileutil.fcntl = None
+                try:
+                    threads = [threading.Thread(target=critical_section) for _ in range(8)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                finally:
+                    fileutil.fcntl = fcntl
+                self.assertEqual(overlaps, [1] * 8)
+
+
+class TestSingleFlightFetch(unittest.TestCase):
+
+    def test_concurrent_processes_fetch_once(self):
+        data_dir = helpers.TempDataDir(with_leagues=False)
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        try:
+            with helpers.MockApiServer(routes={"/leagues": helpers.load_mock_leagues()}, latency=0.3) as server:
+                workers = [subprocess.Popen([sys.executable, "-c", WORKER_SCRIPT, data_dir.path, str(server.port)],
+                                            env=env, stdout=subprocess.PIPE, text=True) for _ in range(4)]
+                names = [worker.communicate(timeout=60)[0].strip() for worker in workers]
+            self.assertEqual(names, ["Ligue 1"] * 4)
+            self.assertEqual(server.requests, ["/leagues"])
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import os
+import unittest
+import helpers
+from football_client.json_serializer import JsonSerializer, LeaguesJsonSerializer
+
+
+class TestLeaguesJsonSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        self.serializer = LeaguesJsonSerializer(self.data_dir.path)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def read_file(self, file_name):
+        with open(os.path.join(self.data_dir.path, file_name)) as json_file:
+            return json_file.read()
+
+    def test_single_pass_output_matches_json_dump(self):
+        payload = helpers.make_leagues_payload(12)
+        self.serializer.write(payload)
+        leagues = [{"id": lg["league"]["id"], "name": lg["league"]["name"], "type": lg["league"]["type"],
+                    "country": lg["country"]["name"], "seasons": [season["year"] for season in lg["seasons"]]}
+                   for lg in payload["response"]]
+        seasons = [{"id": lg["league"]["id"], "name": lg["league"]["name"], "country": lg["country"]["name"],
+                    "year": season["year"], "start": season["start"], "end": season["end"]}
+                   for lg in payload["response"] for season in lg["seasons"]]
+        self.assertEqual(self.read_file("leagues.json"), json.dumps(payload, indent=4))
+        self.assertEqual(self.read_file("leagues_simplified.json"), json.dumps(leagues, indent=4))
+        self.assertEqual(self.read_file("seasons_simplified.json"), json.dumps(seasons, indent=4))
+        self.assertEqual(self.serializer.read(), payload)
+
+    def test_envelope_written_around_the_records(self):
+        payload = helpers.make_leagues_payload(3)
+        payload = dict(payload, parameters={"country": "Côte d'Ivoire"}, paging={"current": 1, "total": 1})
+        payload["response"][0]["league"]["name"] = "Ligue 1 \"Uber Eats\"\n"
+        self.serializer.write(payload)
+        self.assertEqual(self.read_file("leagues.json"), json.dumps(payload, indent=4))
+        self.assertEqual(len(json.loads(self.read_file("leagues_simplified.json"))), 3)
+
+    def test_empty_response(self):
+        payload = helpers.make_leagues_payload(0)
+        self.serializer.write(payload)
+        self.assertEqual(self.read_file("leagues.json"), json.dumps(payload, indent=4))
+        self.assertEqual(self.read_file("seasons_simplified.json"), "[]")
+
+    def test_failed_write_keeps_previous_files(self):
+        payload = helpers.load_mock_leagues()
+        self.serializer.write(payload)
+        broken = helpers.make_leagues_payload(10)
+        del broken["response"][5]["seasons"]
+        with self.assertRaises(KeyError):
+            self.serializer.write(broken)
+        self.assertEqual(self.serializer.read(), payload)
+        self.assertEqual(sorted(os.listdir(self.data_dir.path)),
+                         ["leagues.json", "leagues_simplified.json", "seasons_simplified.json"])
+
+    def test_streamed_iterable(self):
+        serializer = JsonSerializer(self.data_dir.path, file_name="players", settings=None)
+        serializer.write({"id": i} for i in range(3))
+        self.assertEqual(self.read_file("players.json"), json.dumps([{"id": i} for i in range(3)], indent=4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import helpers
+from football_client.api_client import World
+
+
+class TestWorldLookups(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir()
+        self.world = World(serializer="json", data_dir=self.data_dir.path)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_get_league_by_id_and_name(self):
+        self.assertEqual(self.world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(self.world.get_league(league_name="Serie A")["league"]["id"], 71)
+        self.assertEqual(self.world.get_league(league_id=100500), {})
+
+    def test_first_match_in_payload_order_wins(self):
+        # Ligue 1 (id 61) precedes Serie A (id 71) in the payload
+        self.assertEqual(self.world.get_league(league_id=71, league_name="Ligue 1")["league"]["id"], 61)
+
+    def test_find_leagues_multi_match_and_case_folding(self):
+        payload = helpers.load_mock_leagues()
+        payload["response"][1]["league"]["name"] = "LIGUE 1"
+        self.world.leagues = payload
+        self.assertEqual([lg["league"]["id"] for lg in self.world.find_leagues("Ligue 1")], [61])
+        self.assertEqual([lg["league"]["id"] for lg in self.world.find_leagues("ligue 1", ignore_case=True)], [21, 61])
+
+    def test_index_rebuilt_on_refresh(self):
+        self.assertEqual(self.world.get_league(league_id=4)["league"]["name"], "Euro Championship")
+        self.world.leagues = helpers.make_leagues_payload(3)
+        self.assertEqual(self.world.get_league(league_id=4), {})
+        self.assertEqual(self.world.get_league(league_id=3)["league"]["name"], "Ligue 1 0")
+
+    def test_query_leagues_scans_loaded_payload(self):
+        self.assertEqual([lg["league"]["id"] for lg in self.world.query_leagues(country="World", season=2016)], [4])
+        self.assertEqual([lg["league"]["id"] for lg in self.world.query_leagues(league_type="League",
+                                                                                 country="BR")], [71])
+
+    def test_get_country(self):
+        self.world.countries = {"response": [
+            {"name": "England", "code": "GB", "flag": None},
+            {"name": "World", "code": None, "flag": None},
+        ]}
+        self.assertEqual(self.world.get_country(country_code="GB")["name"], "England")
+        self.assertEqual(self.world.get_country(country_name="World")["code"], None)
+        self.assertEqual(self.world.get_country(country_name="Atlantis"), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import gc
+import tracemalloc
+import unittest
+import helpers
+from football_client.api_client import League as ApiLeague, World
+from football_client.models import League, Player, Season, Team, countries_model_payload, leagues_from_payload
+from football_client.registry import CacheRegistry
+
+
+class TestModels(unittest.TestCase):
+
+    def test_leagues_share_countries_and_interned_strings(self):
+        payload = helpers.make_leagues_payload(20)
+        leagues = leagues_from_payload(payload)
+        self.assertEqual([lg.id for lg in leagues], list(range(1, 21)))
+        france = [lg for lg in leagues if lg.country.name == "France"]
+        self.assertEqual(len(france), 4)
+        self.assertTrue(all(lg.country is france[0].country for lg in france))
+        self.assertIs(leagues[0].type, leagues[1].type)
+        self.assertFalse(hasattr(leagues[0], "__dict__"))
+        ligue1 = france[0]
+        self.assertEqual(ligue1.country.code, "FR")
+        self.assertEqual(ligue1.seasons[0], Season(2010, "2010-08-07", "2011-05-29", False))
+        self.assertEqual(ligue1.current_season.year, 2023)
+        with self.assertRaises(AttributeError):
+            ligue1.extra = 1
+
+    def test_api_client_league_unchanged(self):
+        record = helpers.load_mock_leagues()["response"][2]
+        league = ApiLeague(record)
+        self.assertEqual((league.id, league.name, league.type, league.country), (61, "Ligue 1", "League", "France"))
+        self.assertEqual(league.seasons, [season["year"] for season in record["seasons"]])
+        self.assertEqual(league.players, [])
+        self.assertEqual(League.from_dict(record).country.name, league.country)
+
+    def test_team_and_player(self):
+        team = Team.from_dict({"team": {"id": 33, "name": "Manchester United", "code": "MUN", "country": "England",
+                                        "founded": 1878, "national": False, "logo": None}, "venue": {}})
+        player = Player.from_dict({"player": {"id": 276, "name": "Neymar", "nationality": "Brazil", "age": 31},
+                                   "statistics": []})
+        self.assertEqual((team.id, team.code, team.founded), (33, "MUN", 1878))
+        self.assertEqual((player.name, player.nationality, player.firstname), ("Neymar", "Brazil", None))
+
+
+class TestWorldModels(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir()
+        self.world = World(serializer="json", data_dir=self.data_dir.path, models=True)
+        self.world.countries = countries_model_payload({"response": [{"name": "England", "code": "GB", "flag": None}]})
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_lookups_return_models(self):
+        league = self.world.get_league(league_id=61)
+        self.assertIsInstance(league, League)
+        self.assertEqual(league.name, "Ligue 1")
+        # Built once per payload
+        self.assertIs(self.world.find_league(league_name="Ligue 1"), league)
+        self.assertIs(self.world.all_leagues()[2], league)
+        self.assertIsNone(self.world.get_league(league_id=100500))
+        self.assertEqual([lg.id for lg in self.world.query_leagues(country="World", league_type="Cup")], [4, 21])
+        self.assertEqual(self.world.get_country(country_code="GB").name, "England")
+        self.assertIsNone(self.world.find_country(country_name="Spain"))
+        self.assertEqual([lg.id for lg in self.world.find_leagues("serie a", ignore_case=True)], [71])
+        self.assertEqual(list(self.world.league_table().filter(country="France")), [61])
+
+    def test_models_replace_the_payload(self):
+        World(serializer="json", data_dir=self.data_dir.path).caching["leagues"].write(
+            helpers.make_leagues_payload(300))
+
+        def retained(models):
+            gc.collect()
+            tracemalloc.start()
+            world = World(serializer="json", data_dir=self.data_dir.path, registry=CacheRegistry(), models=models)
+            world.find_league(league_id=1)
+            gc.collect()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return world, size
+
+        world, dicts_size = retained(models=False)
+        self.assertIsInstance(world.leagues["response"][0], dict)
+        del world
+        world, models_size = retained(models=True)
+        self.assertTrue(all(isinstance(lg, League) for lg in world.leagues["response"]))
+        self.assertLess(models_size, dicts_size / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import importlib.util
+import os
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.settings import settings
+
+# A real server can be used instead of the in-memory stand-in, e.g. mongodb://localhost:27017/football_client_test
+MONGO_URI = os.environ.get("FOOTBALL_TEST_MONGO_URI", "mongomock://localhost/football_client_test")
+HAS_MONGO = importlib.util.find_spec("pymongo") is not None and (
+        not MONGO_URI.startswith("mongomock://") or importlib.util.find_spec("mongomock") is not None)
+
+
+@unittest.skipUnless(HAS_MONGO, "pymongo and mongomock (or FOOTBALL_TEST_MONGO_URI) are required")
+class TestMongoSerializer(unittest.TestCase):
+
+    def setUp(self):
+        from football_client import mongo_serializer
+        self.mongo = mongo_serializer
+        os.environ["FOOTBALL_MONGO_URI"] = MONGO_URI
+        settings.reset()
+        self.client = mongo_serializer.get_client()
+        self.client.drop_database("football_client_test")
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+
+    def tearDown(self):
+        self.client.drop_database("football_client_test")
+        os.environ.pop("FOOTBALL_MONGO_URI")
+        settings.reset()
+        self.data_dir.cleanup()
+
+    def test_roundtrip_in_batches(self):
+        serializer = self.mongo.LeaguesMongoSerializer(self.data_dir.path)
+        serializer.BATCH_SIZE = 7
+        self.assertEqual(serializer.read(), {})
+        payload = helpers.make_leagues_payload(50)
+        serializer.write(payload)
+        self.assertEqual(serializer.read(), payload)
+        seasons = sum(len(lg["seasons"]) for lg in payload["response"])
+        self.assertEqual(serializer.database.seasons.count_documents({}), seasons)
+
+    def test_rewrite_upserts_and_removes(self):
+        serializer = self.mongo.LeaguesMongoSerializer(self.data_dir.path)
+        serializer.write(helpers.make_leagues_payload(20))
+        payload = helpers.make_leagues_payload(10)
+        payload["response"][0]["league"]["name"] = "Renamed"
+        serializer.write(payload)
+        self.assertEqual(serializer.read(), payload)
+        self.assertEqual(serializer.find(league_id=1)["league"]["name"], "Renamed")
+        self.assertEqual(serializer.find(league_id=15), {})
+        self.assertEqual({season["league_id"] for season in serializer.database.seasons.find()}, set(range(1, 11)))
+
+    def test_indexed_lookups(self):
+        serializer = self.mongo.LeaguesMongoSerializer(self.data_dir.path)
+        self.assertIsNone(serializer.find(league_id=61))
+        serializer.write(helpers.load_mock_leagues())
+        self.assertEqual(serializer.find(league_name="Serie A")["league"]["id"], 71)
+        # First written record wins, as in the in-memory lookups
+        self.assertEqual(serializer.find(league_id=71, league_name="Ligue 1")["league"]["id"], 61)
+        self.assertEqual([season["year"] for season in serializer.find_seasons(61)][:2], [2010, 2011])
+        indexed = {tuple(index["key"])[0][0] for index in serializer.collection.index_information().values()}
+        self.assertTrue({"league.id", "league.name", "country.code"} <= indexed)
+
+    def test_iterable_roundtrip(self):
+        serializer = self.mongo.MongoSerializer(self.data_dir.path, file_name="fixtures")
+        serializer.write({"id": i} for i in range(5))
+        self.assertEqual(serializer.read(), [{"id": i} for i in range(5)])
+
+    def test_world_mongo_cache(self):
+        countries = {"errors": [], "response": [{"name": "England", "code": "GB", "flag": None},
+                                                {"name": "World", "code": None, "flag": None}]}
+        routes = {"/leagues": helpers.load_mock_leagues(), "/countries": countries}
+        with helpers.MockApiServer(routes=routes) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format="mongo", targeted=False)
+            world.get_league(league_id=61)
+            world.get_country(country_code="GB")
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format="mongo", targeted=False)
+            self.assertEqual(world.get_league(league_name="Serie A")["league"]["id"], 71)
+            self.assertEqual(world.get_country(country_name="World")["code"], None)
+            self.assertEqual(world.leagues, {})
+        self.assertEqual(server.requests, ["/leagues", "/countries"])
+        self.assertIsInstance(world.caching["countries"], self.mongo.CountriesMongoSerializer)
+
+    def test_parameterized_responses_share_a_collection(self):
+        leagues = helpers.load_mock_leagues()
+
+        def by_id(handler):
+            league_id = int(handler.path.rsplit("=", 1)[1])
+            response = [lg for lg in leagues["response"] if lg["league"]["id"] == league_id]
+            return 200, {}, dict(leagues, response=response)
+
+        with helpers.MockApiServer(routes={"/leagues": by_id}) as server:
+            for _ in range(2):
+                world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                              scheduler=helpers.unthrottled_scheduler(), cache_format="mongo")
+                self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+                self.assertEqual(world.get_league(league_id=71)["league"]["name"], "Serie A")
+        self.assertEqual(server.requests, ["/leagues?id=61", "/leagues?id=71"])
+        database = self.client.get_database("football_client_test")
+        # No collection per query next to the entity ones
+        self.assertLessEqual(set(database.list_collection_names()), {"leagues", "seasons", "countries", "responses"})
+        self.assertEqual(sorted(document["_id"] for document in database.responses.find()),
+                         ["leagues?id=61", "leagues?id=71"])
+
+    def test_rewrite_replaces_the_collections(self):
+        serializer = self.mongo.LeaguesMongoSerializer(self.data_dir.path)
+        serializer.write(helpers.make_leagues_payload(20))
+        serializer.write(helpers.make_leagues_payload(10))
+        self.assertEqual(sorted(serializer.database.list_collection_names()), ["leagues", "payloads", "seasons"])
+        self.assertEqual(serializer.collection.count_documents({}), 10)
+        indexed = {tuple(index["key"])[0][0] for index in serializer.collection.index_information().values()}
+        self.assertTrue({"_pos", "league.id", "league.name", "country.code"} <= indexed)
+        self.assertEqual(len(serializer.database.seasons.index_information()), 2)
+
+    def test_failed_rewrite_keeps_the_collections(self):
+        serializer = self.mongo.LeaguesMongoSerializer(self.data_dir.path)
+        payload = helpers.make_leagues_payload(10)
+        serializer.write(payload)
+        broken = helpers.make_leagues_payload(5)
+        del broken["response"][3]["seasons"]
+        with self.assertRaises(KeyError):
+            serializer.write(broken)
+        self.assertEqual(serializer.read(), payload)
+        self.assertEqual(sorted(serializer.database.list_collection_names()), ["leagues", "payloads", "seasons"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import gc
+import json
+import os
+import threading
+import tracemalloc
+import unittest
+from urllib.parse import parse_qs, urlsplit
+import helpers
+from football_client.api_client import World
+from football_client.json_serializer import JsonSerializer
+from football_client.paginator import Paginator
+
+
+def make_page(page, total, size=20):
+    return {
+        "errors": [],
+        "paging": {"current": page, "total": total},
+        "response": [{"player": {"id": page * 1000 + i, "name": f"Player {page}-{i}", "age": 25,
+                                 "nationality": "Brazil"},
+                      "statistics": [{"team": {"name": "Mock FC"}, "games": {"position": "Midfielder",
+                                                                            "appearences": 10},
+                                      "goals": {"total": 3}}]}
+                     for i in range(size)]
+    }
+
+
+class TestPaginator(unittest.TestCase):
+
+    def test_records_in_page_order(self):
+        paginator = Paginator(lambda page: make_page(page, total=3, size=2))
+        self.assertEqual([record["player"]["id"] for record in paginator], [1000, 1001, 2000, 2001, 3000, 3001])
+        self.assertEqual((paginator.pages, paginator.count), (3, 6))
+
+    def test_next_page_prefetched_while_current_is_processed(self):
+        requested = []
+        fetched = {page: threading.Event() for page in range(1, 4)}
+
+        def fetch_page(page):
+            requested.append(page)
+            fetched[page].set()
+            return make_page(page, total=3, size=1)
+
+        records = iter(Paginator(fetch_page))
+        next(records)
+        # Page 2 is requested before the consumer asks for the next record
+        self.assertTrue(fetched[2].wait(timeout=5))
+        self.assertEqual(list(records)[-1]["player"]["id"], 3000)
+        self.assertEqual(requested, [1, 2, 3])
+
+    def test_peak_memory_flat_in_page_count(self):
+        data_dir = helpers.TempDataDir(with_leagues=False)
+        serializer = JsonSerializer(data_dir.path, file_name="players", settings=None)
+
+        def peak(total):
+            gc.collect()
+            tracemalloc.start()
+            serializer.write(Paginator(lambda page: make_page(page, total=total, size=100)))
+            result = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return result
+
+        try:
+            few, many = peak(3), peak(30)
+            with open(serializer.serialized_file) as json_file:
+                self.assertEqual(len(json.load(json_file)), 30 * 100)
+        finally:
+            data_dir.cleanup()
+        self.assertLess(many, few * 2)
+
+
+class TestWorldPagination(unittest.TestCase):
+
+    def test_iter_players_fetches_and_caches_every_page(self):
+        def players(handler):
+            query = parse_qs(urlsplit(handler.path).query)
+            return 200, {}, make_page(int(query["page"][0]), total=4, size=3)
+
+        data_dir = helpers.TempDataDir(with_leagues=False)
+        try:
+            with helpers.MockApiServer(routes={"/players": players}) as server:
+                world = World(serializer="csv", data_dir=data_dir.path, transport=server.transport(),
+                              scheduler=helpers.unthrottled_scheduler())
+                world.serialize("players", world.iter_players(league_id=71, season=2023))
+                self.assertEqual(len(list(world.iter_players(league_id=71, season=2023))), 12)
+            self.assertEqual(len(server.requests), 4)
+            with open(os.path.join(data_dir.path, "players.tsv")) as tsv_file:
+                lines = tsv_file.read().splitlines()
+            self.assertEqual(len(lines), 13)
+            self.assertEqual(lines[1].split("\t"), ["1000", "Player 1-0", "25", "Brazil", "Mock FC", "Midfielder",
+                                                    "10", "3"])
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
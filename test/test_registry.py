@@ -0,0 +1,64 @@
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import helpers
+from football_client.api_client import World
+from football_client.registry import CacheRegistry
+
+
+class TestCacheRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir()
+        self.registry = CacheRegistry()
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def world(self, serializer="json"):
+        return World(serializer=serializer, data_dir=self.data_dir.path, registry=self.registry)
+
+    def test_parsed_payload_and_indexes_shared_between_worlds(self):
+        first, second = self.world(), self.world(serializer="csv")
+        self.assertEqual(first.get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(second.get_league(league_name="Serie A")["league"]["id"], 71)
+        self.assertIs(first.leagues, second.leagues)
+        self.assertEqual(self.registry.stats.as_dict(),
+                         {"reads": 1, "reads_avoided": 1, "index_builds": 1, "index_builds_avoided": 1})
+
+    def test_changed_file_read_again(self):
+        self.world().get_league(league_id=61)
+        payload = helpers.make_leagues_payload(70)
+        time.sleep(0.01)
+        self.world().caching["leagues"].write(payload)
+        self.assertEqual(self.world().get_league(league_id=70)["league"]["id"], 70)
+        self.assertEqual(self.registry.stats.reads, 2)
+
+    def test_missing_file_not_registered(self):
+        os.remove(os.path.join(self.data_dir.path, "leagues.json"))
+        self.assertEqual(self.registry.read(self.world().caching["leagues"]), {})
+        self.assertEqual(self.registry.read(self.world().caching["leagues"]), {})
+        self.assertEqual(self.registry.stats.reads, 2)
+
+
+class TestSharedWorld(unittest.TestCase):
+
+    def test_shared_instance_per_configuration(self):
+        data_dir = helpers.TempDataDir()
+        try:
+            world = World.shared(serializer="json", data_dir=data_dir.path)
+            self.assertIs(World.shared(serializer="json", data_dir=data_dir.path), world)
+            self.assertIsNot(World.shared(serializer="csv", data_dir=data_dir.path), world)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                names = list(executor.map(lambda league_id: world.get_league(league_id=league_id)["league"]["name"],
+                                          [4, 21, 61, 144, 71] * 20))
+            self.assertEqual(names[:5], ["Euro Championship", "Confederations Cup", "Ligue 1",
+                                         "Jupiler Pro League", "Serie A"])
+            self.assertEqual(len(set(names)), 5)
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import os
+import threading
+import time
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.errors import ApiError
+from football_client.response_cache import ResponseCache, DAY, FRESH, MISS, STALE, cache_key
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir()
+        self.now = time.time()
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def world(self, server, **cache_kwargs):
+        cache = ResponseCache(self.data_dir.path, clock=lambda: self.now, **cache_kwargs)
+        return World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                     scheduler=helpers.unthrottled_scheduler(), cache=cache, targeted=False)
+
+    def test_state_by_ttl(self):
+        cache = ResponseCache(self.data_dir.path, ttl={"leagues": 100}, clock=lambda: self.now)
+        serializer = World(serializer="json", data_dir=self.data_dir.path).caching["leagues"]
+        # Cache written before the metadata was tracked: file time counts as fetch time
+        self.assertEqual(cache.state("leagues", "leagues", serializer), FRESH)
+        self.assertEqual(cache.state("countries", "countries"), MISS)
+        self.now += 101
+        self.assertEqual(cache.state("leagues", "leagues", serializer), STALE)
+
+    def test_caches_sharing_a_directory_merge_metadata(self):
+        first = ResponseCache(self.data_dir.path, clock=lambda: self.now)
+        second = ResponseCache(self.data_dir.path, clock=lambda: self.now)
+        self.assertEqual(second.state("leagues", "leagues"), MISS)
+        first.mark_fetched("leagues", {"ETag": '"v1"'})
+        second.mark_fetched("countries")
+        self.assertEqual(second.state("leagues", "leagues"), FRESH)
+        self.assertEqual(second.conditional_headers("leagues"), {"If-None-Match": '"v1"'})
+        self.assertEqual(first.state("countries", "countries"), FRESH)
+
+    def test_stale_refreshed_once_by_workers_sharing_a_directory(self):
+        with helpers.MockApiServer(routes={"/leagues": helpers.load_mock_leagues()}) as server:
+            workers = [self.world(server) for _ in range(3)]
+            for world in workers:
+                world._load("leagues")
+            self.now += 2 * DAY
+            for world in workers:
+                world.refresh("leagues", background=True).join()
+        self.assertEqual(server.requests, ["/leagues"])
+        self.assertEqual(sum(world.cache.stats.refreshed for world in workers), 1)
+
+    def test_fresh_cache_served_locally(self):
+        with helpers.MockApiServer() as server:
+            world = self.world(server)
+            for _ in range(3):
+                self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(server.requests, [])
+        self.assertEqual(world.cache.stats.hits, 3)
+
+    def test_stale_served_while_revalidating_in_background(self):
+        payload = helpers.load_mock_leagues()
+        payload["response"][2]["league"]["name"] = "Ligue 1 Uber Eats"
+        with helpers.MockApiServer(routes={"/leagues": payload}) as server:
+            world = self.world(server)
+            self.now += 2 * DAY
+            # Stale data is returned without waiting for the API
+            self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+            self.assertEqual(world.cache.stats.stale, 1)
+            for thread in threading.enumerate():
+                if thread.name == "refresh-leagues":
+                    thread.join()
+            self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1 Uber Eats")
+        self.assertEqual(server.requests, ["/leagues"])
+        self.assertEqual(world.cache.stats.refreshed, 1)
+        self.assertEqual(world.cache.stats.hits, 1)
+        # New fetch time persisted for the next process
+        self.assertEqual(ResponseCache(self.data_dir.path, clock=lambda: self.now).state("leagues", "leagues"), FRESH)
+
+    def test_conditional_revalidation(self):
+        def leagues(handler):
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"'}, helpers.load_mock_leagues()
+
+        os.remove(os.path.join(self.data_dir.path, "leagues.json"))
+        with helpers.MockApiServer(routes={"/leagues": leagues}) as server:
+            world = self.world(server)
+            world.get_league(league_id=61)
+            self.now += 2 * DAY
+            self.assertEqual(world.refresh("leagues")["response"][2]["league"]["id"], 61)
+        self.assertEqual(world.cache.stats.misses, 1)
+        self.assertEqual(world.cache.stats.revalidated, 1)
+        self.assertEqual(world.cache.state("leagues", "leagues"), FRESH)
+
+    def test_deleted_cache_file_fetched_again(self):
+        def leagues(handler):
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"'}, helpers.load_mock_leagues()
+
+        os.remove(os.path.join(self.data_dir.path, "leagues.json"))
+        with helpers.MockApiServer(routes={"/leagues": leagues}) as server:
+            self.world(server).get_league(league_id=61)
+            os.remove(os.path.join(self.data_dir.path, "leagues.json"))
+            world = self.world(server)
+            self.assertEqual(len(world.all_leagues()), 5)
+        self.assertEqual(server.requests, ["/leagues", "/leagues"])
+        self.assertEqual(world.cache.stats.revalidated, 0)
+
+    def test_error_status_not_cached(self):
+        routes = {"/leagues": lambda handler: (500, {}, {"errors": [], "response": []}),
+                  "/countries": lambda handler: (502, {}, b"<html>Bad Gateway</html>")}
+        with helpers.MockApiServer(routes=routes) as server:
+            world = self.world(server)
+            with self.assertRaises(ApiError) as raised:
+                world.refresh("leagues")
+            self.assertEqual(raised.exception.errors, {"status": "HTTP 500"})
+            with self.assertRaises(ApiError):
+                world.get_country(country_code="FR")
+        self.assertEqual(world.cache.state("countries", "countries"), MISS)
+        self.assertEqual(world.cache.stats.refreshed, 0)
+
+
+class TestParameterizedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    @staticmethod
+    def teams(handler):
+        return 200, {}, {"errors": [], "get": "teams", "response": [{"team": {"id": len(handler.path)}}]}
+
+    def test_cache_key_normalization(self):
+        self.assertEqual(cache_key("teams", {"season": 2023, "league": 39, "page": None}),
+                         "teams?league=39&season=2023")
+        self.assertEqual(cache_key("leagues", {}), "leagues")
+
+    def test_only_missing_parameter_sets_fetched(self):
+        pairs = [(39, 2021), (39, 2022), (61, 2022)]
+        with helpers.MockApiServer(routes={"/teams": self.teams}) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler())
+            for league_id, season in pairs:
+                world.query("teams", league=league_id, season=season)
+            self.assertEqual(len(server.requests), 3)
+
+            # Next job run: a fresh World over the same data directory, one new pair
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler())
+            for league_id, season in pairs + [(71, 2023)]:
+                result = world.query("teams", season=season, league=league_id)
+                self.assertEqual(result["get"], "teams")
+        self.assertEqual(server.requests[3:], ["/teams?league=71&season=2023"])
+        self.assertEqual(world.cache.stats.hits, 3)
+        self.assertEqual(world.cache.stats.misses, 1)
+        shard_dir, file_name = world.cache.shard("teams?league=39&season=2021")
+        self.assertTrue(os.path.isfile(os.path.join(shard_dir, f"{file_name}.json")))
+        self.assertTrue(os.path.isfile(os.path.join(shard_dir, f"{file_name}.meta.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
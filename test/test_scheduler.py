@@ -0,0 +1,131 @@
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.errors import ApiError, QuotaExceededError, RateLimitError
+from football_client.scheduler import RequestScheduler, TokenBucket
+from football_client.transport import Response
+
+
+class FakeClock:
+    """
+    Manual time source: sleeping advances the clock
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            bucket.acquire()
+        # 3 requests in the burst, then one every half a second
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+
+    def test_server_remaining_caps_tokens(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=10, clock=clock, sleep=clock.sleep)
+        bucket.reconfigure(tokens=0)
+        self.assertEqual(bucket.acquire(), 1.0)
+
+
+class TestRequestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def scheduler(self, **kwargs):
+        return RequestScheduler(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_learns_quota_from_headers(self):
+        scheduler = self.scheduler(requests_per_minute=10)
+        headers = {"X-RateLimit-Limit": "300", "X-RateLimit-Remaining": "299",
+                   "x-ratelimit-requests-limit": "7500", "x-ratelimit-requests-remaining": "7000"}
+        scheduler.execute(lambda: Response(200, headers, {"errors": []}))
+        self.assertEqual(scheduler.bucket.capacity, 300)
+        self.assertEqual(scheduler.bucket.rate, 5)
+        self.assertEqual(scheduler.daily_remaining, 7000)
+
+    def test_retries_throttled_with_backoff(self):
+        responses = [Response(429, {}, None),
+                     Response(200, {}, {"errors": {"rateLimit": "Too many requests"}}),
+                     Response(200, {}, {"errors": [], "response": []})]
+        scheduler = self.scheduler(requests_per_minute=600, backoff=1.0)
+        response = scheduler.execute(lambda: responses.pop(0))
+        self.assertEqual(response.data["response"], [])
+        self.assertEqual(scheduler.retries, 2)
+        self.assertTrue(0.5 <= self.clock.sleeps[0] <= 1.0 and 1.0 <= self.clock.sleeps[1] <= 2.0)
+
+    def test_retry_after_header_wins(self):
+        responses = [Response(429, {"Retry-After": "7"}, None), Response(200, {}, {"errors": []})]
+        scheduler = self.scheduler(requests_per_minute=600)
+        scheduler.execute(lambda: responses.pop(0))
+        self.assertEqual(self.clock.sleeps, [7.0])
+
+    def test_gives_up_after_max_retries(self):
+        scheduler = self.scheduler(requests_per_minute=600, max_retries=2)
+        with self.assertRaises(RateLimitError):
+            scheduler.execute(lambda: Response(429, {}, None))
+        self.assertEqual(scheduler.requests, 3)
+
+    def test_daily_quota_exhausted(self):
+        scheduler = self.scheduler()
+        scheduler.execute(lambda: Response(200, {"x-ratelimit-requests-remaining": "0"}, {"errors": []}))
+        with self.assertRaises(QuotaExceededError):
+            scheduler.execute(lambda: Response(200, {}, {"errors": []}))
+
+    def test_daily_quota_renewed_next_day(self):
+        now = [3 * RequestScheduler.DAY + 100.0]
+        scheduler = self.scheduler(wall_clock=lambda: now[0])
+        scheduler.execute(lambda: Response(200, {"x-ratelimit-requests-remaining": "0"}, {"errors": []}))
+        now[0] += RequestScheduler.DAY - 200
+        with self.assertRaises(QuotaExceededError):
+            scheduler.execute(lambda: Response(200, {}, {"errors": []}))
+        # Past midnight UTC the next request goes through
+        now[0] += 200
+        response = scheduler.execute(lambda: Response(200, {"x-ratelimit-requests-remaining": "7499"}, {"errors": []}))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(scheduler.daily_remaining, 7499)
+        self.assertEqual(scheduler.requests, 2)
+
+
+class TestWorldScheduling(unittest.TestCase):
+
+    def test_world_retries_throttled_request(self):
+        calls = []
+
+        def leagues(handler):
+            calls.append(handler.path)
+            if len(calls) == 1:
+                return 429, {"Retry-After": "0"}, {"errors": {"rateLimit": "Too many requests"}}
+            return 200, {"X-RateLimit-Limit": "600", "X-RateLimit-Remaining": "598"}, helpers.load_mock_leagues()
+
+        data_dir = helpers.TempDataDir(with_leagues=False)
+        try:
+            with helpers.MockApiServer(routes={"/leagues": leagues, "/bad": lambda _: (200, {}, {"errors": ["bad"]})}) \
+                    as server:
+                world = World(serializer="json", data_dir=data_dir.path, transport=server.transport(),
+                              scheduler=RequestScheduler(requests_per_minute=600))
+                self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+                self.assertEqual(len(calls), 2)
+                self.assertEqual(world.scheduler.bucket.capacity, 600)
+                with self.assertRaises(ApiError):
+                    world._fetch("bad")
+                world.close()
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import helpers
+from football_client.api_client import World
+from football_client.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_callers_share_result_and_error(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(5)
+            raise ValueError("upstream failed")
+
+        def call(_):
+            try:
+                return flight.do("key", work)
+            except ValueError as e:
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(call, i) for i in range(8)]
+            while flight.shared < 7:
+                threading.Event().wait(0.001)
+            release.set()
+        self.assertEqual([future.result() for future in futures], ["upstream failed"] * 8)
+        self.assertEqual(len(calls), 1)
+        # Nothing in flight anymore, the next call runs again
+        self.assertEqual(flight.do("key", lambda: 42), 42)
+
+
+class TestCoalescedRequests(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_cold_world_under_contention(self):
+        teams = {"errors": [], "response": [{"team": {"id": 33, "name": "Manchester United"}}]}
+        routes = {"/leagues": helpers.load_mock_leagues(), "/teams": teams}
+        with helpers.MockApiServer(routes=routes, latency=0.2) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), targeted=False)
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                leagues = list(executor.map(lambda i: world.get_league(league_id=61)["league"]["name"], range(32)))
+                team_lists = list(executor.map(lambda i: world.query("teams", league=39, season=2023), range(32)))
+        self.assertEqual(leagues, ["Ligue 1"] * 32)
+        self.assertEqual(team_lists, [teams] * 32)
+        self.assertEqual(sorted(server.requests), ["/leagues", "/teams?league=39&season=2023"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import unittest
+import helpers
+from football_client.api_client import World
+from football_client.serializer_factory import SerializerFactory
+from football_client.sqlite_serializer import LeaguesSqliteSerializer, SqliteSerializer
+
+COUNTRIES = {"errors": [], "response": [{"name": "England", "code": "GB", "flag": None},
+                                        {"name": "World", "code": None, "flag": None, "region": "FIFA"}]}
+
+
+class TestSqliteSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def test_roundtrip_in_batches(self):
+        serializer = SerializerFactory(self.data_dir.path).create_serializer(serializer_type="sqlite",
+                                                                             entity="leagues")
+        self.assertIsInstance(serializer, LeaguesSqliteSerializer)
+        serializer.BATCH_SIZE = 7
+        self.assertEqual(serializer.read(), {})
+        payload = helpers.make_leagues_payload(50)
+        serializer.write(payload)
+        self.assertEqual(serializer.read(), payload)
+        seasons = sum(len(lg["seasons"]) for lg in payload["response"])
+        self.assertEqual(serializer.connect().execute("SELECT count(*) FROM seasons").fetchone()[0], seasons)
+        self.assertEqual(serializer.connect().execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        # Rewrite replaces the data
+        serializer.write(helpers.make_leagues_payload(3))
+        self.assertEqual(len(serializer.read()["response"]), 3)
+        self.assertEqual(serializer.find(league_id=40), {})
+
+    def test_countries_and_iterables(self):
+        factory = SerializerFactory(self.data_dir.path)
+        countries = factory.create_serializer(serializer_type="sqlite", entity="countries")
+        countries.write(COUNTRIES)
+        self.assertEqual(countries.read(), COUNTRIES)
+        self.assertEqual(countries.find(country_code="GB")["name"], "England")
+        self.assertEqual(countries.find(country_name="World"), COUNTRIES["response"][1])
+        players = SqliteSerializer(self.data_dir.path, file_name="players")
+        players.write({"id": i} for i in range(3))
+        self.assertEqual(players.read(), [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_indexed_lookups_and_queries(self):
+        serializer = LeaguesSqliteSerializer(self.data_dir.path)
+        self.assertIsNone(serializer.find(league_id=61))
+        self.assertIsNone(serializer.select(season=2023))
+        serializer.write(helpers.load_mock_leagues())
+        self.assertEqual(serializer.find(league_name="Serie A")["league"]["id"], 71)
+        self.assertEqual(serializer.find(league_id=71, league_name="Ligue 1")["league"]["id"], 61)
+        self.assertEqual([lg["league"]["id"] for lg in serializer.select(country="World", league_type="Cup")], [4, 21])
+        self.assertEqual([lg["league"]["id"] for lg in serializer.select(country="World", season=2016)], [4])
+        self.assertEqual([lg["league"]["id"] for lg in serializer.select(country="FR", season=2023)], [61])
+        plan = " ".join(row[-1] for row in serializer.connect().execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM leagues WHERE id = 61"))
+        self.assertIn("USING INDEX leagues_id", plan)
+
+    def test_world_sqlite_cache(self):
+        routes = {"/leagues": helpers.load_mock_leagues(), "/countries": COUNTRIES}
+        with helpers.MockApiServer(routes=routes) as server:
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format="sqlite", targeted=False)
+            expected = world.query_leagues(country="World", league_type="Cup", season=2017)
+            world.get_country(country_code="GB")
+            world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                          scheduler=helpers.unthrottled_scheduler(), cache_format="sqlite", targeted=False)
+            self.assertEqual(world.query_leagues(country="World", league_type="Cup", season=2017), expected)
+            self.assertEqual(world.get_league(league_id=144)["country"]["name"], "Belgium")
+            self.assertEqual(world.get_country(country_name="World")["code"], None)
+            self.assertEqual(world.leagues, {})
+        self.assertEqual([lg["league"]["id"] for lg in expected], [21])
+        self.assertEqual(server.requests, ["/leagues", "/countries"])
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir.path, "leagues.sqlite")))
+
+    def test_parameterized_responses_share_a_table(self):
+        leagues = helpers.load_mock_leagues()
+
+        def by_id(handler):
+            league_id = int(handler.path.rsplit("=", 1)[1])
+            response = [lg for lg in leagues["response"] if lg["league"]["id"] == league_id]
+            return 200, {}, dict(leagues, response=response)
+
+        with helpers.MockApiServer(routes={"/leagues": by_id}) as server:
+            for _ in range(2):
+                world = World(serializer="json", data_dir=self.data_dir.path, transport=server.transport(),
+                              scheduler=helpers.unthrottled_scheduler(), cache_format="sqlite")
+                self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+                self.assertEqual(world.get_league(league_id=71)["league"]["name"], "Serie A")
+        self.assertEqual(server.requests, ["/leagues?id=61", "/leagues?id=71"])
+        databases = [os.path.relpath(os.path.join(root, name), self.data_dir.path)
+                     for root, _, names in os.walk(self.data_dir.path) for name in names if name.endswith(".sqlite")]
+        self.assertEqual(databases, ["leagues.sqlite"])
+        connection = world.caching["leagues"].connect()
+        self.assertEqual([key for key, in connection.execute("SELECT key FROM responses ORDER BY key")],
+                         ["leagues?id=61", "leagues?id=71"])
+        self.assertFalse(world.caching["leagues"].exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import helpers
+
+# Modules that the cache-only path must not pay for at start-up
+DEFERRED_MODULES = ["football_client.csv_serializer", "football_client.binary_serializer",
+                    "football_client.transport", "http.client", "concurrent.futures"]
+
+CACHE_ONLY_SCRIPT = """
+import sys
+from football_client.api_client import World
+world = World(serializer="json", data_dir=sys.argv[1])
+print(world.get_league(league_id=61)["league"]["name"])
+"""
+
+
+class TestStartup(unittest.TestCase):
+
+    def setUp(self):
+        self.home = tempfile.mkdtemp(prefix="football_client_home_")
+        self.env = {key: value for key, value in os.environ.items()
+                    if key not in ("FOOTBALL_API_KEY", "FOOTBALL_DATA_DIR")}
+        self.env.update(HOME=self.home, PYTHONPATH=os.pathsep.join(sys.path))
+
+    def tearDown(self):
+        os.rmdir(self.home)
+
+    def run_python(self, *args):
+        return subprocess.run([sys.executable, *args], env=self.env, check=True, capture_output=True, text=True)
+
+    def test_import_has_no_side_effects_and_defers_serializers(self):
+        result = self.run_python("-c", "import sys, cli.football_cli; print('\\n'.join(sys.modules))")
+        imported = set(result.stdout.splitlines())
+        self.assertIn("cli.football_cli", imported)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, imported)
+        # No API key needed and nothing created in the home directory
+        self.assertEqual(os.listdir(self.home), [])
+
+    def test_cache_only_lookup_without_api_key(self):
+        data_dir = helpers.TempDataDir()
+        try:
+            result = self.run_python("-c", CACHE_ONLY_SCRIPT, data_dir.path)
+        finally:
+            data_dir.cleanup()
+        self.assertEqual(result.stdout.splitlines()[-1], "Ligue 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
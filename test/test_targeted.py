@@ -0,0 +1,124 @@
+import copy
+import os
+import unittest
+from urllib.parse import parse_qs, urlsplit
+import helpers
+from football_client.api_client import World
+
+COUNTRIES = {"errors": [], "response": [{"name": "England", "code": "GB", "flag": None},
+                                        {"name": "Scotland", "code": "GB", "flag": None},
+                                        {"name": "World", "code": None, "flag": None}]}
+
+
+def filtered(payload, match):
+    """
+    :return: route serving the records of the payload matching the query parameters
+    """
+    def route(handler):
+        params = {name: values[0] for name, values in parse_qs(urlsplit(handler.path).query).items()}
+        response = [record for record in payload["response"] if match(record, params)]
+        return 200, {}, dict(payload, results=len(response), response=response)
+    return route
+
+
+def match_league(lg, params):
+    return (str(lg["league"]["id"]) == params.get("id", str(lg["league"]["id"]))
+            and lg["league"]["name"] == params.get("name", lg["league"]["name"])
+            and lg["country"]["name"] == params.get("country", lg["country"]["name"])
+            and lg["country"]["code"] == params.get("code", lg["country"]["code"])
+            and lg["league"]["type"].lower() == params.get("type", lg["league"]["type"].lower())
+            and ("season" not in params or any(str(s["year"]) == params["season"] for s in lg["seasons"])))
+
+
+def match_country(country, params):
+    return (country["name"] == params.get("name", country["name"])
+            and country["code"] == params.get("code", country["code"]))
+
+
+class TestTargetedLookups(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = helpers.TempDataDir(with_leagues=False)
+        self.leagues = helpers.load_mock_leagues()
+        self.server = helpers.MockApiServer(routes={"/leagues": filtered(self.leagues, match_league),
+                                                    "/countries": filtered(COUNTRIES, match_country)})
+        self.server.__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.data_dir.cleanup()
+
+    def world(self, **kwargs):
+        return World(serializer="json", data_dir=self.data_dir.path, transport=self.server.transport(),
+                     scheduler=helpers.unthrottled_scheduler(), **kwargs)
+
+    def test_cold_league_lookup(self):
+        world = self.world()
+        self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(world.get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(world.get_league(league_id=100500), {})
+        # Filtered responses are cached, another process doesn't request them again
+        self.assertEqual(self.world(models=True).get_league(league_id=61).country.name, "France")
+        self.assertEqual(self.server.requests, ["/leagues?id=61", "/leagues?id=100500"])
+        self.assertFalse(os.path.exists(os.path.join(self.data_dir.path, "leagues.json")))
+        self.assertEqual(world.leagues, {})
+
+    def test_merged_country_query_answers_lookups(self):
+        world = self.world()
+        cups = world.query_leagues(country="World", league_type="Cup")
+        self.assertEqual([lg["league"]["id"] for lg in cups], [4, 21])
+        self.assertEqual(world.get_league(league_id=21)["league"]["id"], 21)
+        self.assertEqual(world.query_leagues(country="World", league_type="Cup"), cups)
+        self.assertEqual(self.server.requests, ["/leagues?country=World&type=cup"])
+
+    def test_cold_country_lookup(self):
+        world = self.world()
+        self.assertEqual(world.get_country(country_code="GB")["name"], "England")
+        # Merged from the GB response, country names are unique
+        self.assertEqual(world.get_country(country_name="Scotland")["code"], "GB")
+        self.assertEqual(world.get_country(country_name="World")["code"], None)
+        self.assertEqual(self.server.requests, ["/countries?code=GB", "/countries?name=World"])
+
+    def test_country_without_code_matches_only_its_name(self):
+        world = self.world()
+        self.assertEqual(world.get_country(country_name="World")["name"], "World")
+        self.assertEqual(world.get_country(country_name="England")["name"], "England")
+        self.assertEqual(world.get_country(country_name="Spain"), {})
+        self.assertEqual(self.server.requests, ["/countries?name=World", "/countries?name=England",
+                                                "/countries?name=Spain"])
+
+    def test_complete_cache_wins(self):
+        world = self.world()
+        self.assertEqual(len(world.all_leagues()), len(self.leagues["response"]))
+        self.assertEqual(self.world().get_league(league_id=61)["league"]["name"], "Ligue 1")
+        self.assertEqual(self.world(targeted=False).get_league(league_name="Serie A")["league"]["id"], 71)
+        self.assertEqual(self.server.requests, ["/leagues"])
+
+    def test_country_names_and_codes(self):
+        usa = copy.deepcopy(self.leagues["response"][2])
+        usa["league"].update(id=253, name="Major League Soccer")
+        usa["country"].update(name="USA", code="US")
+        self.leagues["response"].append(usa)
+        world = self.world()
+        self.assertEqual([lg["league"]["id"] for lg in world.query_leagues(country="USA")], [253])
+        self.assertEqual([lg["league"]["id"] for lg in world.query_leagues(country="FR")], [61])
+        self.assertEqual(self.server.requests, ["/leagues?country=USA", "/leagues?code=FR"])
+
+    def test_unset_parameters_share_the_bare_entry(self):
+        self.world().get_league()
+        self.assertEqual(len(self.world().all_leagues()), len(self.leagues["response"]))
+        self.server.routes["/teams"] = {"errors": [], "response": [{"team": {"id": 33}}]}
+        self.world().query("teams", page=None)
+        self.assertEqual(self.world().query("teams")["response"], [{"team": {"id": 33}}])
+        self.assertEqual(self.server.requests, ["/leagues", "/teams"])
+
+    def test_shared_payloads_are_not_modified(self):
+        world = self.world()
+        world.query_leagues(country="World")
+        cached = copy.deepcopy(world.query("leagues", country="World"))
+        world.get_league(league_id=61)
+        self.assertEqual(world.query("leagues", country="World"), cached)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import http.client
+import json
+import socket
+import unittest
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+import helpers
+from football_client.api_client import World
+from football_client.transport import ConnectionPool
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def test_sequential_requests_reuse_one_connection(self):
+        with helpers.MockApiServer(routes={"/status": {"response": "ok"}}) as server:
+            with server.transport(pool_size=4) as pool:
+                for _ in range(100):
+                    self.assertEqual(pool.request("GET", "/status").data, {"response": "ok"})
+            self.assertEqual(server.connections, 1)
+            self.assertEqual(pool.connections_created, 1)
+
+    def test_concurrent_requests_bounded_by_pool_size(self):
+        with helpers.MockApiServer(routes={"/status": {"response": "ok"}}, latency=0.005) as server:
+            with server.transport(pool_size=3) as pool:
+                with ThreadPoolExecutor(max_workers=10) as executor:
+                    results = list(executor.map(lambda _: pool.request("GET", "/status").status, range(60)))
+            self.assertEqual(results, [200] * 60)
+            self.assertLessEqual(server.connections, 3)
+            self.assertEqual(pool.requests_sent, 60)
+            self.assertEqual(pool.bytes_received, 60 * len(json.dumps({"response": "ok"})))
+
+    def test_waiters_reconnect_after_server_closes_connections(self):
+        route = {"/status": lambda handler: (200, {"Connection": "close"}, {"response": "ok"})}
+        with helpers.MockApiServer(routes=route, latency=0.01) as server:
+            with server.transport(pool_size=1) as pool:
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    futures = [executor.submit(pool.request, "GET", "/status") for _ in range(6)]
+                    results = [future.result(timeout=10).status for future in futures]
+            self.assertEqual(results, [200] * 6)
+            self.assertEqual(pool.connections_created, 6)
+
+    def test_unpooled_connections_handshake_per_request(self):
+        # Baseline: the previous transport opened a new connection per request
+        with helpers.MockApiServer(routes={"/status": {"response": "ok"}}) as server:
+            for _ in range(10):
+                conn = http.client.HTTPConnection("127.0.0.1", server.port)
+                conn.request("GET", "/status")
+                conn.getresponse().read()
+                conn.close()
+            self.assertEqual(server.connections, 10)
+
+    def test_reconnects_after_server_drops_idle_connection(self):
+        with helpers.MockApiServer(routes={"/status": {"response": "ok"}}) as server:
+            with server.transport(pool_size=1) as pool:
+                pool.request("GET", "/status")
+                # Simulate keep-alive timeout on the server side
+                pool._idle.queue[0].sock.shutdown(socket.SHUT_RDWR)
+                self.assertEqual(pool.request("GET", "/status").data, {"response": "ok"})
+
+
+class TestCompressedResponses(unittest.TestCase):
+
+    def setUp(self):
+        self.leagues = helpers.load_mock_leagues()
+        self.size = len(json.dumps(self.leagues).encode())
+
+    def test_gzip_negotiated_and_decoded(self):
+        with helpers.MockApiServer(routes={"/leagues": self.leagues}, compress=True) as server:
+            with server.transport(pool_size=1) as pool:
+                for _ in range(3):
+                    response = pool.request("GET", "/leagues")
+                    self.assertEqual(response.data, self.leagues)
+                    self.assertEqual(response.headers["Content-Encoding"], "gzip")
+            self.assertEqual(server.connections, 1)
+        self.assertLess(pool.bytes_received, 3 * self.size // 4)
+
+    def test_deflate(self):
+        def deflated(wbits):
+            def leagues(handler):
+                self.assertIn("deflate", handler.headers["Accept-Encoding"])
+                compressor = zlib.compressobj(wbits=wbits)
+                body = compressor.compress(json.dumps(self.leagues).encode()) + compressor.flush()
+                return 200, {"Content-Encoding": "deflate"}, body
+            return leagues
+
+        # zlib format as specified, and raw deflate some servers send, read at once and byte by byte
+        routes = {"/zlib": deflated(zlib.MAX_WBITS), "/raw": deflated(-zlib.MAX_WBITS)}
+        with helpers.MockApiServer(routes=routes) as server:
+            for path in ("/zlib", "/raw"):
+                for chunk_size in (ConnectionPool.CHUNK_SIZE, 1):
+                    with self.subTest(path=path, chunk_size=chunk_size), server.transport() as pool:
+                        pool.CHUNK_SIZE = chunk_size
+                        self.assertEqual(pool.request("GET", path).data, self.leagues)
+
+    def test_identity_without_compress(self):
+        with helpers.MockApiServer(routes={"/leagues": self.leagues}, compress=True) as server:
+            with ConnectionPool("127.0.0.1", server.port, secure=False, compress=False) as pool:
+                response = pool.request("GET", "/leagues")
+        self.assertIsNone(response.headers["Content-Encoding"])
+        self.assertEqual(response.data, self.leagues)
+        self.assertEqual(pool.bytes_received, self.size)
+
+
+class TestWorldTransport(unittest.TestCase):
+
+    def test_world_requests_share_pooled_connection(self):
+        routes = {"/leagues": helpers.load_mock_leagues(), "/countries": {"errors": [], "response": []}}
+        data_dir = helpers.TempDataDir(with_leagues=False)
+        try:
+            with helpers.MockApiServer(routes=routes) as server:
+                world = World(serializer="json", data_dir=data_dir.path, transport=server.transport(),
+                              scheduler=helpers.unthrottled_scheduler())
+                for _ in range(5):
+                    world._request("leagues")
+                    world._request("countries")
+                world.close()
+                self.assertEqual(len(server.requests), 10)
+                self.assertEqual(server.connections, 1)
+        finally:
+            data_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()